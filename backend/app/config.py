@@ -2,6 +2,7 @@
 
 from typing import Union
 from pydantic import field_validator
+from sqlalchemy.engine import make_url
 from pydantic_settings import BaseSettings
 
 
@@ -14,12 +15,28 @@ class Settings(BaseSettings):
     DB_USER: str = "root"
     DB_PASSWORD: str = ""
     DB_NAME: str = "studio"
+    DATABASE_URL: str = ""  # Full SQLAlchemy URL; overrides DB_* (e.g. sqlite:///./studio.db)
+    
+    # SQLite tuning (only used when DATABASE_URL is a sqlite URL)
+    SQLITE_POOL_SIZE: int = 8  # Persistent connections reused across requests
+    SQLITE_MMAP_SIZE: int = 268435456  # Bytes of the database file memory-mapped (256 MB)
+    SQLITE_CACHE_SIZE_KB: int = 65536  # Page cache per connection (64 MB)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # Wait this long for the write lock before failing
+    
+    # Schema migrations (see app/db_migrate.py)
+    DB_AUTO_MIGRATE: bool = True  # Migrate at startup if behind; False: refuse to start instead
+    DB_MIGRATION_LOCK_TIMEOUT: int = 300  # Seconds to wait for another process's migration
     
     # Security settings
     SECRET_KEY: str = "your-secret-key-change-in-production-please"
     SESSION_SECRET_KEY: str = "your-session-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ADMIN_PRINCIPAL_TTL: float = 30.0  # Seconds an admin's role/status snapshot is cached (0 disables)
+    ADMIN_PRINCIPAL_MAX_ENTRIES: int = 1024
+    BCRYPT_ROUNDS: int = 12  # Cost factor; existing hashes are upgraded on the next login
+    PASSWORD_HASH_WORKERS: int = 2  # Threads per worker running bcrypt off the event loop
+    PASSWORD_HASH_MAX_PENDING: int = 8  # Queued + running hashes before answering 429
     
     # API settings
     API_PREFIX: str = "/api"
@@ -49,13 +66,89 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""  # Gmail App Password
     SMTP_FROM_EMAIL: str = ""  # From email address (usually same as SMTP_USER)
     SMTP_FROM_NAME: str = "AI-Tracks Studio"
+    SMTP_STARTTLS: bool = True  # Disable only for a local relay without TLS (development, tests)
     FEEDBACK_TO_EMAIL: str = ""  # Email address to receive feedback
-    
+    SMTP_POOL_SIZE: int = 2  # Idle authenticated SMTP connections kept open
+    SMTP_NOOP_AFTER: float = 30.0  # Check idle connections with NOOP after this many seconds
+    EMAIL_OUTBOX_POLL_INTERVAL: float = 10.0  # Seconds between outbox polls
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20  # Messages claimed per poll
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 6  # Attempts before a message is marked failed
+    EMAIL_OUTBOX_BACKOFF_SECONDS: float = 30.0  # First retry delay, doubled each attempt
+    EMAIL_OUTBOX_LOCK_TIMEOUT: float = 300.0  # Seconds before a stuck claim is retried
+    FEEDBACK_DIGEST_ENABLED: bool = False  # Combine feedback notifications into digest emails
+    FEEDBACK_DIGEST_WINDOW_SECONDS: float = 300.0  # Send a digest once the oldest queued feedback is this old
+    FEEDBACK_DIGEST_MAX_ITEMS: int = 50  # ...or as soon as this many feedback notifications are queued
+
+    # View counter settings
+    VIEW_COUNTER_FLUSH_INTERVAL: float = 5.0  # Seconds between batched view count flushes
+    VIEW_COUNTER_MAX_PENDING: int = 1000  # Buffered rows that trigger an early flush
+
+    # Response cache settings (public read endpoints)
+    RESPONSE_CACHE_TTL: float = 60.0  # Seconds a cached response stays valid
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512  # LRU capacity
+
+    # Redis (optional, shared state across workers/hosts)
+    REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_SOCKET_TIMEOUT: float = 1.0  # Seconds to connect / wait for a reply before failing
+
+    # Cache invalidation bus settings
+    INVALIDATION_BUS_BACKEND: str = "local"  # local, unix (single host), redis
+    INVALIDATION_BUS_SOCKET_DIR: str = "/tmp/studio-invalidation"
+    INVALIDATION_BUS_CHANNEL: str = "studio:invalidate"
+
+    # Captcha settings
+    CAPTCHA_STORE: str = "memory"  # memory (single worker), database, redis
+    CAPTCHA_TTL_SECONDS: int = 600
+    CAPTCHA_MAX_LIVE: int = 10000  # Memory store cap; oldest captchas are evicted first
+    CAPTCHA_POOL_SIZE: int = 50  # Pre-rendered captcha images per worker (0 disables)
+    CAPTCHA_POOL_LOW_WATER: int = 10  # Refill when the pool drops below this
+    CAPTCHA_FONT_PATH: str = ""  # TrueType font file; falls back to Arial, DejaVu Sans, Pillow default
+    CAPTCHA_INLINE_IMAGE: bool = False  # Also return image_base64 data URLs (legacy frontends)
+
+    # Login throttling (checked before the user lookup and bcrypt)
+    LOGIN_THROTTLE_BACKEND: str = "memory"  # memory (per worker), redis
+    LOGIN_THROTTLE_IP_LIMIT: int = 20  # Attempts per client IP per window (0 disables)
+    LOGIN_THROTTLE_IP_WINDOW: float = 300.0
+    LOGIN_THROTTLE_ACCOUNT_LIMIT: int = 5  # Failed attempts per account per window (0 disables)
+    LOGIN_THROTTLE_ACCOUNT_WINDOW: float = 900.0
+    LOGIN_THROTTLE_MAX_KEYS: int = 10000  # Memory backend cap; least recently used keys are evicted
+
+    # Image uploads (admin)
+    MAX_UPLOAD_SIZE: int = 10  # MB; streaming is aborted past this size
+    MAX_UPLOAD_PIXELS: int = 25_000_000  # Checked from the image header, before decoding
+
+    # Rate limiting (token bucket per client IP, applied before routing)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # memory (per worker), redis
+    RATE_LIMIT_MAX_KEYS: int = 10000  # Memory backend cap; least recently used buckets are evicted
+    # {"METHOD /path/pattern": "N/second|minute|hour|day"}; JSON in .env
+    RATE_LIMIT_POLICIES: dict[str, str] = {
+        "POST /api/feedback": "5/minute",
+        "GET /api/feedback/captcha": "20/minute",
+        "POST /api/*/*/view": "60/minute",
+    }
+
     @property
     def database_url(self) -> str:
         """Construct the database URL."""
+        if self.DATABASE_URL:
+            return self.DATABASE_URL
         return f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
     
+    @property
+    def async_database_url(self) -> str:
+        """Construct the database URL for the async engine (same database, async driver)."""
+        url = make_url(self.database_url)
+        drivers = {"mysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
+        if url.get_backend_name() in drivers and not url.get_dialect().is_async:
+            url = url.set(drivername=drivers[url.get_backend_name()])
+        return url.render_as_string(hide_password=False)
+    
+    @property
+    def is_sqlite(self) -> bool:
+        """Whether the configured database is SQLite."""
+        return make_url(self.database_url).get_backend_name() == "sqlite"
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -3,6 +3,7 @@
 from app.core.security import (
     verify_password,
     get_password_hash,
+    password_needs_rehash,
     create_access_token,
     decode_access_token,
 )
@@ -10,6 +11,7 @@ from app.core.security import (
 __all__ = [
     "verify_password",
     "get_password_hash",
+    "password_needs_rehash",
     "create_access_token",
     "decode_access_token",
 ]
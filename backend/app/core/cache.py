@@ -0,0 +1,148 @@
+"""In-process response cache for public read endpoints."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable
+
+from app.config import settings
+from app.core.invalidation import ALL_NAMESPACES
+
+CacheKey = tuple[str, str, tuple[tuple[str, Hashable], ...]]
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache holding serialized JSON response bodies.
+
+    Entries are grouped by namespace (``projects``, ``news``, ``about``,
+    ``banners``) so admin writes can drop everything derived from the
+    table they changed.
+    """
+
+    def __init__(
+        self,
+        ttl: float = settings.RESPONSE_CACHE_TTL,
+        max_entries: int = settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            max_entries: Maximum number of cached responses
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(namespace: str, route: str, **params: Hashable) -> CacheKey:
+        """
+        Build a cache key from route and query parameters.
+
+        Args:
+            namespace: Invalidation namespace (usually the table)
+            route: Route name within the namespace
+            **params: Query parameters affecting the response
+
+        Returns:
+            Hashable cache key
+        """
+        return (namespace, route, tuple(sorted(params.items())))
+
+    def get(self, key: CacheKey) -> bytes | None:
+        """
+        Get a cached response body.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached bytes or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def set(self, key: CacheKey, body: bytes) -> None:
+        """
+        Store a response body, evicting the least recently used entries.
+
+        Args:
+            key: Cache key
+            body: Serialized JSON body
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: CacheKey, factory: Callable[[], bytes]) -> bytes:
+        """
+        Get a cached body or build and store it.
+
+        Args:
+            key: Cache key
+            factory: Callable producing the serialized body on a miss
+
+        Returns:
+            Serialized JSON body
+        """
+        body = self.get(key)
+        if body is None:
+            body = factory()
+            self.set(key, body)
+        return body
+
+    async def aget_or_set(self, key: CacheKey, factory: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Async variant of ``get_or_set`` for ``async def`` routes.
+
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the serialized body on a miss
+
+        Returns:
+            Serialized JSON body
+        """
+        body = self.get(key)
+        if body is None:
+            body = await factory()
+            self.set(key, body)
+        return body
+
+    def invalidate(self, namespace: str) -> None:
+        """
+        Drop every entry in a namespace.
+
+        Args:
+            namespace: Namespace to invalidate (``*`` drops everything)
+        """
+        if namespace == ALL_NAMESPACES:
+            self.clear()
+            return
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == namespace]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global response cache instance
+response_cache = ResponseCache()
@@ -1,84 +1,90 @@
-"""Simple in-memory image captcha utilities."""
+"""Image captcha utilities backed by a shared captcha store."""
 
 from __future__ import annotations
 
 import base64
 import io
+import logging
 import random
-import string
+import threading
 import uuid
-from dataclasses import dataclass
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict
+from functools import lru_cache
 
 from PIL import Image, ImageDraw, ImageFont
 
+from app.config import settings
+from app.core.captcha_store import CaptchaItem, get_captcha_store
 
-@dataclass
-class CaptchaItem:
-    """Captcha item with answer and expiration."""
+logger = logging.getLogger(__name__)
 
-    answer: str
-    expires_at: datetime
-    image_base64: str
-
-
-_STORE: Dict[str, CaptchaItem] = {}
-_TTL = timedelta(minutes=10)
+_TTL = timedelta(seconds=settings.CAPTCHA_TTL_SECONDS)
 _CAPTCHA_LEN = 6
 _WIDTH, _HEIGHT = 150, 50
 
 
-def _cleanup() -> None:
-    """Remove expired captchas."""
-    now = datetime.utcnow()
-    expired_keys = [key for key, item in _STORE.items() if item.expires_at < now]
-    for key in expired_keys:
-        _STORE.pop(key, None)
+_CHARS = "ABCDEFGHIJKLMNPQRSTUVWXYZ123456789"
+_FONT_SIZE = int(_HEIGHT * 0.65)  # scale with height
+_NOISE_DOTS = 20
 
 
 def _random_text(length: int = _CAPTCHA_LEN) -> str:
     # Uppercase letters (exclude O) and digits (exclude 0)
-    chars = "ABCDEFGHIJKLMNPQRSTUVWXYZ123456789"
-    return "".join(random.choices(chars, k=length))
+    return "".join(random.choices(_CHARS, k=length))
 
 
-def _generate_image(text: str) -> str:
-    """Generate captcha image and return base64 data URL."""
-    # Base image
-    image = Image.new("RGB", (_WIDTH, _HEIGHT), (255, 255, 255))
-    draw = ImageDraw.Draw(image)
+@lru_cache(maxsize=1)
+def _load_font() -> ImageFont.FreeTypeFont | ImageFont.ImageFont | None:
+    """
+    Resolve the captcha font once per process.
 
-    # Try to use a default PIL font
-    # Choose font and size
-    font = None
-    font_size = int(_HEIGHT * 0.65)  # scale with height
-    try:
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except Exception:
+    Tries ``CAPTCHA_FONT_PATH`` first, then Arial and DejaVu Sans, then
+    Pillow's built-in default font.
+    """
+    candidates = [settings.CAPTCHA_FONT_PATH] if settings.CAPTCHA_FONT_PATH else []
+    candidates += ["arial.ttf", "DejaVuSans.ttf"]
+    for candidate in candidates:
         try:
-            font = ImageFont.truetype("DejaVuSans.ttf", font_size)
+            return ImageFont.truetype(candidate, _FONT_SIZE)
         except Exception:
-            try:
-                # Default bitmap font (smaller)
-                font = ImageFont.load_default()
-            except Exception:  # pragma: no cover
-                font = None
-
-    # Get text size (compatible with Pillow 10+)
+            continue
     try:
-        # Pillow 10+ uses textbbox
-        if hasattr(draw, 'textbbox'):
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-        else:
-            # Fallback for older Pillow versions
-            text_width, text_height = draw.textsize(text, font=font)
-    except (AttributeError, TypeError) as e:
-        # If both fail, use estimated size
-        text_width = len(text) * 10
-        text_height = 20
+        # Pillow 10.1+ can scale the default font
+        return ImageFont.load_default(size=_FONT_SIZE)
+    except TypeError:
+        return ImageFont.load_default()
+    except Exception:  # pragma: no cover
+        return None
+
+
+@lru_cache(maxsize=1)
+def _glyph_metrics() -> tuple[dict[str, float], int]:
+    """
+    Precompute per-character advance widths and the line height.
+
+    Returns:
+        (advance width per character, text height)
+    """
+    font = _load_font()
+    if font is None:
+        # Estimated sizes when no font could be loaded
+        return {ch: 10.0 for ch in _CHARS}, 20
+    widths = {ch: font.getlength(ch) for ch in _CHARS}
+    bbox = font.getbbox(_CHARS)
+    return widths, bbox[3] - bbox[1]
+
+
+def _generate_image(text: str) -> bytes:
+    """Generate captcha image and return PNG bytes."""
+    # Base image
+    image = Image.new("RGB", (_WIDTH, _HEIGHT), (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    font = _load_font()
+
+    # Text size from cached glyph metrics
+    widths, text_height = _glyph_metrics()
+    text_width = sum(widths.get(ch, 10.0) for ch in text)
 
     # Slightly randomize text position
     x = max(5, (_WIDTH - text_width) / 2 + random.randint(-5, 5))
@@ -94,13 +100,14 @@ def _generate_image(text: str) -> str:
         end = (random.randint(0, _WIDTH), random.randint(0, _HEIGHT))
         draw.line([start, end], fill=(random.randint(100, 200), random.randint(100, 200), random.randint(100, 200)), width=1)
 
-    # Add some noise dots
-    for _ in range(20):
+    # Add noise dots, fresh for every image: a background shared between
+    # captchas could be subtracted by a solver
+    for _ in range(_NOISE_DOTS):
         x_dot = random.randint(0, _WIDTH)
         y_dot = random.randint(0, _HEIGHT)
         draw.point((x_dot, y_dot), fill=(random.randint(150, 255), random.randint(150, 255), random.randint(150, 255)))
 
-    # Save to base64
+    # Save as PNG
     buffer = io.BytesIO()
     image.save(buffer, format="PNG")
     image_bytes = buffer.getvalue()
@@ -108,6 +115,11 @@ def _generate_image(text: str) -> str:
     if not image_bytes:
         raise ValueError("Failed to generate image bytes")
     
+    return image_bytes
+
+
+def to_data_url(image_bytes: bytes) -> str:
+    """Encode PNG bytes as a base64 data URL."""
     base64_str = base64.b64encode(image_bytes).decode("utf-8")
     
     if not base64_str:
@@ -116,53 +128,149 @@ def _generate_image(text: str) -> str:
     return f"data:image/png;base64,{base64_str}"
 
 
-def generate_captcha() -> tuple[str, str]:
+class CaptchaPool:
+    """
+    Pool of pre-rendered (answer, PNG bytes) pairs.
+
+    A background thread keeps the pool topped up so requests only pop a
+    ready-made image. When the pool runs dry the caller renders inline.
+    """
+
+    def __init__(
+        self,
+        size: int = settings.CAPTCHA_POOL_SIZE,
+        low_water: int = settings.CAPTCHA_POOL_LOW_WATER,
+    ):
+        """
+        Initialize captcha pool.
+
+        Args:
+            size: Number of captchas kept ready
+            low_water: Refill is triggered when the pool drops below this
+        """
+        self.size = size
+        self.low_water = low_water
+        self._items: deque[tuple[str, bytes]] = deque()
+        self._refill = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def take(self) -> tuple[str, bytes] | None:
+        """
+        Pop a pre-rendered captcha.
+
+        Returns:
+            (answer, PNG bytes), or None if the pool is empty
+        """
+        try:
+            item = self._items.popleft()
+        except IndexError:
+            item = None
+        if len(self._items) < self.low_water:
+            self._refill.set()
+        return item
+
+    def fill(self) -> None:
+        """Render captchas until the pool is full."""
+        while len(self._items) < self.size and not self._stop.is_set():
+            text = _random_text()
+            try:
+                self._items.append((text, _generate_image(text)))
+            except Exception as e:
+                logger.error(f"Failed to pre-render captcha: {e}", exc_info=True)
+                return
+
+    def _run(self) -> None:
+        """Background loop refilling the pool on demand."""
+        while not self._stop.is_set():
+            self.fill()
+            self._refill.wait()
+            self._refill.clear()
+
+    def start(self) -> None:
+        """Resolve font resources and start the background refill thread."""
+        _load_font()
+        _glyph_metrics()
+        if self.size <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="captcha-pool", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refill thread."""
+        self._stop.set()
+        self._refill.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+# Global captcha pool instance
+captcha_pool = CaptchaPool()
+
+
+def generate_captcha() -> tuple[str, bytes]:
     """
     Generate an image captcha.
 
+    Takes a pre-rendered image from the pool when available and only
+    renders inline when the pool is empty.
+
     Returns:
         captcha_id: Unique identifier
-        image_base64: Captcha image in base64 data URL
+        image_bytes: Captcha image as PNG bytes
 
     Raises:
         Exception: If image generation fails
     """
-    _cleanup()
-    text = _random_text()
     captcha_id = str(uuid.uuid4())
     try:
-        image_base64 = _generate_image(text)
-        # Verify that base64 data is not empty
-        if not image_base64 or image_base64 == "data:image/png;base64,":
-            raise ValueError("Generated empty captcha image")
+        pooled = captcha_pool.take()
+        if pooled:
+            text, image_bytes = pooled
+        else:
+            text = _random_text()
+            image_bytes = _generate_image(text)
     except Exception as e:
         # Log error for debugging
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Failed to generate captcha image: {e}", exc_info=True)
         raise
-    _STORE[captcha_id] = CaptchaItem(
+    get_captcha_store().put(captcha_id, CaptchaItem(
         answer=text,
         expires_at=datetime.utcnow() + _TTL,
-        image_base64=image_base64,
-    )
-    return captcha_id, image_base64
+        image=image_bytes,
+    ))
+    return captcha_id, image_bytes
+
+
+def get_captcha_image(captcha_id: str) -> bytes | None:
+    """
+    Get the PNG image of a pending captcha.
+
+    Returns:
+        PNG bytes, or None if the captcha is unknown or expired
+    """
+    return get_captcha_store().get_image(captcha_id)
 
 
 def validate_captcha(captcha_id: str, answer: str | int) -> None:
     """
     Validate a captcha answer.
 
+    The captcha is consumed in one atomic get-and-delete, whether or not
+    the answer is correct.
+
     Raises:
         ValueError: If invalid, expired, or not found.
     """
-    _cleanup()
-    item = _STORE.pop(captcha_id, None)
-    if not item:
+    item = get_captcha_store().pop(captcha_id)
+    if not item or item.expires_at < datetime.utcnow():
         raise ValueError("Invalid or expired captcha")
 
     # Normalize answer (case-insensitive)
     user_ans = str(answer).strip().upper()
     if user_ans != item.answer:
         raise ValueError("Captcha answer is incorrect")
-
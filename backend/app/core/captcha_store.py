@@ -0,0 +1,243 @@
+"""Pluggable storage backends for pending captchas."""
+
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+
+from sqlalchemy import delete, select
+
+from app.config import settings
+from app.core.redis_client import get_redis
+from app.database import SessionLocal
+from app.models.captcha import Captcha
+
+
+@dataclass
+class CaptchaItem:
+    """Captcha item with answer and expiration."""
+
+    answer: str
+    expires_at: datetime
+    image: bytes
+
+
+class CaptchaStore(ABC):
+    """
+    Interface for captcha stores.
+
+    ``pop`` must be an atomic get-and-delete so a captcha can be redeemed
+    at most once, whichever worker receives the submission.
+    """
+
+    @abstractmethod
+    def put(self, captcha_id: str, item: CaptchaItem) -> None:
+        """
+        Store a captcha until it expires.
+
+        Args:
+            captcha_id: Unique identifier
+            item: Captcha answer, expiry and image
+        """
+
+    @abstractmethod
+    def pop(self, captcha_id: str) -> CaptchaItem | None:
+        """
+        Atomically fetch and remove a captcha.
+
+        Args:
+            captcha_id: Unique identifier
+
+        Returns:
+            Captcha item, or None if missing or expired
+        """
+
+    @abstractmethod
+    def get_image(self, captcha_id: str) -> bytes | None:
+        """
+        Fetch a captcha image without consuming the captcha.
+
+        Args:
+            captcha_id: Unique identifier
+
+        Returns:
+            PNG bytes, or None if missing or expired
+        """
+
+
+class MemoryCaptchaStore(CaptchaStore):
+    """
+    Process-local store; only valid with a single worker.
+
+    Captchas share one TTL, so insertion order is also expiry order: expired
+    entries are popped from the front of an ordered dict, and the oldest
+    entries are evicted first once ``max_items`` is reached. Every call
+    costs amortized O(1) however many captchas are outstanding.
+    """
+
+    def __init__(self, max_items: int = settings.CAPTCHA_MAX_LIVE):
+        """
+        Initialize memory store.
+
+        Args:
+            max_items: Hard cap on live captchas
+        """
+        self.max_items = max_items
+        self._items: OrderedDict[str, CaptchaItem] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cleanup(self) -> None:
+        """Remove expired captchas from the front of the queue."""
+        now = datetime.utcnow()
+        while self._items:
+            oldest = next(iter(self._items.values()))
+            if oldest.expires_at >= now:
+                break
+            self._items.popitem(last=False)
+
+    def put(self, captcha_id: str, item: CaptchaItem) -> None:
+        """Store a captcha, evicting the oldest ones beyond the cap."""
+        with self._lock:
+            self._cleanup()
+            self._items[captcha_id] = item
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def pop(self, captcha_id: str) -> CaptchaItem | None:
+        """Atomically fetch and remove a captcha."""
+        with self._lock:
+            self._cleanup()
+            return self._items.pop(captcha_id, None)
+
+    def get_image(self, captcha_id: str) -> bytes | None:
+        """Fetch a captcha image without consuming the captcha."""
+        with self._lock:
+            self._cleanup()
+            item = self._items.get(captcha_id)
+            return item.image if item else None
+
+
+class DatabaseCaptchaStore(CaptchaStore):
+    """Store backed by the ``captchas`` table (SQLite or MySQL)."""
+
+    def put(self, captcha_id: str, item: CaptchaItem) -> None:
+        """Store a captcha and purge expired rows."""
+        db = SessionLocal()
+        try:
+            db.execute(delete(Captcha).where(Captcha.expires_at < datetime.utcnow()))
+            db.add(Captcha(
+                id=captcha_id,
+                answer=item.answer,
+                image=item.image,
+                expires_at=item.expires_at,
+            ))
+            db.commit()
+        finally:
+            db.close()
+
+    def pop(self, captcha_id: str) -> CaptchaItem | None:
+        """
+        Atomically fetch and remove a captcha.
+
+        Only the request whose DELETE actually removes the row wins, so two
+        concurrent submissions of the same captcha cannot both pass.
+        """
+        db = SessionLocal()
+        try:
+            row = db.execute(
+                select(Captcha.answer, Captcha.image, Captcha.expires_at)
+                .where(Captcha.id == captcha_id)
+            ).first()
+            if row is None:
+                return None
+            result = db.execute(delete(Captcha).where(Captcha.id == captcha_id))
+            db.commit()
+            if result.rowcount != 1 or row.expires_at < datetime.utcnow():
+                return None
+            return CaptchaItem(answer=row.answer, expires_at=row.expires_at, image=row.image)
+        finally:
+            db.close()
+
+    def get_image(self, captcha_id: str) -> bytes | None:
+        """Fetch a captcha image without consuming the captcha."""
+        db = SessionLocal()
+        try:
+            return db.execute(
+                select(Captcha.image)
+                .where(Captcha.id == captcha_id, Captcha.expires_at >= datetime.utcnow())
+            ).scalar()
+        finally:
+            db.close()
+
+
+class RedisCaptchaStore(CaptchaStore):
+    """Store backed by Redis keys with native TTL expiry."""
+
+    def __init__(self, prefix: str = "captcha:"):
+        """
+        Initialize Redis store.
+
+        Args:
+            prefix: Key prefix for captcha hashes
+        """
+        self.client = get_redis()
+        self.prefix = prefix
+
+    def put(self, captcha_id: str, item: CaptchaItem) -> None:
+        """Store a captcha with a Redis TTL."""
+        ttl = max(1, int((item.expires_at - datetime.utcnow()).total_seconds()))
+        key = self.prefix + captcha_id
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hset(key, mapping={
+            "answer": item.answer,
+            "expires_at": item.expires_at.isoformat(),
+            "image": item.image,
+        })
+        pipe.expire(key, ttl)
+        pipe.execute()
+
+    def pop(self, captcha_id: str) -> CaptchaItem | None:
+        """Atomically fetch and remove a captcha (MULTI/EXEC)."""
+        key = self.prefix + captcha_id
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hgetall(key)
+        pipe.delete(key)
+        data, _ = pipe.execute()
+        if not data:
+            return None
+        return CaptchaItem(
+            answer=data[b"answer"].decode("utf-8"),
+            expires_at=datetime.fromisoformat(data[b"expires_at"].decode("utf-8")),
+            image=data[b"image"],
+        )
+
+    def get_image(self, captcha_id: str) -> bytes | None:
+        """Fetch a captcha image without consuming the captcha."""
+        return self.client.hget(self.prefix + captcha_id, "image")
+
+
+@lru_cache
+def get_captcha_store(name: str = settings.CAPTCHA_STORE) -> CaptchaStore:
+    """
+    Get the configured captcha store.
+
+    Args:
+        name: Store name (memory, database, redis)
+
+    Returns:
+        Captcha store instance (shared within the process)
+
+    Raises:
+        ValueError: If the store name is unknown
+    """
+    if name == "memory":
+        return MemoryCaptchaStore()
+    if name == "database":
+        return DatabaseCaptchaStore()
+    if name == "redis":
+        return RedisCaptchaStore()
+    raise ValueError(f"Unknown captcha store: {name}")
@@ -1,6 +1,8 @@
 """Email service for sending emails."""
 
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional
@@ -21,16 +23,27 @@ class EmailService:
         self.password = settings.SMTP_PASSWORD
         self.from_email = settings.SMTP_FROM_EMAIL or settings.SMTP_USER
         self.from_name = settings.SMTP_FROM_NAME
+        self.starttls = settings.SMTP_STARTTLS
+        self.pool_size = settings.SMTP_POOL_SIZE
+        self.noop_after = settings.SMTP_NOOP_AFTER
+        # Idle authenticated connections with the time they were last used
+        self._idle: list[tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
     
-    def send_email(
+    @property
+    def is_configured(self) -> bool:
+        """Whether SMTP credentials are configured."""
+        return bool(self.user and self.password)
+    
+    def deliver(
         self,
         to_email: str,
         subject: str,
         body: str,
         html_body: Optional[str] = None
-    ) -> bool:
+    ) -> None:
         """
-        Send an email.
+        Send an email, raising on failure.
         
         Args:
             to_email: Recipient email address
@@ -38,85 +51,135 @@ class EmailService:
             body: Plain text email body
             html_body: Optional HTML email body
             
-        Returns:
-            True if email sent successfully, False otherwise
+        Raises:
+            Exception: If the SMTP exchange fails
         """
-        # Skip sending if email is not configured
-        if not self.user or not self.password:
-            logger.warning("Email not configured. Skipping email send.")
-            return False
+        # Create message
+        msg = MIMEMultipart('alternative')
+        msg['From'] = f"{self.from_name} <{self.from_email}>"
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        
+        # Add plain text part
+        text_part = MIMEText(body, 'plain', 'utf-8')
+        msg.attach(text_part)
+        
+        # Add HTML part if provided
+        if html_body:
+            html_part = MIMEText(html_body, 'html', 'utf-8')
+            msg.attach(html_part)
         
+        # Send email over a pooled connection; retry once on a fresh one
+        # if the server dropped an idle connection
+        server = self._acquire()
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = f"{self.from_name} <{self.from_email}>"
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            # Add plain text part
-            text_part = MIMEText(body, 'plain', 'utf-8')
-            msg.attach(text_part)
-            
-            # Add HTML part if provided
-            if html_body:
-                html_part = MIMEText(html_body, 'html', 'utf-8')
-                msg.attach(html_part)
-            
-            # Send email
-            with smtplib.SMTP(self.host, self.port) as server:
-                server.starttls()
-                server.login(self.user, self.password)
+            server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            self._discard(server)
+            server = self._connect()
+            try:
                 server.send_message(msg)
-            
-            logger.info(f"Email sent successfully to {to_email}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to send email: {str(e)}")
-            return False
+            except Exception:
+                self._discard(server)
+                raise
+        except Exception:
+            self._discard(server)
+            raise
+        self._release(server)
+        
+        logger.info(f"Email sent successfully to {to_email}")
     
-    def send_feedback_notification(
+    def _connect(self) -> smtplib.SMTP:
+        """Open a new authenticated SMTP connection."""
+        server = smtplib.SMTP(self.host, self.port)
+        try:
+            if self.starttls:
+                server.starttls()
+            server.login(self.user, self.password)
+        except Exception:
+            self._discard(server)
+            raise
+        return server
+    
+    def _acquire(self) -> smtplib.SMTP:
+        """
+        Take an idle connection from the pool or open a new one.
+        
+        Connections idle for longer than ``noop_after`` seconds are checked
+        with NOOP first and replaced if the server no longer answers.
+        """
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                server, last_used = self._idle.pop()
+            if time.monotonic() - last_used < self.noop_after:
+                return server
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except smtplib.SMTPException:
+                pass
+            except OSError:
+                pass
+            self._discard(server)
+        return self._connect()
+    
+    def _release(self, server: smtplib.SMTP) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append((server, time.monotonic()))
+                return
+        self._discard(server)
+    
+    @staticmethod
+    def _discard(server: smtplib.SMTP) -> None:
+        """Close a connection, ignoring errors."""
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    def close(self) -> None:
+        """Close all pooled connections (called at application shutdown)."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._discard(server)
+    
+    def send_email(
         self,
-        name: str,
-        email: str,
-        subject: str | None,
-        message: str
+        to_email: str,
+        subject: str,
+        body: str,
+        html_body: Optional[str] = None
     ) -> bool:
         """
-        Send feedback notification email.
+        Send an email.
         
         Args:
-            name: Sender name
-            email: Sender email
-            subject: Feedback subject
-            message: Feedback message
+            to_email: Recipient email address
+            subject: Email subject
+            body: Plain text email body
+            html_body: Optional HTML email body
             
         Returns:
             True if email sent successfully, False otherwise
         """
-        if not settings.FEEDBACK_TO_EMAIL:
-            logger.warning("FEEDBACK_TO_EMAIL not configured. Skipping email send.")
+        # Skip sending if email is not configured
+        if not self.is_configured:
+            logger.warning("Email not configured. Skipping email send.")
             return False
         
-        email_subject = f"New Feedback: {subject or 'No Subject'}"
-        
-        # Plain text body
-        text_body = f"""
-New feedback received from AI-Tracks Studio website:
-
-Name: {name}
-Email: {email}
-Subject: {subject or 'No Subject'}
-
-Message:
-{message}
-
----
-This is an automated message from AI-Tracks Studio.
-"""
-        
-        # HTML body
-        html_body = f"""
+        try:
+            self.deliver(to_email, subject, body, html_body)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send email: {str(e)}")
+            return False
+    
+    _HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -125,7 +188,7 @@ This is an automated message from AI-Tracks Studio.
         body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
         .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
         .header {{ background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-bottom: 20px; }}
-        .content {{ background-color: #ffffff; padding: 20px; border: 1px solid #dee2e6; border-radius: 5px; }}
+        .content {{ background-color: #ffffff; padding: 20px; border: 1px solid #dee2e6; border-radius: 5px; margin-bottom: 20px; }}
         .field {{ margin-bottom: 15px; }}
         .label {{ font-weight: bold; color: #495057; }}
         .value {{ margin-top: 5px; padding: 10px; background-color: #f8f9fa; border-radius: 3px; }}
@@ -136,9 +199,32 @@ This is an automated message from AI-Tracks Studio.
 <body>
     <div class="container">
         <div class="header">
-            <h2>New Feedback Received</h2>
+            <h2>{heading}</h2>
+        </div>
+{content}
+        <div class="footer">
+            This is an automated message from AI-Tracks Studio.
         </div>
-        <div class="content">
+    </div>
+</body>
+</html>
+"""
+    
+    @staticmethod
+    def _feedback_text_block(name: str, email: str, subject: str | None, message: str) -> str:
+        """Render one feedback entry as plain text."""
+        return f"""Name: {name}
+Email: {email}
+Subject: {subject or 'No Subject'}
+
+Message:
+{message}
+"""
+    
+    @staticmethod
+    def _feedback_html_block(name: str, email: str, subject: str | None, message: str) -> str:
+        """Render one feedback entry as an HTML content block."""
+        return f"""        <div class="content">
             <div class="field">
                 <div class="label">Name:</div>
                 <div class="value">{name}</div>
@@ -155,15 +241,110 @@ This is an automated message from AI-Tracks Studio.
                 <div class="label">Message:</div>
                 <div class="value message">{message}</div>
             </div>
-        </div>
-        <div class="footer">
-            This is an automated message from AI-Tracks Studio.
-        </div>
-    </div>
-</body>
-</html>
+        </div>"""
+    
+    def render_feedback_notification(
+        self,
+        name: str,
+        email: str,
+        subject: str | None,
+        message: str
+    ) -> tuple[str, str, str]:
+        """
+        Render the feedback notification email.
+        
+        Args:
+            name: Sender name
+            email: Sender email
+            subject: Feedback subject
+            message: Feedback message
+            
+        Returns:
+            Tuple of (email subject, plain text body, HTML body)
+        """
+        email_subject = f"New Feedback: {subject or 'No Subject'}"
+        
+        # Plain text body
+        text_body = f"""
+New feedback received from AI-Tracks Studio website:
+
+{self._feedback_text_block(name, email, subject, message)}
+---
+This is an automated message from AI-Tracks Studio.
 """
         
+        # HTML body
+        html_body = self._HTML_TEMPLATE.format(
+            heading="New Feedback Received",
+            content=self._feedback_html_block(name, email, subject, message),
+        )
+        
+        return email_subject, text_body, html_body
+    
+    def render_feedback_digest(self, items: list[dict]) -> tuple[str, str, str]:
+        """
+        Render several feedback submissions as one digest email.
+        
+        Args:
+            items: Feedback template contexts (name, email, subject, message),
+                oldest first
+            
+        Returns:
+            Tuple of (email subject, plain text body, HTML body)
+        """
+        if len(items) == 1:
+            return self.render_feedback_notification(**items[0])
+        
+        email_subject = f"New Feedback Digest: {len(items)} submissions"
+        
+        # Plain text body
+        separator = "\n" + "-" * 40 + "\n\n"
+        text_body = f"""
+{len(items)} new feedback submissions received from AI-Tracks Studio website:
+
+{separator.join(self._feedback_text_block(**item) for item in items)}
+---
+This is an automated message from AI-Tracks Studio.
+"""
+        
+        # HTML body
+        html_body = self._HTML_TEMPLATE.format(
+            heading=f"{len(items)} New Feedback Submissions",
+            content="\n".join(self._feedback_html_block(**item) for item in items),
+        )
+        
+        return email_subject, text_body, html_body
+    
+    def send_feedback_notification(
+        self,
+        name: str,
+        email: str,
+        subject: str | None,
+        message: str
+    ) -> bool:
+        """
+        Send feedback notification email.
+        
+        Args:
+            name: Sender name
+            email: Sender email
+            subject: Feedback subject
+            message: Feedback message
+            
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        if not settings.FEEDBACK_TO_EMAIL:
+            logger.warning("FEEDBACK_TO_EMAIL not configured. Skipping email send.")
+            return False
+        
+        email_subject, text_body, html_body = self.render_feedback_notification(
+            name=name,
+            email=email,
+            subject=subject,
+            message=message
+        )
+        
         return self.send_email(
             to_email=settings.FEEDBACK_TO_EMAIL,
             subject=email_subject,
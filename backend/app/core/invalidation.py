@@ -0,0 +1,307 @@
+"""Cross-worker cache invalidation bus."""
+
+import json
+import logging
+import os
+import socket
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable
+
+from app.config import settings
+from app.core.redis_client import RedisError, get_redis
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[str], None]
+
+# Namespace meaning "drop everything"; dispatched after a reconnect, when
+# invalidations may have been missed
+ALL_NAMESPACES = "*"
+
+# Backoff between Redis reconnect attempts (seconds)
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+
+class LocalBackend:
+    """Backend for a single process: nothing to fan out."""
+
+    def publish(self, message: str) -> None:
+        """Publish a message (no-op)."""
+
+    def listen(
+        self,
+        callback: Handler,
+        stop: threading.Event,
+        on_reconnect: Callable[[], None] | None = None,
+    ) -> None:
+        """Block until stopped; no remote messages ever arrive."""
+        stop.wait()
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class UnixSocketBackend:
+    """
+    Single-host fanout over Unix datagram sockets.
+
+    Every worker binds one socket inside a shared directory; publishing sends
+    the message to every other socket found there. Sockets left behind by
+    dead workers are removed on the first failed send.
+    """
+
+    def __init__(self, socket_dir: str = settings.INVALIDATION_BUS_SOCKET_DIR):
+        """
+        Initialize Unix socket backend.
+
+        Args:
+            socket_dir: Directory shared by all workers on the host
+        """
+        self.socket_dir = Path(socket_dir)
+        self.socket_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.socket_dir / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(str(self.path))
+        self._sock.settimeout(1.0)
+
+    def publish(self, message: str) -> None:
+        """Send a message to every other worker's socket."""
+        data = message.encode("utf-8")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:
+            for peer in self.socket_dir.glob("*.sock"):
+                if peer == self.path:
+                    continue
+                try:
+                    sender.sendto(data, str(peer))
+                except (ConnectionRefusedError, FileNotFoundError):
+                    peer.unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning(f"Failed to publish invalidation to {peer}: {e}")
+
+    def listen(
+        self,
+        callback: Handler,
+        stop: threading.Event,
+        on_reconnect: Callable[[], None] | None = None,
+    ) -> None:
+        """Receive messages until stopped (a local socket never disconnects)."""
+        while not stop.is_set():
+            try:
+                data = self._sock.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                if stop.is_set():
+                    return
+                raise
+            callback(data.decode("utf-8"))
+
+    def close(self) -> None:
+        """Close and remove this worker's socket."""
+        self._sock.close()
+        self.path.unlink(missing_ok=True)
+
+
+class RedisBackend:
+    """Fanout over Redis pub/sub, for multi-host deployments."""
+
+    def __init__(
+        self,
+        url: str = settings.REDIS_URL,
+        channel: str = settings.INVALIDATION_BUS_CHANNEL,
+    ):
+        """
+        Initialize Redis backend.
+
+        Args:
+            url: Redis connection URL
+            channel: Pub/sub channel name
+        """
+        self.client = get_redis(url)
+        self.channel = channel
+        self._pubsub = None
+
+    def publish(self, message: str) -> None:
+        """Publish a message to the channel."""
+        self.client.publish(self.channel, message)
+
+    def listen(
+        self,
+        callback: Handler,
+        stop: threading.Event,
+        on_reconnect: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Receive channel messages until stopped.
+
+        A lost connection is retried with exponential backoff. Messages
+        published while disconnected are lost, so ``on_reconnect`` is
+        called once the channel is subscribed again.
+
+        Args:
+            callback: Called with every message
+            stop: Set to stop listening
+            on_reconnect: Called after re-subscribing following an error
+        """
+        delay = RECONNECT_MIN_DELAY
+        missed = False
+        while not stop.is_set():
+            try:
+                self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                self._pubsub.subscribe(self.channel)
+                if missed and on_reconnect is not None:
+                    on_reconnect()
+                missed = False
+                delay = RECONNECT_MIN_DELAY
+                while not stop.is_set():
+                    message = self._pubsub.get_message(timeout=1.0)
+                    if message and message["type"] == "message":
+                        data = message["data"]
+                        callback(data.decode("utf-8") if isinstance(data, bytes) else data)
+            except RedisError as e:
+                logger.warning(f"Invalidation subscription lost, reconnecting in {delay:.0f}s: {e}")
+                missed = True
+                self.close()
+                if stop.wait(delay):
+                    return
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def close(self) -> None:
+        """Close the subscription."""
+        if self._pubsub is not None:
+            try:
+                self._pubsub.close()
+            except RedisError:
+                pass
+            self._pubsub = None
+
+
+def create_backend(name: str = settings.INVALIDATION_BUS_BACKEND):
+    """
+    Create an invalidation backend by name.
+
+    Args:
+        name: Backend name (local, unix, redis)
+
+    Returns:
+        Backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name == "local":
+        return LocalBackend()
+    if name == "unix":
+        return UnixSocketBackend()
+    if name == "redis":
+        return RedisBackend()
+    raise ValueError(f"Unknown invalidation bus backend: {name}")
+
+
+class InvalidationBus:
+    """
+    Publish/subscribe bus for cache invalidation.
+
+    Publishing runs local handlers immediately and forwards the namespace to
+    every other worker through the backend, whose listener thread runs the
+    same handlers there.
+    """
+
+    def __init__(self, backend=None):
+        """
+        Initialize invalidation bus.
+
+        Args:
+            backend: Backend instance; created from settings on start if None
+        """
+        self.backend = backend
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: list[Handler] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self, handler: Handler) -> None:
+        """
+        Register a handler called with the invalidated namespace.
+
+        Handlers must drop everything they hold for ``ALL_NAMESPACES``.
+
+        Args:
+            handler: Callable receiving the namespace
+        """
+        if handler not in self._handlers:
+            self._handlers.append(handler)
+
+    def publish(self, namespace: str) -> None:
+        """
+        Invalidate a namespace in this worker and all others.
+
+        Args:
+            namespace: Namespace to invalidate (e.g. ``projects``)
+        """
+        self._dispatch(namespace)
+        if self.backend is None:
+            return
+        try:
+            self.backend.publish(json.dumps({"origin": self.origin, "namespace": namespace}))
+        except Exception as e:
+            logger.error(f"Failed to publish invalidation for {namespace}: {e}")
+
+    def _dispatch(self, namespace: str) -> None:
+        """Run local handlers for a namespace."""
+        for handler in self._handlers:
+            try:
+                handler(namespace)
+            except Exception as e:
+                logger.error(f"Invalidation handler failed for {namespace}: {e}")
+
+    def _on_message(self, message: str) -> None:
+        """Handle a message received from another worker."""
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            logger.warning(f"Ignoring malformed invalidation message: {message!r}")
+            return
+        if payload.get("origin") != self.origin:
+            self._dispatch(payload["namespace"])
+
+    def _resync(self) -> None:
+        """Drop all local caches after invalidations may have been missed."""
+        logger.info("Invalidation bus reconnected; flushing local caches")
+        self._dispatch(ALL_NAMESPACES)
+
+    def _run(self) -> None:
+        """Background loop receiving remote invalidations."""
+        try:
+            self.backend.listen(self._on_message, self._stop, on_reconnect=self._resync)
+        except Exception as e:
+            logger.error(f"Invalidation listener stopped: {e}")
+
+    def start(self) -> None:
+        """Create the backend and start the listener thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        if self.backend is None:
+            self.backend = create_backend()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="invalidation-bus", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the listener thread and close the backend."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
+
+
+# Global invalidation bus instance
+invalidation_bus = InvalidationBus()
@@ -0,0 +1,264 @@
+"""Sliding-window throttling of admin login attempts."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from functools import lru_cache
+
+from app.config import settings
+from app.core.redis_client import get_redis
+
+
+class AttemptStore(ABC):
+    """
+    Interface for sliding-window attempt stores.
+
+    A key may record at most ``limit`` attempts within any ``window``
+    seconds. ``hit`` must check and record atomically so concurrent
+    requests cannot both take the last free slot.
+    """
+
+    # Whether calls do network I/O and must be kept off the event loop
+    blocking = False
+
+    @abstractmethod
+    def hit(self, key: str, limit: int, window: float) -> float:
+        """
+        Record an attempt if the key is under its limit.
+
+        Args:
+            key: Throttled key
+            limit: Attempts allowed per window
+            window: Window length in seconds
+
+        Returns:
+            0 if the attempt was recorded, else seconds until a slot frees up
+        """
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        """Forget every attempt of a key."""
+
+
+class MemoryAttemptStore(AttemptStore):
+    """
+    Process-local store; limits apply per worker.
+
+    Each key keeps the timestamps of its attempts in a deque capped at the
+    limit, so a key never holds more than ``limit`` entries. Keys live in
+    an ordered dict in least-recently-used order: once ``max_keys`` is
+    reached the idlest keys are evicted, so a flood of spoofed emails or
+    addresses cannot grow memory without bound.
+    """
+
+    def __init__(self, max_keys: int = settings.LOGIN_THROTTLE_MAX_KEYS):
+        """
+        Initialize memory store.
+
+        Args:
+            max_keys: Hard cap on tracked keys
+        """
+        self.max_keys = max_keys
+        self._attempts: OrderedDict[str, deque[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _window(self, key: str, window: float, now: float) -> deque[float] | None:
+        """Drop expired attempts of a key and mark it recently used."""
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            return None
+        while attempts and attempts[0] <= now - window:
+            attempts.popleft()
+        if not attempts:
+            del self._attempts[key]
+            return None
+        self._attempts.move_to_end(key)
+        return attempts
+
+    def hit(self, key: str, limit: int, window: float) -> float:
+        """Record an attempt if the key is under its limit."""
+        now = time.monotonic()
+        with self._lock:
+            attempts = self._window(key, window, now)
+            if attempts is not None and len(attempts) >= limit:
+                return attempts[0] + window - now
+            if attempts is None:
+                attempts = self._attempts[key] = deque(maxlen=limit)
+                while len(self._attempts) > self.max_keys:
+                    self._attempts.popitem(last=False)
+            attempts.append(now)
+            return 0.0
+
+    def reset(self, key: str) -> None:
+        """Forget every attempt of a key."""
+        with self._lock:
+            self._attempts.pop(key, None)
+
+
+# Sorted set of attempt timestamps per key, trimmed to the window.
+# ARGV: now (ms), window (ms), limit, unique member
+_SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) >= limit then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    return tonumber(oldest[2]) + window - now
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], window)
+return 0
+"""
+
+
+class RedisAttemptStore(AttemptStore):
+    """
+    Store shared by every worker, backed by one Redis sorted set per key.
+
+    The check and the insert run in a single Lua script, so they are atomic
+    across workers. Every key carries a TTL equal to the window, so idle
+    keys expire on their own; configure ``maxmemory-policy volatile-lru``
+    to also cap memory under a flood of distinct keys.
+    """
+
+    blocking = True
+
+    def __init__(self, prefix: str = "login-throttle:"):
+        """
+        Initialize Redis store.
+
+        Args:
+            prefix: Key prefix for attempt sets
+        """
+        self.client = get_redis()
+        self.prefix = prefix
+        self._script = self.client.register_script(_SLIDING_WINDOW_SCRIPT)
+
+    def hit(self, key: str, limit: int, window: float) -> float:
+        """Record an attempt if the key is under its limit."""
+        retry_ms = self._script(
+            keys=[self.prefix + key],
+            args=[int(time.time() * 1000), int(window * 1000), limit, uuid.uuid4().hex],
+        )
+        return int(retry_ms) / 1000
+
+    def reset(self, key: str) -> None:
+        """Forget every attempt of a key."""
+        self.client.delete(self.prefix + key)
+
+
+@lru_cache
+def get_attempt_store(name: str = settings.LOGIN_THROTTLE_BACKEND) -> AttemptStore:
+    """
+    Get the configured attempt store.
+
+    Args:
+        name: Store name (memory, redis)
+
+    Returns:
+        Attempt store instance (shared within the process)
+
+    Raises:
+        ValueError: If the store name is unknown
+    """
+    if name == "memory":
+        return MemoryAttemptStore()
+    if name == "redis":
+        return RedisAttemptStore()
+    raise ValueError(f"Unknown login throttle backend: {name}")
+
+
+class LoginThrottle:
+    """
+    Per-IP and per-account limits on admin login attempts.
+
+    Both limits are checked before the user lookup and the bcrypt
+    verification, so a throttled client costs neither a query nor a hash.
+    Every attempt takes a slot from the client IP and from the account
+    up front, so parallel guesses cannot overrun the account limit while
+    their hashes are being checked; a correct password clears the
+    account's count, so in effect only failed attempts count against it.
+    """
+
+    def __init__(
+        self,
+        ip_limit: int = settings.LOGIN_THROTTLE_IP_LIMIT,
+        ip_window: float = settings.LOGIN_THROTTLE_IP_WINDOW,
+        account_limit: int = settings.LOGIN_THROTTLE_ACCOUNT_LIMIT,
+        account_window: float = settings.LOGIN_THROTTLE_ACCOUNT_WINDOW,
+    ):
+        """
+        Initialize login throttle.
+
+        Args:
+            ip_limit: Attempts per client IP per window (0 disables)
+            ip_window: IP window length in seconds
+            account_limit: Failed attempts per account per window (0 disables)
+            account_window: Account window length in seconds
+        """
+        self.ip_limit = ip_limit
+        self.ip_window = ip_window
+        self.account_limit = account_limit
+        self.account_window = account_window
+
+    @staticmethod
+    def _account_key(email: str) -> str:
+        """Store key of an account (emails compare case-insensitively)."""
+        return f"account:{email.strip().lower()}"
+
+    @staticmethod
+    def _ip_key(ip: str) -> str:
+        """Store key of a client IP."""
+        return f"ip:{ip}"
+
+    async def _call(self, func, *args):
+        """Call a store method, off the event loop if it does I/O."""
+        store = get_attempt_store()
+        method = getattr(store, func)
+        if store.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def check(self, ip: str, email: str) -> int:
+        """
+        Reserve a slot for the attempt under both limits.
+
+        The account slot is taken here rather than after a failed
+        verification, so the check and the count are one atomic step.
+        It stays taken unless the password turns out to be correct.
+
+        Args:
+            ip: Client IP address
+            email: Submitted account email
+
+        Returns:
+            0 if the attempt may proceed, else Retry-After seconds
+        """
+        # IP first: a throttled client does not use up the account's slots
+        if self.ip_limit > 0:
+            retry_after = await self._call("hit", self._ip_key(ip), self.ip_limit, self.ip_window)
+            if retry_after > 0:
+                return math.ceil(retry_after)
+        if self.account_limit > 0:
+            retry_after = await self._call(
+                "hit", self._account_key(email), self.account_limit, self.account_window
+            )
+            if retry_after > 0:
+                return math.ceil(retry_after)
+        return 0
+
+    async def reset(self, email: str) -> None:
+        """Clear the account's attempts once its password was verified."""
+        if self.account_limit > 0:
+            await self._call("reset", self._account_key(email))
+
+
+# Global login throttle instance
+login_throttle = LoginThrottle()
@@ -0,0 +1,270 @@
+"""Email outbox with a background delivery worker."""
+
+import logging
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.email import email_service
+from app.database import SessionLocal
+from app.models.outbox import OutboxMessage, OutboxStatus
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutbox:
+    """
+    Transactional email outbox.
+
+    Requests only insert an ``email_outbox`` row; a background thread in
+    each worker claims due rows, renders and sends them, and retries
+    failures with exponential backoff. Claims carry a lock timeout, so a
+    message held by a crashed worker is picked up again later.
+
+    In digest mode, ``feedback`` messages are held back until the oldest
+    one has waited ``digest_window`` seconds or ``digest_max_items`` are
+    queued, then sent as a single combined email.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = settings.EMAIL_OUTBOX_POLL_INTERVAL,
+        batch_size: int = settings.EMAIL_OUTBOX_BATCH_SIZE,
+        max_attempts: int = settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+        backoff_seconds: float = settings.EMAIL_OUTBOX_BACKOFF_SECONDS,
+        lock_timeout: float = settings.EMAIL_OUTBOX_LOCK_TIMEOUT,
+        digest_enabled: bool = settings.FEEDBACK_DIGEST_ENABLED,
+        digest_window: float = settings.FEEDBACK_DIGEST_WINDOW_SECONDS,
+        digest_max_items: int = settings.FEEDBACK_DIGEST_MAX_ITEMS,
+    ):
+        """
+        Initialize email outbox.
+
+        Args:
+            poll_interval: Seconds between polls for due messages
+            batch_size: Maximum messages claimed per poll
+            max_attempts: Attempts before a message is marked failed
+            backoff_seconds: Base retry delay, doubled after each failure
+            lock_timeout: Seconds before an unfinished claim can be retaken
+            digest_enabled: Combine feedback notifications into digests
+            digest_window: Maximum seconds a feedback notification is held
+            digest_max_items: Queued feedback notifications that trigger a digest
+        """
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.lock_timeout = lock_timeout
+        self.digest_enabled = digest_enabled
+        self.digest_window = digest_window
+        self.digest_max_items = digest_max_items
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def enqueue(self, db: Session, kind: str, to_email: str, payload: dict) -> OutboxMessage:
+        """
+        Add a message to the outbox.
+
+        The row is only added to the session; it is committed together with
+        the caller's transaction. Call ``notify()`` after committing.
+
+        Args:
+            db: Database session of the caller
+            kind: Message kind (``feedback`` or ``email``)
+            to_email: Recipient email address
+            payload: Template context (``feedback``) or subject/body (``email``)
+
+        Returns:
+            Pending outbox message
+        """
+        message = OutboxMessage(kind=kind, to_email=to_email, payload=payload)
+        db.add(message)
+        return message
+
+    def notify(self) -> None:
+        """Wake the delivery thread without waiting for the next poll."""
+        self._wake.set()
+
+    def _render(self, message: OutboxMessage) -> tuple[str, str, str | None]:
+        """Render a message into (subject, body, html_body)."""
+        payload = message.payload
+        if message.kind == "feedback":
+            return email_service.render_feedback_notification(**payload)
+        if message.kind == "email":
+            return payload["subject"], payload["body"], payload.get("html_body")
+        raise ValueError(f"Unknown outbox message kind: {message.kind}")
+
+    @staticmethod
+    def _due(now: datetime):
+        """Condition matching messages ready to be claimed."""
+        return or_(
+            and_(OutboxMessage.status == OutboxStatus.PENDING, OutboxMessage.next_attempt_at <= now),
+            and_(OutboxMessage.status == OutboxStatus.SENDING, OutboxMessage.locked_until < now),
+        )
+
+    def _claim(self, db: Session, *criteria, limit: int | None = None) -> list[OutboxMessage]:
+        """Claim a batch of due messages (optionally filtered) for this worker."""
+        now = datetime.utcnow()
+        due = and_(self._due(now), *criteria)
+        ids = db.execute(
+            select(OutboxMessage.id).where(due).order_by(OutboxMessage.id).limit(limit or self.batch_size)
+        ).scalars().all()
+        if not ids:
+            return []
+
+        token = str(uuid.uuid4())
+        db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(ids), due)
+            .values(
+                status=OutboxStatus.SENDING,
+                claim_token=token,
+                locked_until=now + timedelta(seconds=self.lock_timeout),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return list(db.execute(
+            select(OutboxMessage)
+            .where(OutboxMessage.claim_token == token)
+            .order_by(OutboxMessage.id)
+            .execution_options(populate_existing=True)
+        ).scalars())
+
+    def _mark_failed(self, message: OutboxMessage, error: Exception) -> None:
+        """Schedule a retry with exponential backoff, or give up."""
+        message.attempts += 1
+        message.last_error = str(error)
+        message.claim_token = None
+        message.locked_until = None
+        if message.attempts >= self.max_attempts:
+            message.status = OutboxStatus.FAILED
+            logger.error(f"Giving up on outbox message {message.id} after {message.attempts} attempts: {error}")
+            return
+        delay = self.backoff_seconds * (2 ** (message.attempts - 1))
+        message.status = OutboxStatus.PENDING
+        message.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+        logger.warning(f"Outbox message {message.id} failed, retrying in {delay:.0f}s: {error}")
+
+    @staticmethod
+    def _mark_sent(message: OutboxMessage) -> None:
+        """Mark a message as delivered."""
+        message.status = OutboxStatus.SENT
+        message.sent_at = datetime.utcnow()
+        message.claim_token = None
+        message.locked_until = None
+
+    def _digest_ready(self, db: Session) -> bool:
+        """Whether queued feedback notifications should be sent now."""
+        now = datetime.utcnow()
+        count, oldest = db.execute(
+            select(func.count(OutboxMessage.id), func.min(OutboxMessage.created_at))
+            .where(self._due(now), OutboxMessage.kind == "feedback")
+        ).one()
+        if not count:
+            return False
+        return count >= self.digest_max_items or oldest <= now - timedelta(seconds=self.digest_window)
+
+    def _process_digest(self, db: Session) -> int:
+        """Send queued feedback notifications as digests, if one is due."""
+        sent = 0
+        while not self._stop.is_set() and self._digest_ready(db):
+            messages = self._claim(db, OutboxMessage.kind == "feedback", limit=self.digest_max_items)
+            if not messages:
+                break
+            recipients: dict[str, list[OutboxMessage]] = {}
+            for message in messages:
+                recipients.setdefault(message.to_email, []).append(message)
+            for to_email, group in recipients.items():
+                try:
+                    subject, body, html_body = email_service.render_feedback_digest(
+                        [message.payload for message in group]
+                    )
+                    email_service.deliver(to_email, subject, body, html_body)
+                except Exception as e:
+                    for message in group:
+                        self._mark_failed(message, e)
+                else:
+                    for message in group:
+                        self._mark_sent(message)
+                    sent += len(group)
+                db.commit()
+            if len(messages) < self.digest_max_items:
+                break
+        return sent
+
+    def process_due(self) -> int:
+        """
+        Deliver all due messages.
+
+        Returns:
+            Number of messages sent
+        """
+        if not email_service.is_configured:
+            return 0
+
+        sent = 0
+        db = SessionLocal()
+        try:
+            # Feedback notifications wait for the next digest instead
+            criteria = (OutboxMessage.kind != "feedback",) if self.digest_enabled else ()
+            while not self._stop.is_set():
+                messages = self._claim(db, *criteria)
+                if not messages:
+                    break
+                for message in messages:
+                    try:
+                        subject, body, html_body = self._render(message)
+                        email_service.deliver(message.to_email, subject, body, html_body)
+                    except Exception as e:
+                        self._mark_failed(message, e)
+                    else:
+                        self._mark_sent(message)
+                        sent += 1
+                    db.commit()
+                if len(messages) < self.batch_size:
+                    break
+            if self.digest_enabled:
+                sent += self._process_digest(db)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Email outbox processing failed: {e}")
+        finally:
+            db.close()
+        return sent
+
+    def _run(self) -> None:
+        """Background loop delivering messages."""
+        while not self._stop.is_set():
+            self.process_due()
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def start(self) -> None:
+        """Start the background delivery thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        if not email_service.is_configured:
+            logger.warning("Email not configured. Outbox messages will stay queued.")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="email-outbox", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background delivery thread."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+
+# Global email outbox instance
+email_outbox = EmailOutbox()
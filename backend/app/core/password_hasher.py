@@ -0,0 +1,96 @@
+"""Bounded thread pool for bcrypt, keeping it off the event loop."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from app.config import settings
+from app.core.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when too many password hashes are already queued."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a small dedicated thread pool.
+
+    bcrypt releases the GIL while hashing, so a thread pool keeps the event
+    loop responsive without the overhead of a process pool. The number of
+    queued plus running calls is capped: once ``max_pending`` is reached,
+    new calls fail immediately with ``PasswordHasherBusyError`` (answered
+    as 429) instead of piling up behind a login storm.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_pending: int = settings.PASSWORD_HASH_MAX_PENDING,
+    ):
+        """
+        Initialize password hasher.
+
+        Args:
+            workers: Threads running bcrypt concurrently
+            max_pending: Queued plus running calls before rejecting new ones
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hasher"
+                )
+            return self._executor
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        """Run ``func`` in the pool, or fail fast if the queue is full."""
+        executor = self._get_executor()
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PasswordHasherBusyError("Too many password operations in progress")
+            self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against a hash without blocking the event loop.
+
+        Raises:
+            PasswordHasherBusyError: If the pool is saturated
+        """
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password with the configured cost without blocking the event loop.
+
+        Raises:
+            PasswordHasherBusyError: If the pool is saturated
+        """
+        return await self._run(get_password_hash, password)
+
+    def shutdown(self) -> None:
+        """Wait for running hashes and stop the thread pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# Global password hasher instance
+password_hasher = PasswordHasher()
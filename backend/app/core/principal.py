@@ -0,0 +1,113 @@
+"""Short-lived cache of signed-in admin principals."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.config import settings
+from app.core.invalidation import ALL_NAMESPACES
+from app.models.user import User, UserRole, UserStatus
+
+# Invalidation namespace: "users" drops every principal, "users:<id>" one
+NAMESPACE = "users"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Snapshot of a user's identity, role and status."""
+
+    id: int
+    name: str
+    email: str
+    role: UserRole
+    status: UserStatus
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Take a snapshot of a loaded user."""
+        return cls(id=user.id, name=user.name, email=user.email, role=user.role, status=user.status)
+
+
+class PrincipalCache:
+    """
+    TTL + LRU cache of principals keyed by session user id.
+
+    Saves the user lookup on bursts of admin API calls. Profile changes
+    publish ``users:<id>`` on the invalidation bus so every worker drops
+    the stale snapshot; edits made directly in the database are picked up
+    once the TTL expires.
+    """
+
+    def __init__(
+        self,
+        ttl: float = settings.ADMIN_PRINCIPAL_TTL,
+        max_entries: int = settings.ADMIN_PRINCIPAL_MAX_ENTRIES,
+    ):
+        """
+        Initialize principal cache.
+
+        Args:
+            ttl: Seconds a snapshot stays valid (0 disables caching)
+            max_entries: Maximum number of cached principals
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Principal | None:
+        """
+        Get a cached principal.
+
+        Args:
+            user_id: Session user id
+
+        Returns:
+            Principal or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return principal
+
+    def set(self, principal: Principal) -> None:
+        """Store a principal, evicting the least recently used entries."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[principal.id] = (time.monotonic() + self.ttl, principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, namespace: str) -> None:
+        """
+        Invalidation bus handler.
+
+        Args:
+            namespace: ``users`` or ``*`` (drop all), ``users:<id>`` (drop one)
+        """
+        if namespace in (NAMESPACE, ALL_NAMESPACES):
+            with self._lock:
+                self._entries.clear()
+            return
+        prefix, _, user_id = namespace.partition(":")
+        if prefix == NAMESPACE and user_id.isdigit():
+            with self._lock:
+                self._entries.pop(int(user_id), None)
+
+
+def user_namespace(user_id: int) -> str:
+    """Invalidation namespace of one user's principal."""
+    return f"{NAMESPACE}:{user_id}"
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache()
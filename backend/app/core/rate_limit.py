@@ -0,0 +1,298 @@
+"""Token-bucket rate limiting for costly public endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import translate
+from functools import lru_cache
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.core.redis_client import RedisError, get_redis
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    """Token bucket applied per client IP to the requests matching a route."""
+
+    method: str
+    pattern: str
+    capacity: int
+    period: float
+
+    @property
+    def name(self) -> str:
+        """Policy identifier, also used in bucket keys."""
+        return f"{self.method} {self.pattern}"
+
+    @property
+    def rate(self) -> float:
+        """Tokens refilled per second."""
+        return self.capacity / self.period
+
+    @classmethod
+    def parse(cls, route: str, limit: str) -> "RatePolicy":
+        """
+        Parse one entry of ``RATE_LIMIT_POLICIES``.
+
+        Args:
+            route: ``METHOD /path/pattern`` (``*`` matches any characters)
+            limit: ``N/period`` with period second, minute, hour or day
+
+        Returns:
+            Rate policy
+
+        Raises:
+            ValueError: If the entry is malformed
+        """
+        method, _, pattern = route.strip().partition(" ")
+        count, _, period = limit.strip().partition("/")
+        if not pattern.startswith("/") or not count.isdigit() or int(count) < 1 or period not in PERIODS:
+            raise ValueError(
+                f"Invalid rate limit policy {route!r}: {limit!r} "
+                "(expected 'METHOD /path' and 'N/second|minute|hour|day')"
+            )
+        return cls(method.upper(), pattern.strip(), int(count), PERIODS[period])
+
+
+class BucketStore(ABC):
+    """
+    Interface for token-bucket stores.
+
+    ``take`` must refill and consume atomically so concurrent requests
+    cannot spend the same token twice.
+    """
+
+    # Whether calls do network I/O and must be kept off the event loop
+    blocking = False
+
+    @abstractmethod
+    def take(self, key: str, capacity: int, rate: float) -> float:
+        """
+        Take one token from a bucket.
+
+        Args:
+            key: Bucket key
+            capacity: Bucket size (burst)
+            rate: Tokens refilled per second
+
+        Returns:
+            0 if a token was taken, else seconds until one is available
+        """
+
+
+class MemoryBucketStore(BucketStore):
+    """
+    Process-local store; limits apply per worker.
+
+    A bucket is just its token count and the time it was last refilled,
+    and refills are computed lazily on access, so ``take`` is O(1). Buckets
+    are kept in least-recently-used order and the idlest ones are evicted
+    beyond ``max_keys``; an evicted bucket was idle, so it would have been
+    refilled to capacity by its next request anyway.
+    """
+
+    def __init__(self, max_keys: int = settings.RATE_LIMIT_MAX_KEYS):
+        """
+        Initialize memory store.
+
+        Args:
+            max_keys: Hard cap on tracked buckets
+        """
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: int, rate: float) -> float:
+        """Take one token from a bucket."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * rate)
+            retry_after = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                retry_after = (1 - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return retry_after
+
+
+# One hash (tokens, ts) per bucket, expiring once it would be full again.
+# ARGV: capacity, rate (tokens/ms), now (ms). Returns ms until a token.
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local retry = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate))
+return retry
+"""
+
+
+class RedisBucketStore(BucketStore):
+    """
+    Store shared by every worker, one Redis hash per bucket.
+
+    Refill and consume run in a single Lua script, so they are atomic
+    across workers. Buckets expire once they would be full again, so idle
+    clients take no memory. Any server speaking the Redis protocol and
+    supporting ``EVAL`` can serve as a local stand-in. While Redis is
+    unreachable requests are let through rather than failed: the limits
+    protect the backend, and an outage of the limiter should not take the
+    site down with it.
+    """
+
+    blocking = True
+
+    def __init__(self, prefix: str = "rate-limit:"):
+        """
+        Initialize Redis store.
+
+        Args:
+            prefix: Key prefix for bucket hashes
+        """
+        self.client = get_redis()
+        self.prefix = prefix
+        self._script = self.client.register_script(_TOKEN_BUCKET_SCRIPT)
+
+    def take(self, key: str, capacity: int, rate: float) -> float:
+        """Take one token from a bucket (always succeeds if Redis fails)."""
+        try:
+            retry_ms = self._script(
+                keys=[self.prefix + key],
+                args=[capacity, repr(rate / 1000), int(time.time() * 1000)],
+            )
+        except RedisError as e:
+            logger.warning(f"Rate limit store unavailable, letting request through: {e}")
+            return 0.0
+        return int(retry_ms) / 1000
+
+
+@lru_cache
+def get_bucket_store(name: str = settings.RATE_LIMIT_BACKEND) -> BucketStore:
+    """
+    Get the configured bucket store.
+
+    Args:
+        name: Store name (memory, redis)
+
+    Returns:
+        Bucket store instance (shared within the process)
+
+    Raises:
+        ValueError: If the store name is unknown
+    """
+    if name == "memory":
+        return MemoryBucketStore()
+    if name == "redis":
+        return RedisBucketStore()
+    raise ValueError(f"Unknown rate limit backend: {name}")
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying ``RATE_LIMIT_POLICIES`` before routing.
+
+    A request matching a policy takes a token from the bucket of its
+    (policy, client IP) pair. Once the bucket is empty the request is
+    answered with 429 and ``Retry-After`` straight from the middleware:
+    the body is never read and no dependency, database session or handler
+    runs, so a shed request costs one bucket update.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policies: dict[str, str] = settings.RATE_LIMIT_POLICIES,
+        enabled: bool = settings.RATE_LIMIT_ENABLED,
+    ):
+        """
+        Initialize rate limit middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            policies: ``{"METHOD /path/pattern": "N/period"}``
+            enabled: Pass every request through when False
+        """
+        self.app = app
+        self.enabled = enabled
+        # Policies grouped by method, path patterns compiled once
+        self._policies: dict[str, list[tuple[re.Pattern, RatePolicy]]] = {}
+        for route, limit in policies.items():
+            policy = RatePolicy.parse(route, limit)
+            self._policies.setdefault(policy.method, []).append(
+                (re.compile(translate(policy.pattern)), policy)
+            )
+
+    def match(self, method: str, path: str) -> RatePolicy | None:
+        """
+        Find the policy applying to a request.
+
+        Args:
+            method: HTTP method
+            path: Request path
+
+        Returns:
+            First matching policy, or None
+        """
+        for pattern, policy in self._policies.get(method, ()):
+            if pattern.match(path):
+                return policy
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Shed over-limit requests, pass everything else through."""
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.match(scope["method"], scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        key = f"{policy.name}:{client[0] if client else 'unknown'}"
+        store = get_bucket_store()
+        if store.blocking:
+            retry_after = await asyncio.to_thread(store.take, key, policy.capacity, policy.rate)
+        else:
+            retry_after = store.take(key, policy.capacity, policy.rate)
+        if retry_after <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse(
+            {"detail": "Too many requests, please try again later"},
+            status_code=429,
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+        await response(scope, receive, send)
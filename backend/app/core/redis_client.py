@@ -0,0 +1,39 @@
+"""Shared Redis client for cross-worker backends."""
+
+from functools import lru_cache
+
+try:
+    import redis as _redis
+    from redis.exceptions import RedisError
+except ImportError:
+    _redis = None
+
+    class RedisError(Exception):
+        """Placeholder so ``except RedisError`` works without redis installed."""
+from app.config import settings
+
+
+@lru_cache
+def get_redis(url: str = settings.REDIS_URL):
+    """
+    Get a Redis client for the given URL.
+
+    Any server speaking the Redis protocol works, so a local stand-in can
+    serve development and tests. Connects and replies time out after
+    ``REDIS_SOCKET_TIMEOUT``, so an unreachable server raises
+    ``RedisError`` instead of hanging a request.
+
+    Args:
+        url: Redis connection URL
+
+    Returns:
+        Redis client (one per URL, shared within the process)
+    """
+    if _redis is None:
+        raise ImportError("redis is not installed")
+
+    return _redis.Redis.from_url(
+        url,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
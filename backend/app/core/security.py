@@ -14,6 +14,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against a hash.
     
+    Blocks for the whole bcrypt computation; from async code use
+    ``password_hasher.verify()`` instead.
+    
     Args:
         plain_password: Plain text password
         hashed_password: Hashed password
@@ -34,12 +37,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
-def get_password_hash(password: str) -> str:
+def get_password_hash(password: str, rounds: int = settings.BCRYPT_ROUNDS) -> str:
     """
     Hash a password.
     
+    Blocks for the whole bcrypt computation; from async code use
+    ``password_hasher.hash()`` instead.
+    
     Args:
         password: Plain text password
+        rounds: bcrypt cost factor (log2 of the iterations)
         
     Returns:
         Hashed password
@@ -52,11 +59,28 @@ def get_password_hash(password: str) -> str:
     if len(password_bytes) > 72:
         password_bytes = password_bytes[:72]
     
-    salt = _bcrypt.gensalt()
+    salt = _bcrypt.gensalt(rounds)
     hashed = _bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
 
+def password_needs_rehash(hashed_password: str, rounds: int = settings.BCRYPT_ROUNDS) -> bool:
+    """
+    Check whether a hash was made with a different cost factor.
+    
+    Args:
+        hashed_password: bcrypt hash (``$2b$<rounds>$...``)
+        rounds: Configured bcrypt cost factor
+        
+    Returns:
+        True if the password should be hashed again
+    """
+    try:
+        return int(hashed_password.split("$")[2]) != rounds
+    except (IndexError, ValueError):
+        return True
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
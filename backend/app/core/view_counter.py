@@ -0,0 +1,159 @@
+"""Write-behind view counter for projects, news and about pages."""
+
+import logging
+import threading
+
+from sqlalchemy import case, update
+
+from app.config import settings
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """
+    Buffer view increments in memory and flush them in batches.
+
+    Each worker keeps its own buffer. A background thread periodically
+    writes the buffered counts with one ``UPDATE ... SET views = views + n``
+    statement per table, so concurrent hits never lose an update and a busy
+    page no longer costs a read-modify-write transaction per request.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = settings.VIEW_COUNTER_FLUSH_INTERVAL,
+        max_pending: int = settings.VIEW_COUNTER_MAX_PENDING,
+    ):
+        """
+        Initialize view counter.
+
+        Args:
+            flush_interval: Seconds between background flushes
+            max_pending: Number of buffered rows that triggers an early flush
+        """
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: dict[type, dict[str | int, int]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def increment(self, model: type, id: str | int, current_views: int) -> int:
+        """
+        Buffer one view for a record.
+
+        Args:
+            model: SQLAlchemy model class with ``id`` and ``views`` columns
+            id: Record identifier
+            current_views: Last known view count read from the database
+
+        Returns:
+            View count including the buffered increments
+        """
+        with self._lock:
+            bucket = self._pending.setdefault(model, {})
+            if id not in bucket:
+                bucket[id] = 0
+                self._size += 1
+            bucket[id] += 1
+            total = current_views + bucket[id]
+            should_flush = self._size >= self.max_pending
+
+        if should_flush:
+            self.flush()
+        return total
+
+    def pending(self, model: type, id: str | int) -> int:
+        """
+        Get the number of buffered views for a record.
+
+        Args:
+            model: SQLAlchemy model class
+            id: Record identifier
+
+        Returns:
+            Buffered view count not yet written to the database
+        """
+        with self._lock:
+            return self._pending.get(model, {}).get(id, 0)
+
+    def flush(self) -> int:
+        """
+        Write buffered increments to the database.
+
+        Returns:
+            Number of rows updated
+        """
+        with self._lock:
+            batches = self._pending
+            self._pending = {}
+            self._size = 0
+
+        if not batches:
+            return 0
+
+        db = SessionLocal()
+        try:
+            updated = 0
+            for model, counts in batches.items():
+                stmt = (
+                    update(model)
+                    .where(model.id.in_(list(counts)))
+                    # Keep updated_at untouched: a view is not a content edit
+                    .values(
+                        views=model.views + case(counts, value=model.id, else_=0),
+                        updated_at=model.updated_at,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                updated += db.execute(stmt).rowcount
+            db.commit()
+            return updated
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to flush view counts: {e}")
+            self._requeue(batches)
+            return 0
+        finally:
+            db.close()
+
+    def _requeue(self, batches: dict[type, dict[str | int, int]]) -> None:
+        """Merge unflushed counts back into the buffer."""
+        with self._lock:
+            for model, counts in batches.items():
+                bucket = self._pending.setdefault(model, {})
+                for id, count in counts.items():
+                    if id not in bucket:
+                        bucket[id] = 0
+                        self._size += 1
+                    bucket[id] += count
+
+    def _run(self) -> None:
+        """Background loop flushing the buffer every interval."""
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def start(self) -> None:
+        """Start the background flush thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="view-counter-flush", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and flush remaining counts."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.flush_interval + 5)
+            self._thread = None
+        self.flush()
+
+
+# Global view counter instance
+view_counter = ViewCounter()
@@ -1,26 +1,81 @@
 """Database connection and session management."""
 
-from typing import Generator
-from sqlalchemy import create_engine
+from typing import AsyncGenerator, Generator
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from app.config import settings
 
 
+def _engine_options() -> dict:
+    """Engine keyword arguments for the configured dialect."""
+    if settings.is_sqlite:
+        if make_url(settings.database_url).database in (None, "", ":memory:"):
+            # An in-memory database only exists inside its one connection
+            return {"connect_args": {"check_same_thread": False}, "poolclass": StaticPool}
+        # Persistent connections shared across threads; each one maps the
+        # same file pages (mmap), so readers run at in-process speed
+        return {
+            "connect_args": {"check_same_thread": False},
+            "pool_size": settings.SQLITE_POOL_SIZE,
+            "max_overflow": 0,
+        }
+    return {
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+    }
+
+
+def _tune_sqlite(dbapi_connection, connection_record) -> None:
+    """Apply read-optimized SQLite pragmas to every new connection."""
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers run concurrently with the single writer
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 # Create database engine
 engine = create_engine(
     settings.database_url,
     echo=True,
-    pool_pre_ping=True,
-    pool_recycle=3600,
+    **_engine_options(),
 )
 
-# Create session factory
+# Create session factory; objects stay loaded after commit, so a created
+# record is returned without a refresh SELECT
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine,
 )
 
+# Create async database engine (used by async def routes)
+async_engine = create_async_engine(
+    settings.async_database_url,
+    echo=True,
+    **_engine_options(),
+)
+
+if settings.is_sqlite:
+    event.listen(engine, "connect", _tune_sqlite)
+    event.listen(async_engine.sync_engine, "connect", _tune_sqlite)
+
+# Create async session factory; objects stay usable after commit without
+# an implicit (blocking) refresh
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base class for ORM models
 Base = declarative_base()
 
@@ -39,6 +94,20 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get an async database session.
+    
+    Use from ``async def`` routes so database round trips never block
+    the event loop.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def create_tables() -> None:
     """Create all database tables."""
     Base.metadata.create_all(bind=engine)
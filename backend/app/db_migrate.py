@@ -1,134 +1,243 @@
 """
-Automatic database migration utility.
-自動資料庫遷移工具
+Versioned database migrations.
+版本化資料庫遷移
+
+Migrations live in ``app/migrations`` as ``mNNNN_<name>.py`` modules, each
+with an ``upgrade(connection)`` function. They are applied in version
+order and recorded in the ``schema_version`` table. An advisory lock makes
+sure only one process migrates at a time; the others wait for it and then
+find nothing left to do.
+
+Under gunicorn, migrations run once in the master process (see
+``gunicorn.conf.py``); workers only compare the recorded version with the
+latest migration at startup.
+
+Usage:
+    uv run python -m app.db_migrate          # apply pending migrations
+    uv run python -m app.db_migrate --check  # show versions, exit 1 if behind
 """
 
-from sqlalchemy import create_engine, text, inspect
-from app.config import settings
+import argparse
+import hashlib
+import importlib
 import logging
+import pkgutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import ModuleType
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: development only, a single process migrates
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.engine import Connection
+
+from app import migrations as migrations_package
+from app.config import settings
+from app.database import engine
 
 logger = logging.getLogger(__name__)
 
+LOCK_NAME = "studio_schema_migrate"
+
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A migration module and its version."""
+
+    version: int
+    name: str
+    module: ModuleType
+
+    def upgrade(self, connection: Connection) -> None:
+        """Apply the migration on ``connection``."""
+        self.module.upgrade(connection)
+
 
-def auto_migrate_to_longtext():
+def load_migrations() -> list[Migration]:
     """
-    Automatically migrate TEXT columns to LONGTEXT on startup.
-    Also rename image columns to 'image' for consistency.
-    在應用啟動時自動將 TEXT 欄位升級為 LONGTEXT，並統一圖片欄位名稱。
+    Discover the migration modules in ``app/migrations``.
+
+    Returns:
+        Migrations sorted by version
+
+    Raises:
+        RuntimeError: If two modules share a version number
     """
-    
-    # LONGTEXT migrations
-    migrations = [
-        ("projects", "description"),
-        ("news", "excerpt"),
-        ("news", "content"),
-        ("about_us", "subtitle"),
-        ("about_us", "description"),
-    ]
-    
-    # Image column renames
-    image_migrations = [
-        ("projects", "thumbnail_url", "image"),
-        ("news", "image_url", "image"),
-    ]
-    
-    try:
-        engine = create_engine(settings.database_url)
-        
-        with engine.connect() as connection:
-            # Check if tables exist first
-            inspector = inspect(engine)
-            existing_tables = inspector.get_table_names()
-            
-            migrated = []
-            skipped = []
-            renamed = []
-            
-            # First, migrate TEXT to LONGTEXT
-            for table, column in migrations:
-                # Skip if table doesn't exist yet
-                if table not in existing_tables:
-                    continue
-                
-                try:
-                    # Check current column type
-                    result = connection.execute(text(f"""
-                        SELECT COLUMN_TYPE 
-                        FROM INFORMATION_SCHEMA.COLUMNS
-                        WHERE TABLE_SCHEMA = '{settings.DB_NAME}'
-                        AND TABLE_NAME = '{table}'
-                        AND COLUMN_NAME = '{column}'
-                    """))
-                    
-                    row = result.fetchone()
-                    if row:
-                        column_type = row[0].lower()
-                        
-                        # Migrate if it's TEXT (not LONGTEXT)
-                        if column_type == 'text':
-                            connection.execute(text(
-                                f"ALTER TABLE {table} MODIFY {column} LONGTEXT"
-                            ))
-                            connection.commit()
-                            migrated.append(f"{table}.{column}")
-                            logger.info(f"✅ Migrated {table}.{column} to LONGTEXT")
-                        elif 'longtext' in column_type:
-                            skipped.append(f"{table}.{column}")
-                        
-                except Exception as e:
-                    logger.warning(f"⚠️  Could not migrate {table}.{column}: {e}")
-            
-            # Then, rename image columns
-            for table, old_col, new_col in image_migrations:
-                if table not in existing_tables:
+    found = []
+    for info in pkgutil.iter_modules(migrations_package.__path__):
+        prefix, _, name = info.name.partition("_")
+        if not (prefix.startswith("m") and prefix[1:].isdigit()):
+            continue
+        module = importlib.import_module(f"{migrations_package.__name__}.{info.name}")
+        found.append(Migration(int(prefix[1:]), name, module))
+    found.sort(key=lambda migration: migration.version)
+    versions = [migration.version for migration in found]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"Duplicate migration versions in {migrations_package.__name__}")
+    return found
+
+
+def latest_version() -> int:
+    """Version of the newest migration shipped with the code."""
+    migrations = load_migrations()
+    return migrations[-1].version if migrations else 0
+
+
+def current_version(connection: Connection) -> int:
+    """
+    Version recorded in the database.
+
+    Args:
+        connection: Database connection
+
+    Returns:
+        Highest applied migration version (0 for a new database)
+    """
+    if not inspect(connection).has_table(schema_version.name):
+        return 0
+    return connection.execute(
+        select(func.coalesce(func.max(schema_version.c.version), 0))
+    ).scalar_one()
+
+
+@contextmanager
+def migration_lock(connection: Connection, timeout: int = settings.DB_MIGRATION_LOCK_TIMEOUT):
+    """
+    Hold the migration advisory lock for the duration of the block.
+
+    MySQL uses ``GET_LOCK`` and PostgreSQL ``pg_advisory_lock`` (both tied to
+    the connection, so a crashed process releases them). SQLite is only
+    used on a single host, so a file lock in the temp directory is enough.
+
+    Args:
+        connection: Connection the lock is taken on
+        timeout: Seconds to wait for another process to finish (MySQL)
+
+    Raises:
+        TimeoutError: If the lock could not be acquired in time
+    """
+    dialect = connection.dialect.name
+    if dialect == "mysql":
+        acquired = connection.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"), {"name": LOCK_NAME, "timeout": timeout}
+        ).scalar()
+        if acquired != 1:
+            raise TimeoutError(f"Could not acquire migration lock within {timeout}s")
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+    elif dialect == "postgresql":
+        key = int.from_bytes(hashlib.sha256(LOCK_NAME.encode()).digest()[:8], "big", signed=True)
+        connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": key})
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+    elif fcntl is not None:
+        database = hashlib.sha256(settings.database_url.encode()).hexdigest()[:16]
+        path = Path(tempfile.gettempdir()) / f"{LOCK_NAME}-{database}.lock"
+        with open(path, "w") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+    else:
+        yield
+
+
+def migrate() -> int:
+    """
+    Apply all pending migrations.
+
+    Each migration is recorded in ``schema_version`` right after it
+    succeeds, so an interrupted run resumes at the failed migration.
+
+    Returns:
+        Schema version after migrating
+    """
+    migrations = load_migrations()
+    with engine.connect() as connection:
+        with migration_lock(connection):
+            schema_version.create(connection, checkfirst=True)
+            connection.commit()
+            version = current_version(connection)
+            for migration in migrations:
+                if migration.version <= version:
                     continue
-                
+                logger.info(f"⏳ Applying migration {migration.version:04d}_{migration.name}")
                 try:
-                    # Check if old column exists and new column doesn't
-                    result = connection.execute(text(f"""
-                        SELECT COLUMN_NAME 
-                        FROM INFORMATION_SCHEMA.COLUMNS
-                        WHERE TABLE_SCHEMA = '{settings.DB_NAME}'
-                        AND TABLE_NAME = '{table}'
-                        AND COLUMN_NAME IN ('{old_col}', '{new_col}')
-                    """))
-                    
-                    existing_cols = [row[0] for row in result.fetchall()]
-                    
-                    if old_col in existing_cols and new_col not in existing_cols:
-                        connection.execute(text(
-                            f"ALTER TABLE {table} CHANGE {old_col} {new_col} VARCHAR(500)"
-                        ))
-                        connection.commit()
-                        renamed.append(f"{table}.{old_col} → {new_col}")
-                        logger.info(f"✅ Renamed {table}.{old_col} to {new_col}")
-                    
-                except Exception as e:
-                    logger.warning(f"⚠️  Could not rename {table}.{old_col}: {e}")
-            
-            if migrated:
-                logger.info(f"🎉 LONGTEXT migration: {len(migrated)} columns upgraded")
-                for col in migrated:
-                    logger.info(f"   - {col}")
-            
-            if renamed:
-                logger.info(f"🎉 Column rename: {len(renamed)} columns renamed")
-                for col in renamed:
-                    logger.info(f"   - {col}")
-            
-            if skipped:
-                logger.debug(f"Already LONGTEXT: {len(skipped)} columns")
-                
-        engine.dispose()
-        return True
-        
-    except Exception as e:
-        logger.error(f"❌ Auto-migration failed: {e}")
-        return False
+                    migration.upgrade(connection)
+                    connection.execute(schema_version.insert().values(
+                        version=migration.version,
+                        name=migration.name,
+                        applied_at=datetime.utcnow(),
+                    ))
+                    connection.commit()
+                except Exception:
+                    connection.rollback()
+                    logger.error(f"❌ Migration {migration.version:04d}_{migration.name} failed")
+                    raise
+                version = migration.version
+                logger.info(f"✅ Applied migration {migration.version:04d}_{migration.name}")
+    return version
+
+
+def ensure_schema(auto_migrate: bool = settings.DB_AUTO_MIGRATE) -> int:
+    """
+    Startup check: compare the database version with the latest migration.
+
+    When the schema is current this costs a single small query. A database
+    that is behind is migrated (under the lock) if ``auto_migrate`` is set.
+
+    Args:
+        auto_migrate: Apply pending migrations instead of failing
+
+    Returns:
+        Schema version of the database
+
+    Raises:
+        RuntimeError: If the schema is behind and ``auto_migrate`` is off
+    """
+    latest = latest_version()
+    with engine.connect() as connection:
+        version = current_version(connection)
+    if version >= latest:
+        return version
+    if not auto_migrate:
+        raise RuntimeError(
+            f"Database schema is at version {version}, the code expects {latest}. "
+            "Run `uv run python -m app.db_migrate` first."
+        )
+    return migrate()
 
 
 if __name__ == "__main__":
-    # Can be run standalone for testing
     logging.basicConfig(level=logging.INFO)
-    auto_migrate_to_longtext()
+    parser = argparse.ArgumentParser(description="Apply database migrations")
+    parser.add_argument("--check", action="store_true", help="Only show the schema versions")
+    args = parser.parse_args()
+
+    if args.check:
+        with engine.connect() as connection:
+            version = current_version(connection)
+        latest = latest_version()
+        print(f"Database version: {version}, latest migration: {latest}")
+        sys.exit(0 if version >= latest else 1)
 
+    print(f"Database schema is at version {migrate()}")
@@ -2,66 +2,67 @@
 
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
-from app.database import SessionLocal
-from app.models.user import User, UserRole
+from sqlalchemy.ext.asyncio import AsyncSession
+# Session dependencies live in app.database; re-exported so overrides of
+# get_db / get_async_db apply to every route that uses them
+from app.database import get_async_db, get_db  # noqa: F401
+from app.models.user import User, UserRole, UserStatus
+from app.core.principal import Principal, principal_cache
 from app.core.security import decode_access_token
 
 
-def get_db():
-    """
-    Database session dependency.
-    
-    Yields:
-        Database session
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-def get_current_user_from_session(
+async def get_current_user_from_session(
     request: Request,
-    db: Session = Depends(get_db)
-) -> Optional[User]:
+    db: AsyncSession = Depends(get_async_db)
+) -> Optional[Principal]:
     """
     Get current user from session.
     
+    The snapshot comes from the principal cache when possible. The session
+    only checks out a connection on a cache miss, and it is the same
+    session the route itself receives from ``get_async_db``.
+    
     Args:
         request: FastAPI request object
         db: Database session
-        
+    
     Returns:
-        Current user or None
+        Current user principal or None
     """
     user_id = request.session.get("user_id")
     if not user_id:
         return None
     
-    user = db.query(User).filter(User.id == user_id).first()
-    return user
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    
+    user = await db.get(User, user_id)
+    if user is None:
+        return None
+    principal = Principal.from_user(user)
+    principal_cache.set(principal)
+    return principal
 
 
-def require_admin(
+async def require_admin(
     request: Request,
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
     """
     Require admin authentication.
     
     Args:
         request: FastAPI request object
         db: Database session
-        
+    
     Returns:
-        Admin user
-        
+        Admin user principal
+    
     Raises:
-        HTTPException: If not authenticated or not admin
+        HTTPException: If not authenticated, not admin or not active
     """
-    user = get_current_user_from_session(request, db)
+    user = await get_current_user_from_session(request, db)
     
     if not user:
         raise HTTPException(
@@ -75,5 +76,10 @@ def require_admin(
             detail="Not enough permissions"
         )
     
+    if user.status != UserStatus.ACTIVE:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is not active"
+        )
+    
     return user
-
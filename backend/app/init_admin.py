@@ -12,43 +12,51 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def ensure_admin_user(db: Session) -> None:
+    """
+    Create the default admin account, or restore its admin role.
+    
+    Args:
+        db: Database session (committed on change)
+    """
+    # Check if admin account already exists
+    existing_admin = db.query(User).filter(
+        User.email == "admin@admin.com"
+    ).first()
+    
+    if existing_admin:
+        logger.info("Admin account already exists, skipping creation")
+        # Update existing account to ensure it's admin role
+        if existing_admin.role != UserRole.ADMIN:
+            existing_admin.role = UserRole.ADMIN
+            existing_admin.status = UserStatus.ACTIVE
+            db.commit()
+            logger.info("Updated existing account to admin role")
+        return
+    
+    # Create new admin account
+    admin_user = User(
+        name="Admin",
+        email="admin@admin.com",
+        password_hash=get_password_hash("admin123"),
+        role=UserRole.ADMIN,
+        status=UserStatus.ACTIVE
+    )
+    
+    db.add(admin_user)
+    db.commit()
+    
+    logger.info("Admin account created successfully!")
+    logger.info("  Email: admin@admin.com")
+    logger.info("  Password: admin123")
+    logger.info(f"  Role: {admin_user.role.value}")
+
+
 def init_admin_user():
-    """Create default admin account."""
+    """Create default admin account (also applied by migration 0004)."""
     db: Session = SessionLocal()
     try:
-        # Check if admin account already exists
-        existing_admin = db.query(User).filter(
-            User.email == "admin@admin.com"
-        ).first()
-        
-        if existing_admin:
-            logger.info("Admin account already exists, skipping creation")
-            # Update existing account to ensure it's admin role
-            if existing_admin.role != UserRole.ADMIN:
-                existing_admin.role = UserRole.ADMIN
-                existing_admin.status = UserStatus.ACTIVE
-                db.commit()
-                logger.info("Updated existing account to admin role")
-            return
-        
-        # Create new admin account
-        admin_user = User(
-            name="Admin",
-            email="admin@admin.com",
-            password_hash=get_password_hash("admin123"),
-            role=UserRole.ADMIN,
-            status=UserStatus.ACTIVE
-        )
-        
-        db.add(admin_user)
-        db.commit()
-        db.refresh(admin_user)
-        
-        logger.info("Admin account created successfully!")
-        logger.info("  Email: admin@admin.com")
-        logger.info("  Password: admin123")
-        logger.info(f"  Role: {admin_user.role.value}")
-        
+        ensure_admin_user(db)
     except Exception as e:
         logger.error(f"Failed to create admin account: {e}")
         db.rollback()
@@ -56,7 +64,6 @@ def init_admin_user():
     finally:
         db.close()
 
-
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO,
@@ -10,14 +10,26 @@ from starlette.middleware.sessions import SessionMiddleware
 import logging
 
 from app.config import settings
-from app.database import create_tables
 from app.routers import projects, news, about, banner, feedback
 from app.routers.admin import router as admin_router
-from app.init_admin import init_admin_user
-from app.db_migrate import auto_migrate_to_longtext
+from app.db_migrate import ensure_schema
+from app.core.view_counter import view_counter
+from app.core.cache import response_cache
+from app.core.principal import principal_cache
+from app.core.invalidation import invalidation_bus
+from app.core.captcha import captcha_pool
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.outbox import email_outbox
+from app.core.password_hasher import password_hasher
+from app.core.email import email_service
 
 logger = logging.getLogger(__name__)
 
+# Drop cached responses whenever a namespace is invalidated
+invalidation_bus.subscribe(response_cache.invalidate)
+# ...and admin principals whenever a user changes
+invalidation_bus.subscribe(principal_cache.invalidate)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -25,29 +37,34 @@ async def lifespan(app: FastAPI):
     Application lifespan context manager.
     Handles startup and shutdown events.
     """
-    # Startup: Create database tables
-    print("Creating database tables...")
-    create_tables()
-    print("Database tables created successfully!")
-    
-    # Auto-migrate TEXT to LONGTEXT
+    # Startup: Check the schema version. Under gunicorn, migrations already
+    # ran once in the master (gunicorn.conf.py); otherwise the first process
+    # to start applies them while holding the migration lock.
     print("Checking database schema...")
-    try:
-        auto_migrate_to_longtext()
-        print("Database schema check completed!")
-    except Exception as e:
-        logger.warning(f"Schema migration warning: {e}")
+    version = ensure_schema()
+    print(f"Database schema is at version {version}")
+    
+    # Start batched view count flushing
+    view_counter.start()
     
-    # Initialize admin user
-    try:
-        init_admin_user()
-        print("Admin user initialized!")
-    except Exception as e:
-        logger.warning(f"Failed to initialize admin user: {e}")
+    # Listen for cache invalidations published by other workers
+    invalidation_bus.start()
+    
+    # Pre-render captcha images off the request path
+    captcha_pool.start()
+    
+    # Deliver queued emails in the background
+    email_outbox.start()
     
     yield
     
-    # Shutdown: Cleanup if needed
+    # Shutdown: Flush buffered view counts, stop background threads
+    view_counter.stop()
+    invalidation_bus.stop()
+    captcha_pool.stop()
+    email_outbox.stop()
+    password_hasher.shutdown()
+    email_service.close()
     print("Application shutdown")
 
 
@@ -67,6 +84,9 @@ app.add_middleware(
     same_site="lax"
 )
 
+# Shed over-limit requests before routing (inside CORS so 429s stay readable)
+app.add_middleware(RateLimitMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
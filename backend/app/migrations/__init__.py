@@ -0,0 +1,8 @@
+"""
+Database migrations, applied in order by ``app.db_migrate``.
+
+Add a migration as ``mNNNN_<name>.py`` with the next free number and an
+``upgrade(connection)`` function. Migration 0001 creates missing tables
+from the current models, so later migrations must check the schema before
+changing it (a new install already has the latest columns and indexes).
+"""
@@ -0,0 +1,11 @@
+"""Create every table that does not exist yet."""
+
+from sqlalchemy.engine import Connection
+
+import app.models  # noqa: F401 - registers all tables on Base.metadata
+from app.database import Base
+
+
+def upgrade(connection: Connection) -> None:
+    """Create missing tables (with their indexes) from the models."""
+    Base.metadata.create_all(bind=connection)
@@ -0,0 +1,73 @@
+"""
+Bring databases created by older releases up to date.
+舊版資料庫升級：圖片欄位更名、新增 views 欄位、TEXT 升級為 LONGTEXT
+
+Replaces the standalone ``rename_image_columns.py``, ``migrate_add_views.py``
+and ``migrate_to_longtext.py`` scripts.
+"""
+
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects.mysql import LONGTEXT, TEXT as MYSQL_TEXT
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+# (table, old column, new column)
+IMAGE_RENAMES = [
+    ("projects", "thumbnail_url", "image"),
+    ("news", "image_url", "image"),
+]
+
+# (table, column, DDL type) added when missing
+ADDED_COLUMNS = [
+    ("about_us", "image", "VARCHAR(500)"),
+    ("about_us", "views", "INTEGER DEFAULT 0 NOT NULL"),
+    ("news", "views", "INTEGER DEFAULT 0 NOT NULL"),
+    ("projects", "views", "INTEGER DEFAULT 0 NOT NULL"),
+]
+
+# TEXT columns upgraded to LONGTEXT on MySQL (SQLite TEXT is unbounded)
+LONGTEXT_COLUMNS = [
+    ("projects", "description"),
+    ("news", "excerpt"),
+    ("news", "content"),
+    ("about_us", "subtitle"),
+    ("about_us", "description"),
+]
+
+
+def upgrade(connection: Connection) -> None:
+    """Rename, add and widen legacy columns that are not up to date."""
+    is_mysql = connection.dialect.name == "mysql"
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    columns = {
+        table: {column["name"]: column["type"] for column in inspector.get_columns(table)}
+        for table in existing_tables
+    }
+
+    for table, old_col, new_col in IMAGE_RENAMES:
+        table_columns = columns.get(table, {})
+        if old_col in table_columns and new_col not in table_columns:
+            if is_mysql:
+                statement = f"ALTER TABLE {table} CHANGE {old_col} {new_col} VARCHAR(500)"
+            else:
+                statement = f"ALTER TABLE {table} RENAME COLUMN {old_col} TO {new_col}"
+            connection.execute(text(statement))
+            table_columns[new_col] = table_columns.pop(old_col)
+            logger.info(f"✅ Renamed {table}.{old_col} to {new_col}")
+
+    for table, column, ddl in ADDED_COLUMNS:
+        if table in columns and column not in columns[table]:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+            logger.info(f"✅ Added {table}.{column}")
+
+    if not is_mysql:
+        return
+    for table, column in LONGTEXT_COLUMNS:
+        column_type = columns.get(table, {}).get(column)
+        if isinstance(column_type, MYSQL_TEXT) and not isinstance(column_type, LONGTEXT):
+            connection.execute(text(f"ALTER TABLE {table} MODIFY {column} LONGTEXT"))
+            logger.info(f"✅ Migrated {table}.{column} to LONGTEXT")
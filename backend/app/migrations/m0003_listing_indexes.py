@@ -0,0 +1,25 @@
+"""Create the listing indexes on tables that predate them."""
+
+import logging
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+import app.models  # noqa: F401 - registers all tables on Base.metadata
+from app.database import Base
+
+logger = logging.getLogger(__name__)
+
+
+def upgrade(connection: Connection) -> None:
+    """Create model indexes that existing tables lack (matched by name)."""
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                index.create(connection)
+                logger.info(f"✅ Created index {index.name} on {table.name}")
@@ -0,0 +1,12 @@
+"""Create the default admin account."""
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.init_admin import ensure_admin_user
+
+
+def upgrade(connection: Connection) -> None:
+    """Create (or re-activate) admin@admin.com in the migration transaction."""
+    with Session(bind=connection) as db:
+        ensure_admin_user(db)
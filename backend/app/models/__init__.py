@@ -6,6 +6,8 @@ from app.models.about import AboutUs
 from app.models.banner import Banner, PageTypeEnum
 from app.models.user import User, UserRole, UserStatus
 from app.models.feedback import Feedback
+from app.models.captcha import Captcha
+from app.models.outbox import OutboxMessage, OutboxStatus
 
-__all__ = ["Project", "CategoryEnum", "News", "AboutUs", "Banner", "PageTypeEnum", "User", "UserRole", "UserStatus", "Feedback"]
+__all__ = ["Project", "CategoryEnum", "News", "AboutUs", "Banner", "PageTypeEnum", "User", "UserRole", "UserStatus", "Feedback", "Captcha", "OutboxMessage", "OutboxStatus"]
 
@@ -1,8 +1,8 @@
 """About Us model for dynamic content management."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime
-from sqlalchemy.dialects.mysql import LONGTEXT
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Index
+from app.models.types import LongText
 from app.database import Base
 
 
@@ -10,11 +10,15 @@ class AboutUs(Base):
     """AboutUs model for managing About page content."""
     
     __tablename__ = "about_us"
+    __table_args__ = (
+        # get_latest(): newest by (updated_at, id)
+        Index("ix_about_us_updated_at_id", "updated_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String(255), nullable=True)
-    subtitle = Column(LONGTEXT, nullable=True)
-    description = Column(LONGTEXT, nullable=True)
+    subtitle = Column(LongText, nullable=True)
+    description = Column(LongText, nullable=True)
     image = Column(String(500), nullable=True)
     contact_email = Column(String(255), nullable=True)
     views = Column(Integer, default=0, nullable=False)
@@ -0,0 +1,19 @@
+"""Captcha model for the shared captcha store."""
+
+from sqlalchemy import Column, String, DateTime, LargeBinary
+from app.database import Base
+
+
+class Captcha(Base):
+    """Pending captcha shared by all workers (database captcha store)."""
+    
+    __tablename__ = "captchas"
+    
+    id = Column(String(36), primary_key=True)
+    answer = Column(String(16), nullable=False)
+    image = Column(LargeBinary, nullable=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    
+    def __repr__(self) -> str:
+        """String representation of the captcha."""
+        return f"<Captcha(id={self.id}, expires_at={self.expires_at})>"
@@ -1,7 +1,7 @@
 """Feedback model for user feedback and inquiries."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index
 from app.database import Base
 
 
@@ -9,6 +9,11 @@ class Feedback(Base):
     """Feedback model for user feedback and inquiries."""
     
     __tablename__ = "feedback"
+    __table_args__ = (
+        # Unread and full listings, both ordered by (created_at, id) DESC
+        Index("ix_feedback_is_read_created_at_id", "is_read", "created_at", "id"),
+        Index("ix_feedback_created_at_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     name = Column(String(100), nullable=False)
@@ -1,8 +1,8 @@
 """News model for articles and updates."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime
-from sqlalchemy.dialects.mysql import LONGTEXT
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Index
+from app.models.types import LongText
 from app.database import Base
 
 
@@ -10,11 +10,15 @@ class News(Base):
     """News model representing articles and updates."""
     
     __tablename__ = "news"
+    __table_args__ = (
+        # Listing order: (date, id) DESC
+        Index("ix_news_date_id", "date", "id"),
+    )
     
     id = Column(String(50), primary_key=True, index=True)
     title = Column(String(255), nullable=False)
-    excerpt = Column(LONGTEXT, nullable=True)
-    content = Column(LONGTEXT, nullable=True)
+    excerpt = Column(LongText, nullable=True)
+    content = Column(LongText, nullable=True)
     date = Column(Date, nullable=True)
     image = Column(String(500), nullable=True)
     author = Column(String(100), nullable=True)
@@ -0,0 +1,41 @@
+"""Outbox model for asynchronous email delivery."""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Enum, Index
+from app.database import Base
+import enum
+
+
+class OutboxStatus(str, enum.Enum):
+    """Outbox message status enumeration."""
+    
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class OutboxMessage(Base):
+    """Queued email, rendered and delivered by the outbox worker."""
+    
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(50), nullable=False)
+    to_email = Column(String(255), nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(Enum(OutboxStatus), default=OutboxStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    claim_token = Column(String(36), nullable=True, index=True)
+    locked_until = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self) -> str:
+        """String representation of the outbox message."""
+        return f"<OutboxMessage(id={self.id}, kind={self.kind}, status={self.status})>"
@@ -1,8 +1,8 @@
 """Project model for games and websites."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Date, Enum, JSON, DateTime
-from sqlalchemy.dialects.mysql import LONGTEXT
+from sqlalchemy import Column, Integer, String, Text, Date, Enum, JSON, DateTime, Index
+from app.models.types import LongText
 from app.database import Base
 import enum
 
@@ -18,10 +18,15 @@ class Project(Base):
     """Project model representing games and websites."""
     
     __tablename__ = "projects"
+    __table_args__ = (
+        # Category pages and the full listing, both ordered by (date, id) DESC
+        Index("ix_projects_category_date_id", "category", "date", "id"),
+        Index("ix_projects_date_id", "date", "id"),
+    )
     
     id = Column(String(50), primary_key=True, index=True)
     title = Column(String(255), nullable=False)
-    description = Column(LONGTEXT, nullable=True)
+    description = Column(LongText, nullable=True)
     image = Column(String(500), nullable=True)
     category = Column(Enum(CategoryEnum), nullable=False)
     date = Column(Date, nullable=True)
@@ -0,0 +1,7 @@
+"""Dialect-neutral column types shared by the models."""
+
+from sqlalchemy import Text
+from sqlalchemy.dialects.mysql import LONGTEXT
+
+# Unbounded text: LONGTEXT on MySQL (TEXT caps at 64 KB), TEXT elsewhere
+LongText = Text().with_variant(LONGTEXT(), "mysql")
@@ -1,18 +1,32 @@
 """Repositories package initialization."""
 
-from app.repositories.base import BaseRepository
-from app.repositories.project import ProjectRepository
-from app.repositories.news import NewsRepository
-from app.repositories.about import AboutUsRepository
-from app.repositories.banner import BannerRepository
+from app.repositories.base import (
+    AsyncBaseRepository,
+    BaseRepository,
+    DuplicateKeyError,
+    InvalidCursorError,
+    Page,
+)
+from app.repositories.project import AsyncProjectRepository, ProjectRepository
+from app.repositories.news import AsyncNewsRepository, NewsRepository
+from app.repositories.about import AboutUsRepository, AsyncAboutUsRepository
+from app.repositories.banner import AsyncBannerRepository, BannerRepository
 from app.repositories.feedback import FeedbackRepository
 
 __all__ = [
     "BaseRepository",
+    "AsyncBaseRepository",
+    "DuplicateKeyError",
+    "InvalidCursorError",
+    "Page",
     "ProjectRepository",
+    "AsyncProjectRepository",
     "NewsRepository",
+    "AsyncNewsRepository",
     "AboutUsRepository",
+    "AsyncAboutUsRepository",
     "BannerRepository",
+    "AsyncBannerRepository",
     "FeedbackRepository",
 ]
 
@@ -1,8 +1,10 @@
 """Repository for About Us operations."""
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models import AboutUs
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
+from app.core.view_counter import view_counter
 
 
 class AboutUsRepository(BaseRepository[AboutUs]):
@@ -26,26 +28,39 @@ class AboutUsRepository(BaseRepository[AboutUs]):
         """
         return (
             self.db.query(AboutUs)
-            .order_by(AboutUs.updated_at.desc())
+            .order_by(AboutUs.updated_at.desc(), AboutUs.id.desc())
             .first()
         )
     
     def increment_views(self, about_id: int) -> AboutUs | None:
         """
-        Increment view count for about us content.
+        Record a buffered view for about us content.
         
         Args:
             about_id: About Us identifier
             
         Returns:
-            Updated about us content or None if not found
+            About us content with buffered view count or None if not found
         """
         about = self.get_by_id(about_id)
         if not about:
             return None
         
-        about.views += 1
-        self.db.commit()
-        self.db.refresh(about)
+        # Detach so the buffered count is never flushed back by this session
+        self.db.expunge(about)
+        about.views = view_counter.increment(AboutUs, about.id, about.views)
         return about
 
+
+class AsyncAboutUsRepository(AsyncBaseRepository[AboutUs]):
+    """Async repository for managing About Us content."""
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize async about us repository.
+        
+        Args:
+            db: Async database session
+        """
+        super().__init__(AboutUs, db)
+
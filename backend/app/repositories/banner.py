@@ -1,8 +1,10 @@
 """Repository for Banner operations."""
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models.banner import Banner, PageTypeEnum
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
 
 
 class BannerRepository(BaseRepository[Banner]):
@@ -29,3 +31,29 @@ class BannerRepository(BaseRepository[Banner]):
         """
         return self.db.query(Banner).filter(Banner.page_type == page_type).first()
 
+
+class AsyncBannerRepository(AsyncBaseRepository[Banner]):
+    """Async repository for managing Banner entities."""
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize async banner repository.
+        
+        Args:
+            db: Async database session
+        """
+        super().__init__(Banner, db)
+    
+    async def get_by_page_type(self, page_type: PageTypeEnum) -> Banner | None:
+        """
+        Get banner by page type.
+        
+        Args:
+            page_type: Page type (HOME, GAME, WEBSITE, NEWS, ABOUT)
+            
+        Returns:
+            Banner instance or None if not found
+        """
+        result = await self.db.execute(select(Banner).where(Banner.page_type == page_type))
+        return result.scalars().first()
+
@@ -1,13 +1,236 @@
 """Base repository with common CRUD operations."""
 
-from typing import Generic, TypeVar, Type
-from sqlalchemy.orm import Session
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Generic, NamedTuple, Sequence, TypeVar, Type
+from sqlalchemy import (
+    ColumnElement, Delete, Dialect, Select, Update, and_, delete, false, func, or_, select, update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer, load_only
 from app.database import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
-class BaseRepository(Generic[ModelType]):
+class DuplicateKeyError(Exception):
+    """Raised when a write violates a primary key or unique constraint."""
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class Page(NamedTuple, Generic[ModelType]):
+    """One page of a listing."""
+    
+    items: list[ModelType]
+    total: int | None
+    next_cursor: str | None
+
+
+class StatementMixin(Generic[ModelType]):
+    """Statement builders shared by the sync and async repositories."""
+    
+    model: Type[ModelType]
+    # Listing order (all descending); the last column must be unique so it
+    # doubles as the keyset for cursor pagination
+    sort_columns: tuple[str, ...] = ("id",)
+    # Large columns left out of list queries; accessing one on a listed
+    # record raises instead of issuing a query per row
+    list_deferred: tuple[str, ...] = ()
+    
+    def _select_by_id(self, id: str | int, fields: Sequence[str] | None = None) -> Select:
+        """Build the statement selecting one record (optionally only ``fields``) by ID."""
+        stmt = select(self.model).where(self.model.id == id)
+        if fields is not None:
+            stmt = stmt.options(self._load_only(fields))
+        return stmt
+    
+    def _select_all(self, skip: int = 0, limit: int = 100) -> Select:
+        """Build the statement selecting a page of records in listing order."""
+        return (
+            select(self.model)
+            .options(*self._list_options())
+            .order_by(*self._order_by())
+            .offset(skip)
+            .limit(limit)
+        )
+    
+    def _select_count(self, *criteria: ColumnElement[bool]) -> Select:
+        """Build the statement counting the (filtered) records."""
+        return select(func.count()).select_from(self.model).where(*criteria)
+    
+    def _order_by(self) -> tuple[ColumnElement, ...]:
+        """Listing order: ``sort_columns``, newest first."""
+        return tuple(getattr(self.model, name).desc() for name in self.sort_columns)
+    
+    def _list_options(self) -> tuple:
+        """Loader options deferring ``list_deferred`` columns."""
+        return tuple(
+            defer(getattr(self.model, name), raiseload=True) for name in self.list_deferred
+        )
+    
+    def _load_only(self, fields: Sequence[str]):
+        """Loader option selecting only ``fields`` (plus the sort keys)."""
+        names = dict.fromkeys((*fields, *self.sort_columns))
+        return load_only(*(getattr(self.model, name) for name in names), raiseload=True)
+    
+    def _select_page(
+        self,
+        criteria: tuple[ColumnElement[bool], ...],
+        skip: int,
+        limit: int,
+        with_total: bool,
+        fields: Sequence[str] | None = None,
+    ) -> Select:
+        """
+        Build the statement selecting a page of (filtered) records.
+        
+        With ``with_total`` every row also carries ``COUNT(*) OVER()``, the
+        number of rows matching the filter before OFFSET/LIMIT, so the page
+        and its total come back in one round trip. With ``fields`` only
+        those columns are selected; otherwise ``list_deferred`` is left out.
+        """
+        columns = [self.model]
+        if with_total:
+            columns.append(func.count().over().label("total"))
+        options = self._list_options() if fields is None else (self._load_only(fields),)
+        return (
+            select(*columns)
+            .options(*options)
+            .where(*criteria)
+            .order_by(*self._order_by())
+            .offset(skip)
+            .limit(limit)
+        )
+    
+    def _encode_cursor(self, obj: ModelType) -> str:
+        """Encode the sort key of the last record on a page as an opaque cursor."""
+        values = []
+        for name in self.sort_columns:
+            value = getattr(obj, name)
+            values.append(value.isoformat() if isinstance(value, (date, datetime)) else value)
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+    
+    def _decode_cursor(self, cursor: str) -> list:
+        """Decode a cursor back into sort key values."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.sort_columns):
+                raise ValueError("wrong number of values")
+            decoded = []
+            for name, value in zip(self.sort_columns, values):
+                python_type = getattr(self.model, name).type.python_type
+                if value is not None and python_type in (date, datetime):
+                    value = python_type.fromisoformat(value)
+                decoded.append(value)
+            return decoded
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    
+    def _after_cursor(self, values: list) -> ColumnElement[bool]:
+        """
+        Keyset condition matching the records after a cursor.
+        
+        Equivalent to ``(c1, c2, ...) < (v1, v2, ...)`` in descending order,
+        served by an index on the sort columns whatever the page depth.
+        NULLs sort last in descending order on MySQL and SQLite, so a NULL
+        value is followed only by other NULLs.
+        """
+        clauses = []
+        equal = []
+        for name, value in zip(self.sort_columns, values):
+            column = getattr(self.model, name)
+            if value is None:
+                equal.append(column.is_(None))
+                continue
+            after = or_(column < value, column.is_(None)) if column.nullable else column < value
+            clauses.append(and_(*equal, after))
+            equal.append(column == value)
+        return or_(*clauses) if clauses else false()
+    
+    def _page_statement(
+        self,
+        criteria: tuple[ColumnElement[bool], ...],
+        skip: int,
+        limit: int,
+        include_total: bool,
+        cursor: str | None,
+        dialect: Dialect,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[Select, bool]:
+        """
+        Build the page statement for OFFSET or cursor pagination.
+        
+        One extra row is fetched to tell whether a next page exists.
+        
+        Returns:
+            Tuple of (statement, whether rows carry the window total)
+        """
+        if cursor is not None:
+            keyset = self._after_cursor(self._decode_cursor(cursor))
+            # The window would only count the rows after the cursor
+            return self._select_page(criteria + (keyset,), 0, limit + 1, False, fields), False
+        window = include_total and self._supports_window(dialect)
+        return self._select_page(criteria, skip, limit + 1, window, fields), window
+    
+    def _split_page(self, rows: list, limit: int) -> tuple[list[ModelType], str | None]:
+        """Split fetched rows into the page items and the next cursor."""
+        items = [row[0] for row in rows[:limit]]
+        next_cursor = self._encode_cursor(items[-1]) if len(rows) > limit else None
+        return items, next_cursor
+    
+    @staticmethod
+    def _supports_window(dialect: Dialect) -> bool:
+        """Whether the database supports ``COUNT(*) OVER()``."""
+        if dialect.name != "mysql":
+            return True
+        version = dialect.server_version_info or ()
+        return version >= ((10, 2) if dialect.is_mariadb else (8, 0))
+    
+    def _update_by_id(self, id: str | int, values: dict, returning: bool) -> Update:
+        """
+        Build a single ``UPDATE ... WHERE id = :id``.
+        
+        With ``returning`` (dialects supporting UPDATE ... RETURNING, such
+        as SQLite) the updated row comes back in the same round trip. MySQL
+        reports matched rather than changed rows (SQLAlchemy sets
+        CLIENT_FOUND_ROWS), so rowcount also works for no-op updates.
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if returning:
+            stmt = stmt.returning(self.model).execution_options(populate_existing=True)
+        return stmt
+    
+    def _delete_by_id(self, id: str | int) -> Delete:
+        """Build a single ``DELETE ... WHERE id = :id``."""
+        return (
+            delete(self.model)
+            .where(self.model.id == id)
+            .execution_options(synchronize_session=False)
+        )
+    
+    @staticmethod
+    def _update_values(obj_in: dict) -> dict:
+        """Keep the non-None fields of ``obj_in`` (None means unchanged)."""
+        return {field: value for field, value in obj_in.items() if value is not None}
+    
+    def _duplicate(self, error: IntegrityError) -> DuplicateKeyError:
+        """Wrap a constraint violation raised by the database."""
+        return DuplicateKeyError(f"{self.model.__name__} violates a unique constraint: {error.orig}")
+
+
+class BaseRepository(StatementMixin[ModelType]):
     """Base repository with common CRUD operations."""
     
     def __init__(self, model: Type[ModelType], db: Session):
@@ -21,17 +244,18 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
     
-    def get_by_id(self, id: str | int) -> ModelType | None:
+    def get_by_id(self, id: str | int, fields: Sequence[str] | None = None) -> ModelType | None:
         """
         Get a single record by ID.
         
         Args:
             id: Record identifier
+            fields: Only load these columns (others raise on access)
             
         Returns:
             Model instance or None if not found
         """
-        return self.db.query(self.model).filter(self.model.id == id).first()
+        return self.db.execute(self._select_by_id(id, fields)).scalars().first()
     
     def get_all(self, skip: int = 0, limit: int = 100) -> list[ModelType]:
         """
@@ -44,7 +268,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             List of model instances
         """
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+        return list(self.db.execute(self._select_all(skip, limit)).scalars())
     
     def count(self) -> int:
         """
@@ -53,27 +277,89 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Total count of records
         """
-        return self.db.query(self.model).count()
+        return self.db.execute(self._select_count()).scalar_one()
+    
+    def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        include_total: bool = True,
+        cursor: str | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Page[ModelType]:
+        """
+        Get a page of records and the total count in one query.
+        
+        Args:
+            skip: Number of records to skip (ignored with ``cursor``)
+            limit: Maximum number of records to return
+            include_total: Whether to compute the total count
+            cursor: ``next_cursor`` of the previous page, for keyset pagination
+            fields: Only load these columns (default: all but ``list_deferred``)
+            
+        Returns:
+            Page of model instances, total count (None if not requested)
+            and the cursor of the next page (None on the last page)
+            
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        return self._get_page((), skip, limit, include_total, cursor, fields)
+    
+    def _get_page(
+        self,
+        criteria: tuple[ColumnElement[bool], ...],
+        skip: int,
+        limit: int,
+        include_total: bool,
+        cursor: str | None,
+        fields: Sequence[str] | None = None,
+    ) -> Page[ModelType]:
+        """Fetch a filtered page, with its total from the window column."""
+        stmt, window = self._page_statement(
+            criteria, skip, limit, include_total, cursor, self.db.get_bind().dialect, fields
+        )
+        rows = self.db.execute(stmt).all()
+        items, next_cursor = self._split_page(rows, limit)
+        if not include_total:
+            total = None
+        elif rows and window:
+            total = rows[0].total
+        elif not rows and skip == 0 and cursor is None:
+            total = 0
+        else:
+            # Cursor page, past the last page or no window functions
+            total = self.db.execute(self._select_count(*criteria)).scalar_one()
+        return Page(items, total, next_cursor)
     
     def create(self, obj_in: dict) -> ModelType:
         """
-        Create a new record.
+        Create a new record with a single INSERT.
+        
+        Duplicate IDs are rejected by the primary key constraint instead
+        of a lookup beforehand.
         
         Args:
             obj_in: Dictionary with record data
             
         Returns:
             Created model instance
+            
+        Raises:
+            DuplicateKeyError: If the record violates a unique constraint
         """
         db_obj = self.model(**obj_in)
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise self._duplicate(e) from e
         return db_obj
     
     def update(self, id: str | int, obj_in: dict) -> ModelType | None:
         """
-        Update an existing record.
+        Update an existing record with a single UPDATE.
         
         Args:
             id: Record identifier
@@ -81,22 +367,35 @@ class BaseRepository(Generic[ModelType]):
             
         Returns:
             Updated model instance or None if not found
+            
+        Raises:
+            DuplicateKeyError: If the update violates a unique constraint
         """
-        db_obj = self.get_by_id(id)
-        if not db_obj:
-            return None
+        values = self._update_values(obj_in)
+        if not values:
+            return self.get_by_id(id)
         
-        for field, value in obj_in.items():
-            if value is not None:
-                setattr(db_obj, field, value)
+        returning = self.db.get_bind().dialect.update_returning
+        try:
+            result = self.db.execute(self._update_by_id(id, values, returning))
+            db_obj = result.scalars().first() if returning else None
+            matched = db_obj is not None if returning else result.rowcount == 1
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise self._duplicate(e) from e
         
-        self.db.commit()
-        self.db.refresh(db_obj)
+        if not matched:
+            return None
+        if db_obj is None:
+            db_obj = self.db.execute(
+                self._select_by_id(id).execution_options(populate_existing=True)
+            ).scalars().first()
         return db_obj
     
     def delete(self, id: str | int) -> bool:
         """
-        Delete a record.
+        Delete a record with a single DELETE.
         
         Args:
             id: Record identifier
@@ -104,11 +403,187 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             True if deleted, False if not found
         """
-        db_obj = self.get_by_id(id)
-        if not db_obj:
-            return False
-        
-        self.db.delete(db_obj)
+        result = self.db.execute(self._delete_by_id(id))
         self.db.commit()
-        return True
+        return result.rowcount == 1
+
+
+class AsyncBaseRepository(StatementMixin[ModelType]):
+    """
+    Async variant of ``BaseRepository`` for ``async def`` routes.
+    
+    Same operations, awaited on an ``AsyncSession`` so database round
+    trips never block the event loop.
+    """
+    
+    def __init__(self, model: Type[ModelType], db: AsyncSession):
+        """
+        Initialize repository with model and async database session.
+        
+        Args:
+            model: SQLAlchemy model class
+            db: Async database session
+        """
+        self.model = model
+        self.db = db
+    
+    async def get_by_id(self, id: str | int, fields: Sequence[str] | None = None) -> ModelType | None:
+        """
+        Get a single record by ID.
+        
+        Args:
+            id: Record identifier
+            fields: Only load these columns (others raise on access)
+            
+        Returns:
+            Model instance or None if not found
+        """
+        return (await self.db.execute(self._select_by_id(id, fields))).scalars().first()
+    
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[ModelType]:
+        """
+        Get all records with pagination.
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of model instances
+        """
+        return list((await self.db.execute(self._select_all(skip, limit))).scalars())
+    
+    async def count(self) -> int:
+        """
+        Count total records.
+        
+        Returns:
+            Total count of records
+        """
+        return (await self.db.execute(self._select_count())).scalar_one()
+    
+    async def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        include_total: bool = True,
+        cursor: str | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Page[ModelType]:
+        """
+        Get a page of records and the total count in one query.
+        
+        Args:
+            skip: Number of records to skip (ignored with ``cursor``)
+            limit: Maximum number of records to return
+            include_total: Whether to compute the total count
+            cursor: ``next_cursor`` of the previous page, for keyset pagination
+            fields: Only load these columns (default: all but ``list_deferred``)
+            
+        Returns:
+            Page of model instances, total count (None if not requested)
+            and the cursor of the next page (None on the last page)
+            
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        return await self._get_page((), skip, limit, include_total, cursor, fields)
+    
+    async def _get_page(
+        self,
+        criteria: tuple[ColumnElement[bool], ...],
+        skip: int,
+        limit: int,
+        include_total: bool,
+        cursor: str | None,
+        fields: Sequence[str] | None = None,
+    ) -> Page[ModelType]:
+        """Fetch a filtered page, with its total from the window column."""
+        stmt, window = self._page_statement(
+            criteria, skip, limit, include_total, cursor, self.db.get_bind().dialect, fields
+        )
+        rows = (await self.db.execute(stmt)).all()
+        items, next_cursor = self._split_page(rows, limit)
+        if not include_total:
+            total = None
+        elif rows and window:
+            total = rows[0].total
+        elif not rows and skip == 0 and cursor is None:
+            total = 0
+        else:
+            # Cursor page, past the last page or no window functions
+            total = (await self.db.execute(self._select_count(*criteria))).scalar_one()
+        return Page(items, total, next_cursor)
+    
+    async def create(self, obj_in: dict) -> ModelType:
+        """
+        Create a new record with a single INSERT.
+        
+        Args:
+            obj_in: Dictionary with record data
+            
+        Returns:
+            Created model instance
+            
+        Raises:
+            DuplicateKeyError: If the record violates a unique constraint
+        """
+        db_obj = self.model(**obj_in)
+        self.db.add(db_obj)
+        try:
+            await self.db.commit()
+        except IntegrityError as e:
+            await self.db.rollback()
+            raise self._duplicate(e) from e
+        return db_obj
+    
+    async def update(self, id: str | int, obj_in: dict) -> ModelType | None:
+        """
+        Update an existing record with a single UPDATE.
+        
+        Args:
+            id: Record identifier
+            obj_in: Dictionary with updated data
+            
+        Returns:
+            Updated model instance or None if not found
+            
+        Raises:
+            DuplicateKeyError: If the update violates a unique constraint
+        """
+        values = self._update_values(obj_in)
+        if not values:
+            return await self.get_by_id(id)
+        
+        returning = self.db.get_bind().dialect.update_returning
+        try:
+            result = await self.db.execute(self._update_by_id(id, values, returning))
+            db_obj = result.scalars().first() if returning else None
+            matched = db_obj is not None if returning else result.rowcount == 1
+            await self.db.commit()
+        except IntegrityError as e:
+            await self.db.rollback()
+            raise self._duplicate(e) from e
+        
+        if not matched:
+            return None
+        if db_obj is None:
+            db_obj = (await self.db.execute(
+                self._select_by_id(id).execution_options(populate_existing=True)
+            )).scalars().first()
+        return db_obj
+    
+    async def delete(self, id: str | int) -> bool:
+        """
+        Delete a record with a single DELETE.
+        
+        Args:
+            id: Record identifier
+            
+        Returns:
+            True if deleted, False if not found
+        """
+        result = await self.db.execute(self._delete_by_id(id))
+        await self.db.commit()
+        return result.rowcount == 1
 
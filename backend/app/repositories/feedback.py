@@ -2,12 +2,14 @@
 
 from sqlalchemy.orm import Session
 from app.models import Feedback
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, Page
 
 
 class FeedbackRepository(BaseRepository[Feedback]):
     """Repository for managing Feedback entities."""
     
+    sort_columns = ("created_at", "id")
+    
     def __init__(self, db: Session):
         """
         Initialize feedback repository.
@@ -40,8 +42,29 @@ class FeedbackRepository(BaseRepository[Feedback]):
         return (
             self.db.query(Feedback)
             .filter(Feedback.is_read == False)
-            .order_by(Feedback.created_at.desc())
+            .order_by(*self._order_by())
             .offset(skip)
             .limit(limit)
             .all()
         )
+    
+    def get_unread_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        include_total: bool = True,
+        cursor: str | None = None,
+    ) -> Page[Feedback]:
+        """
+        Get a page of unread feedback and its total in one query.
+        
+        Args:
+            skip: Number of records to skip (ignored with ``cursor``)
+            limit: Maximum number of records to return
+            include_total: Whether to compute the total count
+            cursor: ``next_cursor`` of the previous page
+            
+        Returns:
+            Page of unread feedback, total count and next cursor
+        """
+        return self._get_page((Feedback.is_read == False,), skip, limit, include_total, cursor)
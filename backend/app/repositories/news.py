@@ -1,13 +1,18 @@
 """Repository for News operations."""
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models import News
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
+from app.core.view_counter import view_counter
 
 
 class NewsRepository(BaseRepository[News]):
     """Repository for managing News entities."""
     
+    sort_columns = ("date", "id")
+    list_deferred = ("content",)
+    
     def __init__(self, db: Session):
         """
         Initialize news repository.
@@ -19,20 +24,36 @@ class NewsRepository(BaseRepository[News]):
     
     def increment_views(self, news_id: str) -> News | None:
         """
-        Increment view count for a news article.
+        Record a buffered view for a news article.
         
         Args:
             news_id: News identifier
             
         Returns:
-            Updated news article or None if not found
+            News article with buffered view count or None if not found
         """
         news = self.get_by_id(news_id)
         if not news:
             return None
         
-        news.views += 1
-        self.db.commit()
-        self.db.refresh(news)
+        # Detach so the buffered count is never flushed back by this session
+        self.db.expunge(news)
+        news.views = view_counter.increment(News, news.id, news.views)
         return news
 
+
+class AsyncNewsRepository(AsyncBaseRepository[News]):
+    """Async repository for managing News entities."""
+    
+    sort_columns = NewsRepository.sort_columns
+    list_deferred = NewsRepository.list_deferred
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize async news repository.
+        
+        Args:
+            db: Async database session
+        """
+        super().__init__(News, db)
+
@@ -1,13 +1,19 @@
 """Repository for Project operations."""
 
+from typing import Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models import Project, CategoryEnum
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository, Page
+from app.core.view_counter import view_counter
 
 
 class ProjectRepository(BaseRepository[Project]):
     """Repository for managing Project entities."""
     
+    sort_columns = ("date", "id")
+    list_deferred = ("description",)
+    
     def __init__(self, db: Session):
         """
         Initialize project repository.
@@ -17,59 +23,65 @@ class ProjectRepository(BaseRepository[Project]):
         """
         super().__init__(Project, db)
     
-    def get_by_category(
-        self, 
-        category: CategoryEnum, 
-        skip: int = 0, 
-        limit: int = 100
-    ) -> list[Project]:
+    def get_page_by_category(
+        self,
+        category: CategoryEnum,
+        skip: int = 0,
+        limit: int = 100,
+        include_total: bool = True,
+        cursor: str | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Page[Project]:
         """
-        Get projects filtered by category.
+        Get a page of projects in a category and their total in one query.
         
         Args:
             category: Project category (GAME or WEBSITE)
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored with ``cursor``)
             limit: Maximum number of records to return
+            include_total: Whether to compute the total count
+            cursor: ``next_cursor`` of the previous page
+            fields: Only load these columns
             
         Returns:
-            List of projects in the specified category
+            Page of projects, total count and next cursor
         """
-        return (
-            self.db.query(Project)
-            .filter(Project.category == category)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return self._get_page(
+            (Project.category == category,), skip, limit, include_total, cursor, fields
         )
     
-    def count_by_category(self, category: CategoryEnum) -> int:
-        """
-        Count projects by category.
-        
-        Args:
-            category: Project category
-            
-        Returns:
-            Count of projects in category
-        """
-        return self.db.query(Project).filter(Project.category == category).count()
-    
     def increment_views(self, project_id: str) -> Project | None:
         """
-        Increment view count for a project.
+        Record a buffered view for a project.
         
         Args:
             project_id: Project identifier
             
         Returns:
-            Updated project or None if not found
+            Project with buffered view count or None if not found
         """
         project = self.get_by_id(project_id)
         if not project:
             return None
         
-        project.views += 1
-        self.db.commit()
-        self.db.refresh(project)
+        # Detach so the buffered count is never flushed back by this session
+        self.db.expunge(project)
+        project.views = view_counter.increment(Project, project.id, project.views)
         return project
 
+
+class AsyncProjectRepository(AsyncBaseRepository[Project]):
+    """Async repository for managing Project entities."""
+    
+    sort_columns = ProjectRepository.sort_columns
+    list_deferred = ProjectRepository.list_deferred
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize async project repository.
+        
+        Args:
+            db: Async database session
+        """
+        super().__init__(Project, db)
+
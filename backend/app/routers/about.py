@@ -1,9 +1,11 @@
 """API routes for About Us content."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.core.cache import response_cache
+from app.core.invalidation import invalidation_bus
 from app.repositories import AboutUsRepository
 from app.schemas import (
     AboutUsCreate,
@@ -35,10 +37,14 @@ def get_about_us(
     Raises:
         HTTPException: If no content exists
     """
-    about = repo.get_latest()
-    if not about:
-        raise HTTPException(status_code=404, detail="About Us content not found")
-    return about
+    def build() -> bytes:
+        about = repo.get_latest()
+        if not about:
+            raise HTTPException(status_code=404, detail="About Us content not found")
+        return AboutUsResponse.model_validate(about).model_dump_json().encode()
+    
+    key = response_cache.make_key("about", "latest")
+    return Response(content=response_cache.get_or_set(key, build), media_type="application/json")
 
 
 @router.get("/{about_id}", response_model=AboutUsResponse)
@@ -80,7 +86,9 @@ def create_about_us(
     Returns:
         Created About Us content
     """
-    return repo.create(about_in.model_dump())
+    about = repo.create(about_in.model_dump())
+    invalidation_bus.publish("about")
+    return about
 
 
 @router.put("/{about_id}", response_model=AboutUsResponse)
@@ -106,6 +114,7 @@ def update_about_us(
     about = repo.update(about_id, about_in.model_dump(exclude_unset=True))
     if not about:
         raise HTTPException(status_code=404, detail="About Us content not found")
+    invalidation_bus.publish("about")
     return about
 
 
@@ -127,6 +136,7 @@ def delete_about_us(
     success = repo.delete(about_id)
     if not success:
         raise HTTPException(status_code=404, detail="About Us content not found")
+    invalidation_bus.publish("about")
 
 
 @router.post("/{about_id}/view", response_model=AboutUsResponse)
@@ -1,62 +1,67 @@
 """Admin API for managing about us content."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.dependencies import require_admin
-from app.models import User
-from app.repositories import AboutUsRepository
+from app.core.invalidation import invalidation_bus
+from app.core.principal import Principal
+from app.repositories import AsyncAboutUsRepository
 from app.schemas import AboutUsCreate, AboutUsUpdate, AboutUsResponse
 
 router = APIRouter(prefix="/api/admin/about", tags=["admin-about"])
 
 
-def get_about_repo(db: Session = Depends(get_db)) -> AboutUsRepository:
+def get_about_repo(db: AsyncSession = Depends(get_async_db)) -> AsyncAboutUsRepository:
     """Dependency to get about us repository."""
-    return AboutUsRepository(db)
+    return AsyncAboutUsRepository(db)
 
 
 @router.get("", response_model=list[AboutUsResponse])
 async def admin_list_about(
-    repo: AboutUsRepository = Depends(get_about_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncAboutUsRepository = Depends(get_about_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """List all about us entries (admin)."""
-    return repo.get_all(skip=0, limit=100)
+    return await repo.get_all(skip=0, limit=100)
 
 
 @router.post("", response_model=AboutUsResponse, status_code=201)
 async def admin_create_about(
     about: AboutUsCreate,
-    repo: AboutUsRepository = Depends(get_about_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncAboutUsRepository = Depends(get_about_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Create new about us entry (admin)."""
-    return repo.create(about.model_dump())
+    created = await repo.create(about.model_dump())
+    invalidation_bus.publish("about")
+    return created
 
 
 @router.put("/{about_id}", response_model=AboutUsResponse)
 async def admin_update_about(
     about_id: int,
     about: AboutUsUpdate,
-    repo: AboutUsRepository = Depends(get_about_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncAboutUsRepository = Depends(get_about_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Update about us entry (admin)."""
-    updated = repo.update(about_id, about.model_dump(exclude_unset=True))
+    updated = await repo.update(about_id, about.model_dump(exclude_unset=True))
     if not updated:
         raise HTTPException(status_code=404, detail="About Us not found")
+    invalidation_bus.publish("about")
     return updated
 
 
 @router.delete("/{about_id}", status_code=204)
 async def admin_delete_about(
     about_id: int,
-    repo: AboutUsRepository = Depends(get_about_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncAboutUsRepository = Depends(get_about_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete about us entry (admin)."""
-    success = repo.delete(about_id)
+    success = await repo.delete(about_id)
     if not success:
         raise HTTPException(status_code=404, detail="About Us not found")
+    invalidation_bus.publish("about")
 
@@ -2,11 +2,12 @@
 
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.dependencies import require_admin
-from app.models import User
-from app.repositories import BannerRepository
+from app.core.invalidation import invalidation_bus
+from app.core.principal import Principal
+from app.repositories import AsyncBannerRepository, DuplicateKeyError
 from app.schemas import BannerCreate, BannerUpdate, BannerResponse, BannerListResponse
 from app.models.banner import PageTypeEnum
 
@@ -16,32 +17,32 @@ router = APIRouter(prefix="/api/admin/banners", tags=["admin-banners"])
 UPLOAD_DIR = Path(__file__).parent.parent.parent.parent / "static" / "uploads"
 
 
-def get_banner_repo(db: Session = Depends(get_db)) -> BannerRepository:
+def get_banner_repo(db: AsyncSession = Depends(get_async_db)) -> AsyncBannerRepository:
     """Dependency to get banner repository."""
-    return BannerRepository(db)
+    return AsyncBannerRepository(db)
 
 
 @router.get("", response_model=BannerListResponse)
 async def admin_list_banners(
     skip: int = 0,
     limit: int = 100,
-    repo: BannerRepository = Depends(get_banner_repo),
-    current_user: User = Depends(require_admin)
+    include_total: bool = True,
+    repo: AsyncBannerRepository = Depends(get_banner_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """List all banners (admin)."""
-    total = repo.count()
-    items = repo.get_all(skip=skip, limit=limit)
-    return BannerListResponse(total=total, items=items)
+    page = await repo.get_page(skip=skip, limit=limit, include_total=include_total)
+    return BannerListResponse(total=page.total, items=page.items)
 
 
 @router.get("/{banner_id}", response_model=BannerResponse)
 async def admin_get_banner(
     banner_id: str,
-    repo: BannerRepository = Depends(get_banner_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncBannerRepository = Depends(get_banner_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Get banner by ID (admin)."""
-    banner = repo.get_by_id(banner_id)
+    banner = await repo.get_by_id(banner_id)
     if not banner:
         raise HTTPException(status_code=404, detail="Banner not found")
     return banner
@@ -50,11 +51,11 @@ async def admin_get_banner(
 @router.get("/page/{page_type}", response_model=BannerResponse)
 async def admin_get_banner_by_page_type(
     page_type: PageTypeEnum,
-    repo: BannerRepository = Depends(get_banner_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncBannerRepository = Depends(get_banner_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Get banner by page type (admin)."""
-    banner = repo.get_by_page_type(page_type)
+    banner = await repo.get_by_page_type(page_type)
     if not banner:
         raise HTTPException(status_code=404, detail=f"Banner for page type {page_type} not found")
     return banner
@@ -63,64 +64,65 @@ async def admin_get_banner_by_page_type(
 @router.post("", response_model=BannerResponse, status_code=201)
 async def admin_create_banner(
     banner: BannerCreate,
-    repo: BannerRepository = Depends(get_banner_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncBannerRepository = Depends(get_banner_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Create new banner (admin)."""
-    # Check if banner with same ID exists
-    existing = repo.get_by_id(banner.id)
-    if existing:
-        raise HTTPException(status_code=400, detail="Banner with this ID already exists")
-    
-    # Check if banner for this page type already exists
-    existing_by_page = repo.get_by_page_type(banner.page_type)
-    if existing_by_page:
+    # Duplicate IDs and page types are rejected by the table constraints;
+    # only a failed insert pays for the lookup that explains why
+    try:
+        created = await repo.create(banner.model_dump())
+    except DuplicateKeyError:
+        if await repo.get_by_id(banner.id):
+            raise HTTPException(status_code=400, detail="Banner with this ID already exists")
         raise HTTPException(
             status_code=400, 
             detail=f"Banner for page type {banner.page_type} already exists. Please update instead."
         )
-    
-    return repo.create(banner.model_dump())
+    invalidation_bus.publish("banners")
+    return created
 
 
 @router.put("/{banner_id}", response_model=BannerResponse)
 async def admin_update_banner(
     banner_id: str,
     banner: BannerUpdate,
-    repo: BannerRepository = Depends(get_banner_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncBannerRepository = Depends(get_banner_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Update banner (admin)."""
-    # Get existing banner to delete old image
-    existing = repo.get_by_id(banner_id)
-    if not existing:
+    # Only an image change needs the old row (to delete the old file)
+    old_image = None
+    if banner.image:
+        existing = await repo.get_by_id(banner_id)
+        old_image = existing.image if existing else None
+    
+    updated = await repo.update(banner_id, banner.model_dump(exclude_unset=True))
+    if not updated:
         raise HTTPException(status_code=404, detail="Banner not found")
     
     # If updating image, delete old image file
-    if banner.image and existing.image and banner.image != existing.image:
-        old_image_path = UPLOAD_DIR / existing.image
+    if old_image and banner.image != old_image:
+        old_image_path = UPLOAD_DIR / old_image
         if old_image_path.exists():
             try:
                 old_image_path.unlink()
             except Exception as e:
                 # Log error but don't fail the update
-                print(f"Failed to delete old image {existing.image}: {e}")
-    
-    updated = repo.update(banner_id, banner.model_dump(exclude_unset=True))
-    if not updated:
-        raise HTTPException(status_code=404, detail="Banner not found")
+                print(f"Failed to delete old image {old_image}: {e}")
+    invalidation_bus.publish("banners")
     return updated
 
 
 @router.delete("/{banner_id}", status_code=204)
 async def admin_delete_banner(
     banner_id: str,
-    repo: BannerRepository = Depends(get_banner_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncBannerRepository = Depends(get_banner_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete banner (admin)."""
     # Get banner to delete associated image
-    banner = repo.get_by_id(banner_id)
+    banner = await repo.get_by_id(banner_id)
     if not banner:
         raise HTTPException(status_code=404, detail="Banner not found")
     
@@ -133,7 +135,8 @@ async def admin_delete_banner(
             except Exception as e:
                 print(f"Failed to delete image {banner.image}: {e}")
     
-    success = repo.delete(banner_id)
+    success = await repo.delete(banner_id)
     if not success:
         raise HTTPException(status_code=404, detail="Banner not found")
+    invalidation_bus.publish("banners")
 
@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.dependencies import require_admin
-from app.repositories import FeedbackRepository
+from app.repositories import FeedbackRepository, InvalidCursorError
 from app.schemas import (
     FeedbackResponse,
     FeedbackListResponse,
@@ -25,6 +25,8 @@ def list_feedback(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=100, description="Number of items to return"),
     unread_only: bool = Query(False, description="Show only unread feedback"),
+    include_total: bool = Query(True, description="Also return the total count"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (keyset pagination)"),
     repo: FeedbackRepository = Depends(get_feedback_repo),
     _: None = Depends(require_admin),
 ):
@@ -35,19 +37,24 @@ def list_feedback(
         skip: Number of items to skip for pagination
         limit: Maximum number of items to return
         unread_only: If True, return only unread feedback
+        include_total: Whether to compute the total count
+        cursor: Cursor of the next page (replaces skip)
         repo: Feedback repository instance
         
     Returns:
         List of feedback with total count
     """
-    if unread_only:
-        items = repo.get_unread(skip=skip, limit=limit)
-        total = repo.get_unread_count()
-    else:
-        items = repo.get_all(skip=skip, limit=limit)
-        total = repo.count()
+    try:
+        if unread_only:
+            page = repo.get_unread_page(
+                skip=skip, limit=limit, include_total=include_total, cursor=cursor
+            )
+        else:
+            page = repo.get_page(skip=skip, limit=limit, include_total=include_total, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return FeedbackListResponse(total=total, items=items)
+    return FeedbackListResponse(total=page.total, items=page.items, next_cursor=page.next_cursor)
 
 
 @router.get("/{feedback_id}", response_model=FeedbackResponse)
@@ -1,11 +1,15 @@
 """Admin login API."""
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr
-from app.database import get_db
+from app.database import get_async_db
 from app.models.user import User, UserRole, UserStatus
-from app.core.security import verify_password
+from app.core.principal import Principal, principal_cache
+from app.core.login_throttle import login_throttle
+from app.core.password_hasher import PasswordHasherBusyError, password_hasher
+from app.core.security import password_needs_rehash
 
 router = APIRouter(prefix="/api/admin", tags=["admin-auth"])
 
@@ -27,7 +31,7 @@ class LoginResponse(BaseModel):
 async def admin_login(
     login_data: LoginRequest,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Admin login endpoint.
@@ -40,8 +44,19 @@ async def admin_login(
     Returns:
         Login response with user info
     """
+    # Throttle before touching the database or bcrypt
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = await login_throttle.check(client_ip, login_data.email)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please try again later",
+            headers={"Retry-After": str(retry_after)},
+        )
+    
     # Find user by email
-    user = db.query(User).filter(User.email == login_data.email).first()
+    result = await db.execute(select(User).where(User.email == login_data.email))
+    user = result.scalars().first()
     
     if not user:
         raise HTTPException(
@@ -49,13 +64,24 @@ async def admin_login(
             detail="Incorrect email or password"
         )
     
-    # Verify password
-    if not verify_password(login_data.password, user.password_hash):
+    # Verify password (bcrypt runs in the hasher pool, not on the event loop)
+    try:
+        password_ok = await password_hasher.verify(login_data.password, user.password_hash)
+    except PasswordHasherBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts in progress, please retry",
+            headers={"Retry-After": "1"},
+        )
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
     
+    # Correct password: give back the account's attempts
+    await login_throttle.reset(login_data.email)
+    
     # Check if user is admin
     if user.role != UserRole.ADMIN:
         raise HTTPException(
@@ -70,8 +96,18 @@ async def admin_login(
             detail="Account is not active"
         )
     
+    # Upgrade the hash if BCRYPT_ROUNDS changed since it was made
+    if password_needs_rehash(user.password_hash):
+        try:
+            user.password_hash = await password_hasher.hash(login_data.password)
+            await db.commit()
+        except PasswordHasherBusyError:
+            pass  # Keep the old hash; retried on a later login
+    
     # Store user ID in session
     request.session["user_id"] = user.id
+    # Fresh snapshot for the admin calls that follow
+    principal_cache.set(Principal.from_user(user))
     
     return LoginResponse(
         success=True,
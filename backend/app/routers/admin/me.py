@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from app.models.user import User
+from app.core.principal import Principal
 from app.dependencies import require_admin
 
 router = APIRouter(prefix="/api/admin", tags=["admin-auth"])
@@ -21,7 +21,7 @@ class UserResponse(BaseModel):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_admin(current_user: User = Depends(require_admin)):
+async def get_current_admin(current_user: Principal = Depends(require_admin)):
     """
     Get current admin user info.
     
@@ -1,66 +1,78 @@
 """Admin API for managing news."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.dependencies import require_admin
-from app.models import User
-from app.repositories import NewsRepository
+from app.core.invalidation import invalidation_bus
+from app.core.principal import Principal
+from app.repositories import AsyncNewsRepository, DuplicateKeyError, InvalidCursorError
 from app.schemas import NewsCreate, NewsUpdate, NewsResponse, NewsListResponse
 
 router = APIRouter(prefix="/api/admin/news", tags=["admin-news"])
 
 
-def get_news_repo(db: Session = Depends(get_db)) -> NewsRepository:
+def get_news_repo(db: AsyncSession = Depends(get_async_db)) -> AsyncNewsRepository:
     """Dependency to get news repository."""
-    return NewsRepository(db)
+    return AsyncNewsRepository(db)
 
 
 @router.get("", response_model=NewsListResponse)
 async def admin_list_news(
     skip: int = 0,
     limit: int = 100,
-    repo: NewsRepository = Depends(get_news_repo),
-    current_user: User = Depends(require_admin)
+    include_total: bool = True,
+    cursor: str | None = None,
+    repo: AsyncNewsRepository = Depends(get_news_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """List all news (admin)."""
-    total = repo.count()
-    items = repo.get_all(skip=skip, limit=limit)
-    return NewsListResponse(total=total, items=items)
+    try:
+        page = await repo.get_page(skip=skip, limit=limit, include_total=include_total, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return NewsListResponse(total=page.total, items=page.items, next_cursor=page.next_cursor)
 
 
 @router.post("", response_model=NewsResponse, status_code=201)
 async def admin_create_news(
     news: NewsCreate,
-    repo: NewsRepository = Depends(get_news_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncNewsRepository = Depends(get_news_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Create new news (admin)."""
-    return repo.create(news.model_dump())
+    try:
+        created = await repo.create(news.model_dump())
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="News with this ID already exists")
+    invalidation_bus.publish("news")
+    return created
 
 
 @router.put("/{news_id}", response_model=NewsResponse)
 async def admin_update_news(
     news_id: str,
     news: NewsUpdate,
-    repo: NewsRepository = Depends(get_news_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncNewsRepository = Depends(get_news_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Update news (admin)."""
-    updated = repo.update(news_id, news.model_dump(exclude_unset=True))
+    updated = await repo.update(news_id, news.model_dump(exclude_unset=True))
     if not updated:
         raise HTTPException(status_code=404, detail="News not found")
+    invalidation_bus.publish("news")
     return updated
 
 
 @router.delete("/{news_id}", status_code=204)
 async def admin_delete_news(
     news_id: str,
-    repo: NewsRepository = Depends(get_news_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncNewsRepository = Depends(get_news_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete news (admin)."""
-    success = repo.delete(news_id)
+    success = await repo.delete(news_id)
     if not success:
         raise HTTPException(status_code=404, detail="News not found")
+    invalidation_bus.publish("news")
 
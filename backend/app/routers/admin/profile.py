@@ -4,11 +4,14 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_db, require_admin
+from app.database import get_async_db
+from app.dependencies import require_admin
 from app.models.user import User
-from app.core.security import verify_password, get_password_hash
+from app.core.invalidation import invalidation_bus
+from app.core.principal import Principal, user_namespace
+from app.core.password_hasher import PasswordHasherBusyError, password_hasher
 
 
 router = APIRouter(prefix="/api/admin/profile", tags=["admin-profile"])
@@ -37,7 +40,7 @@ class ProfileUpdateRequest(BaseModel):
 
 
 @router.get("", response_model=ProfileResponse)
-async def get_profile(current_user: User = Depends(require_admin)) -> ProfileResponse:
+async def get_profile(current_user: Principal = Depends(require_admin)) -> ProfileResponse:
     """Return the current admin profile."""
     return ProfileResponse(
         id=current_user.id,
@@ -51,8 +54,8 @@ async def get_profile(current_user: User = Depends(require_admin)) -> ProfileRes
 @router.put("", response_model=ProfileResponse)
 async def update_profile(
     payload: ProfileUpdateRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_admin),
 ) -> ProfileResponse:
     """
     Update admin profile.
@@ -61,33 +64,49 @@ async def update_profile(
     - Email is immutable.
     - Password change only needs new_password (no current_password required).
     """
-    updated = False
+    if payload.name is None and not payload.new_password:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No changes provided",
+        )
+
+    # Hash first (in the hasher pool) so no connection is held meanwhile
+    password_hash = None
+    if payload.new_password:
+        try:
+            password_hash = await password_hasher.hash(payload.new_password)
+        except PasswordHasherBusyError:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Server busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+
+    # current_user is a cached snapshot; load the row to change it
+    user = await db.get(User, current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
 
     # Update name if provided
     if payload.name is not None:
-        current_user.name = payload.name.strip()
-        updated = True
+        user.name = payload.name.strip()
 
     # Change password if requested
-    if payload.new_password:
-        current_user.password_hash = get_password_hash(payload.new_password)
-        updated = True
+    if password_hash is not None:
+        user.password_hash = password_hash
 
-    if not updated:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No changes provided",
-        )
-
-    db.add(current_user)
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    # Drop the cached snapshot in every worker
+    invalidation_bus.publish(user_namespace(user.id))
 
     return ProfileResponse(
-        id=current_user.id,
-        name=current_user.name,
-        email=current_user.email,
-        role=current_user.role.value,
-        status=current_user.status.value,
+        id=user.id,
+        name=user.name,
+        email=user.email,
+        role=user.role.value,
+        status=user.status.value,
     )
 
@@ -1,42 +1,47 @@
 """Admin API for managing projects."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.dependencies import require_admin
-from app.models import User
-from app.repositories import ProjectRepository
+from app.core.invalidation import invalidation_bus
+from app.core.principal import Principal
+from app.repositories import AsyncProjectRepository, DuplicateKeyError, InvalidCursorError
 from app.schemas import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse
 
 router = APIRouter(prefix="/api/admin/projects", tags=["admin-projects"])
 
 
-def get_project_repo(db: Session = Depends(get_db)) -> ProjectRepository:
+def get_project_repo(db: AsyncSession = Depends(get_async_db)) -> AsyncProjectRepository:
     """Dependency to get project repository."""
-    return ProjectRepository(db)
+    return AsyncProjectRepository(db)
 
 
 @router.get("", response_model=ProjectListResponse)
 async def admin_list_projects(
     skip: int = 0,
     limit: int = 100,
-    repo: ProjectRepository = Depends(get_project_repo),
-    current_user: User = Depends(require_admin)
+    include_total: bool = True,
+    cursor: str | None = None,
+    repo: AsyncProjectRepository = Depends(get_project_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """List all projects (admin)."""
-    total = repo.count()
-    items = repo.get_all(skip=skip, limit=limit)
-    return ProjectListResponse(total=total, items=items)
+    try:
+        page = await repo.get_page(skip=skip, limit=limit, include_total=include_total, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ProjectListResponse(total=page.total, items=page.items, next_cursor=page.next_cursor)
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def admin_get_project(
     project_id: str,
-    repo: ProjectRepository = Depends(get_project_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncProjectRepository = Depends(get_project_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Get project by ID (admin)."""
-    project = repo.get_by_id(project_id)
+    project = await repo.get_by_id(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
@@ -45,40 +50,43 @@ async def admin_get_project(
 @router.post("", response_model=ProjectResponse, status_code=201)
 async def admin_create_project(
     project: ProjectCreate,
-    repo: ProjectRepository = Depends(get_project_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncProjectRepository = Depends(get_project_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Create new project (admin)."""
-    # Check if project with same ID exists
-    existing = repo.get_by_id(project.id)
-    if existing:
+    # Duplicate IDs are rejected by the primary key
+    try:
+        created = await repo.create(project.model_dump())
+    except DuplicateKeyError:
         raise HTTPException(status_code=400, detail="Project with this ID already exists")
-    
-    return repo.create(project.model_dump())
+    invalidation_bus.publish("projects")
+    return created
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def admin_update_project(
     project_id: str,
     project: ProjectUpdate,
-    repo: ProjectRepository = Depends(get_project_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncProjectRepository = Depends(get_project_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Update project (admin)."""
-    updated = repo.update(project_id, project.model_dump(exclude_unset=True))
+    updated = await repo.update(project_id, project.model_dump(exclude_unset=True))
     if not updated:
         raise HTTPException(status_code=404, detail="Project not found")
+    invalidation_bus.publish("projects")
     return updated
 
 
 @router.delete("/{project_id}", status_code=204)
 async def admin_delete_project(
     project_id: str,
-    repo: ProjectRepository = Depends(get_project_repo),
-    current_user: User = Depends(require_admin)
+    repo: AsyncProjectRepository = Depends(get_project_repo),
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete project (admin)."""
-    success = repo.delete(project_id)
+    success = await repo.delete(project_id)
     if not success:
         raise HTTPException(status_code=404, detail="Project not found")
+    invalidation_bus.publish("projects")
 
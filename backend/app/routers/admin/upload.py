@@ -1,13 +1,17 @@
 """Image upload API with WebP conversion."""
 
+import asyncio
 from pathlib import Path
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
-from PIL import Image
-import io
+from typing import AsyncIterator, BinaryIO
+from fastapi import APIRouter, Depends, HTTPException, Request
+from PIL import Image, UnidentifiedImageError
+from starlette.datastructures import UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
 import uuid
 from datetime import datetime
+from app.config import settings
 from app.dependencies import require_admin
-from app.models.user import User
+from app.core.principal import Principal
 
 router = APIRouter(prefix="/api/admin/upload", tags=["admin-upload"])
 
@@ -17,47 +21,129 @@ UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 # Allowed image types
 ALLOWED_TYPES = {"image/jpeg", "image/jpg", "image/png", "image/gif", "image/webp"}
-MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+ALLOWED_FORMATS = {"JPEG", "PNG", "GIF", "WEBP"}  # As detected by Pillow
+MAX_FILE_SIZE = settings.MAX_UPLOAD_SIZE * 1024 * 1024
+MAX_PIXELS = settings.MAX_UPLOAD_PIXELS
+# Pillow's own bomb guard (warns past this, raises past twice this) uses the same cap
+Image.MAX_IMAGE_PIXELS = MAX_PIXELS
+# Room for the multipart boundary and part headers around the file
+MULTIPART_OVERHEAD = 64 * 1024
 
+# Request body documented for OpenAPI (the body is parsed by hand)
+UPLOAD_REQUEST_BODY = {
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "properties": {"file": {"type": "string", "format": "binary"}},
+                "required": ["file"],
+            }
+        }
+    },
+    "required": True,
+}
 
-@router.post("/image")
-async def upload_image(
-    file: UploadFile = File(...),
-    current_user: User = Depends(require_admin)
-):
+
+def _too_large() -> HTTPException:
+    """Error raised as soon as an upload exceeds the size cap."""
+    return HTTPException(
+        status_code=413,
+        detail=f"File too large. Maximum size: {MAX_FILE_SIZE // 1024 // 1024}MB"
+    )
+
+
+async def _capped_stream(request: Request, limit: int) -> AsyncIterator[bytes]:
     """
-    Upload image and convert to WebP format.
+    Yield the request body chunk by chunk, aborting past ``limit`` bytes.
     
     Args:
-        file: Uploaded image file
-        current_user: Current admin user
+        request: Incoming request
+        limit: Maximum body size in bytes
+        
+    Raises:
+        HTTPException: 413 once more than ``limit`` bytes were received
+    """
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > limit:
+            raise _too_large()
+        yield chunk
+
+
+async def _receive_upload(request: Request) -> UploadFile:
+    """
+    Stream a single-file multipart upload into a spooled temporary file.
+    
+    The declared Content-Length is checked before anything is read, and the
+    body itself is counted while streaming, so an oversized upload is
+    rejected after at most ``MAX_FILE_SIZE`` bytes whatever the client
+    claims. Starlette's parser keeps the file in memory only up to 1MB and
+    spills the rest to disk.
+    
+    Args:
+        request: Incoming request
         
     Returns:
-        Image URL
+        Uploaded file, positioned at the start
         
     Raises:
-        HTTPException: If file is invalid or upload fails
+        HTTPException: If the body is too large or not a file upload
     """
-    # Validate content type
-    if file.content_type not in ALLOWED_TYPES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_TYPES)}"
-        )
+    limit = MAX_FILE_SIZE + MULTIPART_OVERHEAD
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > limit:
+        raise _too_large()
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data upload")
     
-    # Read file content
-    content = await file.read()
+    parser = MultiPartParser(request.headers, _capped_stream(request, limit), max_files=1, max_fields=1)
+    try:
+        form = await parser.parse()
+    except MultiPartException as e:
+        raise HTTPException(status_code=400, detail=e.message)
     
-    # Check file size
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {MAX_FILE_SIZE // 1024 // 1024}MB"
-        )
+    file = form.get("file")
+    if not isinstance(file, UploadFile):
+        await form.close()
+        raise HTTPException(status_code=400, detail="No file uploaded")
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        await form.close()
+        raise _too_large()
+    return file
+
+
+def _save_as_webp(source: BinaryIO, filepath: Path) -> None:
+    """
+    Convert an uploaded image to WebP.
     
+    ``Image.open`` only reads the header, so the format and pixel count are
+    checked before the image is decoded; decoded memory is then bounded by
+    ``MAX_PIXELS``. Pillow refuses far larger images (decompression bombs)
+    already while reading the header.
+    
+    Args:
+        source: Uploaded file object
+        filepath: Destination path
+        
+    Raises:
+        ValueError: If the file is not an allowed image or has too many pixels
+    """
     try:
-        # Open image with Pillow
-        image = Image.open(io.BytesIO(content))
+        image = Image.open(source)
+    except UnidentifiedImageError:
+        raise ValueError("Invalid image file")
+    except Image.DecompressionBombError:
+        raise ValueError(f"Image too large. Maximum: {MAX_PIXELS:,} pixels")
+    
+    with image:
+        if image.format not in ALLOWED_FORMATS:
+            raise ValueError(f"Unsupported image format: {image.format}")
+        width, height = image.size
+        if width * height > MAX_PIXELS:
+            raise ValueError(
+                f"Image too large: {width}x{height} pixels. Maximum: {MAX_PIXELS:,} pixels"
+            )
         
         # Convert to RGB if necessary (for transparency handling)
         if image.mode in ('RGBA', 'LA', 'P'):
@@ -70,12 +156,6 @@ async def upload_image(
         elif image.mode != 'RGB':
             image = image.convert('RGB')
         
-        # Generate unique filename with UUID4 + timestamp
-        timestamp = datetime.now().strftime('%Y%m%d')
-        unique_id = f"{timestamp}-{uuid.uuid4()}"
-        filename = f"{unique_id}.webp"
-        filepath = UPLOAD_DIR / filename
-        
         # Save as WebP with optimization
         image.save(
             filepath,
@@ -84,6 +164,54 @@ async def upload_image(
             method=6,  # Best compression
             optimize=True
         )
+
+
+@router.post("/image", openapi_extra={"requestBody": UPLOAD_REQUEST_BODY})
+async def upload_image(
+    request: Request,
+    current_user: Principal = Depends(require_admin)
+):
+    """
+    Upload image and convert to WebP format.
+    
+    The body is streamed to a temporary file and never held in memory as a
+    whole; authentication runs before any of it is read.
+    
+    Args:
+        request: Multipart request with the image in the ``file`` field
+        current_user: Current admin user
+        
+    Returns:
+        Image URL
+        
+    Raises:
+        HTTPException: If file is invalid or upload fails
+    """
+    file = await _receive_upload(request)
+    try:
+        # Validate content type
+        if file.content_type not in ALLOWED_TYPES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_TYPES)}"
+            )
+        
+        # Generate unique filename with UUID4 + timestamp
+        timestamp = datetime.now().strftime('%Y%m%d')
+        unique_id = f"{timestamp}-{uuid.uuid4()}"
+        filename = f"{unique_id}.webp"
+        filepath = UPLOAD_DIR / filename
+        
+        # Decoding and encoding are CPU-bound; keep them off the event loop
+        try:
+            await asyncio.to_thread(_save_as_webp, file.file, filepath)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to process image: {str(e)}"
+            )
         
         # Return only filename (not full path)
         return {
@@ -91,18 +219,14 @@ async def upload_image(
             "filename": filename,
             "size": filepath.stat().st_size
         }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to process image: {str(e)}"
-        )
+    finally:
+        await file.close()
 
 
 @router.delete("/image")
 async def delete_image(
     filename: str,
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """
     Delete an uploaded image.
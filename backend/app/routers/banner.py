@@ -1,24 +1,25 @@
 """Public Banner API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.repositories import BannerRepository
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.core.cache import response_cache
+from app.repositories import AsyncBannerRepository
 from app.schemas import BannerResponse
 from app.models.banner import PageTypeEnum
 
 router = APIRouter(prefix="/api/banners", tags=["banners"])
 
 
-def get_banner_repo(db: Session = Depends(get_db)) -> BannerRepository:
+def get_banner_repo(db: AsyncSession = Depends(get_async_db)) -> AsyncBannerRepository:
     """Dependency to get banner repository."""
-    return BannerRepository(db)
+    return AsyncBannerRepository(db)
 
 
 @router.get("/page/{page_type}", response_model=BannerResponse)
 async def get_banner_by_page_type(
     page_type: PageTypeEnum,
-    repo: BannerRepository = Depends(get_banner_repo)
+    repo: AsyncBannerRepository = Depends(get_banner_repo)
 ):
     """
     Get banner by page type (public endpoint).
@@ -33,10 +34,14 @@ async def get_banner_by_page_type(
     Raises:
         HTTPException: If banner not found
     """
-    banner = repo.get_by_page_type(page_type)
-    if not banner:
-        raise HTTPException(status_code=404, detail=f"Banner for page type {page_type} not found")
-    return banner
+    async def build() -> bytes:
+        banner = await repo.get_by_page_type(page_type)
+        if not banner:
+            raise HTTPException(status_code=404, detail=f"Banner for page type {page_type} not found")
+        return BannerResponse.model_validate(banner).model_dump_json().encode()
+    
+    key = response_cache.make_key("banners", "page", page_type=page_type)
+    return Response(content=await response_cache.aget_or_set(key, build), media_type="application/json")
 
 
 
@@ -1,14 +1,18 @@
 """API routes for feedback (public submission)."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.repositories import FeedbackRepository
 from app.schemas import FeedbackCreate, FeedbackResponse
-from app.core.email import email_service
-from app.core.captcha import generate_captcha, validate_captcha
+from app.core.outbox import email_outbox
+from app.core.captcha import generate_captcha, get_captcha_image, to_data_url, validate_captcha
 from pydantic import BaseModel
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/feedback", tags=["feedback"])
 
@@ -22,19 +26,42 @@ class CaptchaResponse(BaseModel):
     """Response model for captcha generation."""
 
     captcha_id: str
-    image_base64: str
+    image_url: str
+    image_base64: str | None = None
 
 
-@router.get("/captcha", response_model=CaptchaResponse)
-def get_feedback_captcha() -> CaptchaResponse:
+@router.get("/captcha", response_model=CaptchaResponse, response_model_exclude_none=True)
+def get_feedback_captcha(
+    inline: bool = Query(
+        settings.CAPTCHA_INLINE_IMAGE,
+        description="Also return the image as a base64 data URL (legacy frontends)",
+    ),
+) -> CaptchaResponse:
     """Generate a new captcha for feedback form."""
     try:
-        captcha_id, image_base64 = generate_captcha()
-        return CaptchaResponse(captcha_id=captcha_id, image_base64=image_base64)
+        captcha_id, image_bytes = generate_captcha()
+        return CaptchaResponse(
+            captcha_id=captcha_id,
+            image_url=f"{settings.API_PREFIX}{router.prefix}/captcha/{captcha_id}.png",
+            image_base64=to_data_url(image_bytes) if inline else None,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate captcha: {e}")
 
 
+@router.get("/captcha/{captcha_id}.png")
+def get_feedback_captcha_image(captcha_id: str) -> Response:
+    """Return the raw PNG image of a pending captcha."""
+    image = get_captcha_image(captcha_id)
+    if image is None:
+        raise HTTPException(status_code=404, detail="Invalid or expired captcha")
+    return Response(
+        content=image,
+        media_type="image/png",
+        headers={"Cache-Control": "no-store, max-age=0", "Pragma": "no-cache"},
+    )
+
+
 @router.post("", response_model=FeedbackResponse, status_code=201)
 def create_feedback(
     feedback_in: FeedbackCreate,
@@ -51,7 +78,8 @@ def create_feedback(
         Created feedback
         
     Note:
-        This endpoint sends an email notification to the configured email address.
+        The email notification is queued in the outbox and delivered in the
+        background, so a slow SMTP server never delays this request.
     """
     # Validate captcha
     try:
@@ -65,21 +93,24 @@ def create_feedback(
     # Remove captcha fields before persistence
     payload = feedback_in.model_dump(exclude={"captcha_id", "captcha_answer"})
 
+    # Queue email notification; committed together with the feedback row
+    if settings.FEEDBACK_TO_EMAIL:
+        email_outbox.enqueue(
+            repo.db,
+            kind="feedback",
+            to_email=settings.FEEDBACK_TO_EMAIL,
+            payload={
+                "name": payload["name"],
+                "email": payload["email"],
+                "subject": payload.get("subject"),
+                "message": payload["message"],
+            },
+        )
+    else:
+        logger.warning("FEEDBACK_TO_EMAIL not configured. Skipping email notification.")
+
     # Create feedback in database
     feedback = repo.create(payload)
-    
-    # Send email notification (non-blocking, failures are logged but don't affect response)
-    try:
-        email_service.send_feedback_notification(
-            name=feedback.name,
-            email=feedback.email,
-            subject=feedback.subject,
-            message=feedback.message
-        )
-    except Exception as e:
-        # Log error but don't fail the request
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Failed to send feedback email: {str(e)}")
+    email_outbox.notify()
     
     return feedback
@@ -1,16 +1,19 @@
 """API routes for news articles."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.repositories import NewsRepository
+from app.core.cache import response_cache
+from app.core.invalidation import invalidation_bus
+from app.repositories import DuplicateKeyError, InvalidCursorError, NewsRepository
 from app.schemas import (
     NewsCreate,
     NewsUpdate,
     NewsResponse,
     NewsListResponse,
 )
+from app.schemas.fields import parse_fields, partial_list_model, partial_model
 
 router = APIRouter(prefix="/news", tags=["news"])
 
@@ -20,10 +23,25 @@ def get_news_repo(db: Session = Depends(get_db)) -> NewsRepository:
     return NewsRepository(db)
 
 
+def get_fields(
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return, e.g. id,title,image,date"
+    ),
+) -> tuple[str, ...] | None:
+    """Dependency parsing the sparse fieldset against NewsResponse."""
+    try:
+        return parse_fields(fields, NewsResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("", response_model=NewsListResponse)
 def list_news(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=100, description="Number of items to return"),
+    include_total: bool = Query(True, description="Also return the total count"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (keyset pagination)"),
+    fields: tuple[str, ...] | None = Depends(get_fields),
     repo: NewsRepository = Depends(get_news_repo),
 ):
     """
@@ -32,20 +50,40 @@ def list_news(
     Args:
         skip: Number of items to skip for pagination
         limit: Maximum number of items to return
+        include_total: Whether to compute the total count
+        cursor: Cursor of the next page (replaces skip)
+        fields: Fields to return (default: the list summary)
         repo: News repository instance
         
     Returns:
         List of news articles with total count
     """
-    items = repo.get_all(skip=skip, limit=limit)
-    total = repo.count()
+    def build() -> bytes:
+        try:
+            page = repo.get_page(
+                skip=skip, limit=limit, include_total=include_total, cursor=cursor, fields=fields
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        response_model = (
+            NewsListResponse if fields is None
+            else partial_list_model(NewsListResponse, NewsResponse, fields)
+        )
+        return response_model(
+            total=page.total, items=page.items, next_cursor=page.next_cursor
+        ).model_dump_json().encode()
     
-    return NewsListResponse(total=total, items=items)
+    key = response_cache.make_key(
+        "news", "list", skip=skip, limit=limit, include_total=include_total, cursor=cursor,
+        fields=",".join(fields) if fields else None,
+    )
+    return Response(content=response_cache.get_or_set(key, build), media_type="application/json")
 
 
 @router.get("/{news_id}", response_model=NewsResponse)
 def get_news(
     news_id: str,
+    fields: tuple[str, ...] | None = Depends(get_fields),
     repo: NewsRepository = Depends(get_news_repo),
 ):
     """
@@ -53,6 +91,7 @@ def get_news(
     
     Args:
         news_id: News identifier
+        fields: Fields to return (default: all)
         repo: News repository instance
         
     Returns:
@@ -61,9 +100,12 @@ def get_news(
     Raises:
         HTTPException: If news not found
     """
-    news = repo.get_by_id(news_id)
+    news = repo.get_by_id(news_id, fields)
     if not news:
         raise HTTPException(status_code=404, detail="News not found")
+    if fields is not None:
+        content = partial_model(NewsResponse, fields).model_validate(news).model_dump_json()
+        return Response(content=content, media_type="application/json")
     return news
 
 
@@ -85,11 +127,12 @@ def create_news(
     Raises:
         HTTPException: If news with same ID already exists
     """
-    existing = repo.get_by_id(news_in.id)
-    if existing:
+    try:
+        news = repo.create(news_in.model_dump())
+    except DuplicateKeyError:
         raise HTTPException(status_code=400, detail="News with this ID already exists")
-    
-    return repo.create(news_in.model_dump())
+    invalidation_bus.publish("news")
+    return news
 
 
 @router.put("/{news_id}", response_model=NewsResponse)
@@ -115,6 +158,7 @@ def update_news(
     news = repo.update(news_id, news_in.model_dump(exclude_unset=True))
     if not news:
         raise HTTPException(status_code=404, detail="News not found")
+    invalidation_bus.publish("news")
     return news
 
 
@@ -136,6 +180,7 @@ def delete_news(
     success = repo.delete(news_id)
     if not success:
         raise HTTPException(status_code=404, detail="News not found")
+    invalidation_bus.publish("news")
 
 
 @router.post("/{news_id}/view", response_model=NewsResponse)
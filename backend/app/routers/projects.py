@@ -1,17 +1,20 @@
 """API routes for projects (games and websites)."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.core.cache import response_cache
+from app.core.invalidation import invalidation_bus
 from app.models import CategoryEnum
-from app.repositories import ProjectRepository
+from app.repositories import DuplicateKeyError, InvalidCursorError, ProjectRepository
 from app.schemas import (
     ProjectCreate,
     ProjectUpdate,
     ProjectResponse,
     ProjectListResponse,
 )
+from app.schemas.fields import parse_fields, partial_list_model, partial_model
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -21,11 +24,26 @@ def get_project_repo(db: Session = Depends(get_db)) -> ProjectRepository:
     return ProjectRepository(db)
 
 
+def get_fields(
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return, e.g. id,title,image,date"
+    ),
+) -> tuple[str, ...] | None:
+    """Dependency parsing the sparse fieldset against ProjectResponse."""
+    try:
+        return parse_fields(fields, ProjectResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("", response_model=ProjectListResponse)
 def list_projects(
     category: CategoryEnum | None = Query(None, description="Filter by category"),
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=100, description="Number of items to return"),
+    include_total: bool = Query(True, description="Also return the total count"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (keyset pagination)"),
+    fields: tuple[str, ...] | None = Depends(get_fields),
     repo: ProjectRepository = Depends(get_project_repo),
 ):
     """
@@ -35,24 +53,47 @@ def list_projects(
         category: Optional category filter (GAME or WEBSITE)
         skip: Number of items to skip for pagination
         limit: Maximum number of items to return
+        include_total: Whether to compute the total count
+        cursor: Cursor of the next page (replaces skip)
+        fields: Fields to return (default: the list summary)
         repo: Project repository instance
         
     Returns:
         List of projects with total count
     """
-    if category:
-        items = repo.get_by_category(category, skip=skip, limit=limit)
-        total = repo.count_by_category(category)
-    else:
-        items = repo.get_all(skip=skip, limit=limit)
-        total = repo.count()
+    def build() -> bytes:
+        try:
+            if category:
+                page = repo.get_page_by_category(
+                    category, skip=skip, limit=limit, include_total=include_total,
+                    cursor=cursor, fields=fields,
+                )
+            else:
+                page = repo.get_page(
+                    skip=skip, limit=limit, include_total=include_total, cursor=cursor, fields=fields
+                )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        response_model = (
+            ProjectListResponse if fields is None
+            else partial_list_model(ProjectListResponse, ProjectResponse, fields)
+        )
+        return response_model(
+            total=page.total, items=page.items, next_cursor=page.next_cursor
+        ).model_dump_json().encode()
     
-    return ProjectListResponse(total=total, items=items)
+    key = response_cache.make_key(
+        "projects", "list", category=category, skip=skip, limit=limit,
+        include_total=include_total, cursor=cursor,
+        fields=",".join(fields) if fields else None,
+    )
+    return Response(content=response_cache.get_or_set(key, build), media_type="application/json")
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 def get_project(
     project_id: str,
+    fields: tuple[str, ...] | None = Depends(get_fields),
     repo: ProjectRepository = Depends(get_project_repo),
 ):
     """
@@ -60,6 +101,7 @@ def get_project(
     
     Args:
         project_id: Project identifier
+        fields: Fields to return (default: all)
         repo: Project repository instance
         
     Returns:
@@ -68,9 +110,12 @@ def get_project(
     Raises:
         HTTPException: If project not found
     """
-    project = repo.get_by_id(project_id)
+    project = repo.get_by_id(project_id, fields)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    if fields is not None:
+        content = partial_model(ProjectResponse, fields).model_validate(project).model_dump_json()
+        return Response(content=content, media_type="application/json")
     return project
 
 
@@ -92,11 +137,12 @@ def create_project(
     Raises:
         HTTPException: If project with same ID already exists
     """
-    existing = repo.get_by_id(project_in.id)
-    if existing:
+    try:
+        project = repo.create(project_in.model_dump())
+    except DuplicateKeyError:
         raise HTTPException(status_code=400, detail="Project with this ID already exists")
-    
-    return repo.create(project_in.model_dump())
+    invalidation_bus.publish("projects")
+    return project
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
@@ -122,6 +168,7 @@ def update_project(
     project = repo.update(project_id, project_in.model_dump(exclude_unset=True))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    invalidation_bus.publish("projects")
     return project
 
 
@@ -143,6 +190,7 @@ def delete_project(
     success = repo.delete(project_id)
     if not success:
         raise HTTPException(status_code=404, detail="Project not found")
+    invalidation_bus.publish("projects")
 
 
 @router.post("/{project_id}/view", response_model=ProjectResponse)
@@ -4,12 +4,14 @@ from app.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
     ProjectResponse,
+    ProjectSummary,
     ProjectListResponse,
 )
 from app.schemas.news import (
     NewsCreate,
     NewsUpdate,
     NewsResponse,
+    NewsSummary,
     NewsListResponse,
 )
 from app.schemas.about import (
@@ -34,10 +36,12 @@ __all__ = [
     "ProjectCreate",
     "ProjectUpdate",
     "ProjectResponse",
+    "ProjectSummary",
     "ProjectListResponse",
     "NewsCreate",
     "NewsUpdate",
     "NewsResponse",
+    "NewsSummary",
     "NewsListResponse",
     "AboutUsCreate",
     "AboutUsUpdate",
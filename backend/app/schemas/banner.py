@@ -38,6 +38,6 @@ class BannerResponse(BannerBase):
 class BannerListResponse(BaseModel):
     """Schema for list of banners response."""
     
-    total: int
+    total: int | None = None  # None when requested with include_total=false
     items: list[BannerResponse]
 
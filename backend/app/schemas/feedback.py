@@ -35,8 +35,9 @@ class FeedbackResponse(FeedbackBase):
 class FeedbackListResponse(BaseModel):
     """Schema for list of feedback response."""
     
-    total: int
+    total: int | None = None  # None when requested with include_total=false
     items: list[FeedbackResponse]
+    next_cursor: str | None = None  # Pass as ?cursor= for the next page; None on the last page
 
 
 class FeedbackUpdate(BaseModel):
@@ -0,0 +1,75 @@
+"""Sparse fieldsets (``?fields=``) for read endpoints."""
+
+from functools import lru_cache
+from pydantic import BaseModel, create_model
+
+
+def parse_fields(raw: str | None, model: type[BaseModel]) -> tuple[str, ...] | None:
+    """
+    Parse a comma-separated ``fields`` parameter.
+
+    Args:
+        raw: Query parameter value, e.g. ``id,title,image``
+        model: Response schema the fields are chosen from
+
+    Returns:
+        Selected field names in schema order, or None if not given
+
+    Raises:
+        ValueError: If a field is unknown or none is selected
+    """
+    if raw is None:
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    if not requested:
+        raise ValueError("fields must name at least one field")
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(model.model_fields)}"
+        )
+    return tuple(name for name in model.model_fields if name in requested)
+
+
+@lru_cache(maxsize=256)
+def partial_model(model: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    """
+    Build (once per field set) a schema with only the selected fields.
+
+    Args:
+        model: Full response schema
+        fields: Field names as returned by ``parse_fields``
+
+    Returns:
+        Schema class reading the fields from ORM attributes
+    """
+    return create_model(
+        f"{model.__name__}[{','.join(fields)}]",
+        __config__={"from_attributes": True},
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields},
+    )
+
+
+@lru_cache(maxsize=256)
+def partial_list_model(
+    list_model: type[BaseModel],
+    item_model: type[BaseModel],
+    fields: tuple[str, ...],
+) -> type[BaseModel]:
+    """
+    Build (once per field set) a list response whose items are partial.
+
+    Args:
+        list_model: List response schema with an ``items`` field
+        item_model: Full item schema the fields are chosen from
+        fields: Field names as returned by ``parse_fields``
+
+    Returns:
+        List response schema class
+    """
+    return create_model(
+        f"{list_model.__name__}[{','.join(fields)}]",
+        __base__=list_model,
+        items=(list[partial_model(item_model, fields)], ...),
+    )
@@ -40,9 +40,27 @@ class NewsResponse(NewsBase):
         from_attributes = True
 
 
+class NewsSummary(BaseModel):
+    """Schema for a news article in list responses (without the full content)."""
+    
+    id: str
+    title: str
+    excerpt: str | None = None
+    date: Date | None = None
+    image: str | None = None
+    author: str | None = None
+    views: int
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
 class NewsListResponse(BaseModel):
     """Schema for list of news response."""
     
-    total: int
-    items: list[NewsResponse]
+    total: int | None = None  # None when requested with include_total=false
+    items: list[NewsSummary]
+    next_cursor: str | None = None  # Pass as ?cursor= for the next page; None on the last page
 
@@ -43,9 +43,28 @@ class ProjectResponse(ProjectBase):
         from_attributes = True
 
 
+class ProjectSummary(BaseModel):
+    """Schema for a project in list responses (without the description body)."""
+    
+    id: str
+    title: str
+    image: str | None = None
+    category: CategoryEnum
+    date: Date | None = None
+    tags: list[str] | None = None
+    link: str | None = None
+    views: int
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
 class ProjectListResponse(BaseModel):
     """Schema for list of projects response."""
     
-    total: int
-    items: list[ProjectResponse]
+    total: int | None = None  # None when requested with include_total=false
+    items: list[ProjectSummary]
+    next_cursor: str | None = None  # Pass as ?cursor= for the next page; None on the last page
 
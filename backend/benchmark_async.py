@@ -0,0 +1,132 @@
+"""
+Event loop stall benchmark.
+比較慢查詢期間其他請求的延遲（同步 Session vs AsyncSession）
+
+Usage:
+    uv run python benchmark_async.py
+    uv run python benchmark_async.py --slow 1.0 --requests 20
+    DATABASE_URL=mysql+pymysql://... uv run python benchmark_async.py
+
+Everything runs on one event loop, like a single Uvicorn worker. A slow
+query (``SLEEP``/``pg_sleep``; a ``sleep()`` function is registered on
+SQLite) is started from an ``async def`` handler, and while it runs
+``GET /api/admin/me`` is requested repeatedly. "blocking" runs the slow
+query through the sync ``Session`` inside ``async def`` (how the admin
+handlers used to work), which freezes the loop; "async" awaits it on an
+``AsyncSession``. Without DATABASE_URL a temporary SQLite database is
+created and migrated.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{Path(tempfile.mkdtemp()) / 'benchmark.db'}"
+
+import httpx
+from sqlalchemy import event, text
+
+from app.database import AsyncSessionLocal, SessionLocal, async_engine, engine
+from app.db_migrate import migrate
+from app.main import app
+
+
+def _slow_query() -> str:
+    """SQL sleeping for ``:seconds`` on the configured database."""
+    if engine.dialect.name == "postgresql":
+        return "SELECT pg_sleep(:seconds)"
+    return "SELECT SLEEP(:seconds)"
+
+
+def _register_sqlite_sleep() -> None:
+    """Give SQLite connections a ``sleep(seconds)`` function."""
+    def add_function(dbapi_connection, connection_record):
+        dbapi_connection.create_function("sleep", 1, lambda seconds: time.sleep(seconds) or 0)
+
+    for target in (engine, async_engine.sync_engine):
+        event.listen(target, "connect", add_function)
+
+
+@app.get("/benchmark/slow/blocking", include_in_schema=False)
+async def slow_blocking(seconds: float):
+    """The old pattern: sync Session inside ``async def``."""
+    db = SessionLocal()
+    try:
+        db.execute(text(_slow_query()), {"seconds": seconds})
+    finally:
+        db.close()
+    return {"ok": True}
+
+
+@app.get("/benchmark/slow/async", include_in_schema=False)
+async def slow_async(seconds: float):
+    """The current pattern: awaited AsyncSession."""
+    async with AsyncSessionLocal() as db:
+        await db.execute(text(_slow_query()), {"seconds": seconds})
+    return {"ok": True}
+
+
+async def _run(mode: str, slow: float, requests: int, email: str, password: str) -> list[float]:
+    """Latencies (ms) of admin requests sent while the slow query runs."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.post(
+            "/api/admin/login", json={"email": email, "password": password}
+        )
+        response.raise_for_status()
+        await client.get("/api/admin/me")
+
+        # Requests arrive on a fixed schedule; one that arrives while the
+        # loop is frozen waits until it is free again, so latency is
+        # measured from its arrival, not from when it could be sent.
+        interval = slow / requests
+        slow_request = asyncio.create_task(
+            client.get(f"/benchmark/slow/{mode}", params={"seconds": slow})
+        )
+        start = time.perf_counter()
+        timings = []
+        for i in range(requests):
+            arrival = start + i * interval
+            await asyncio.sleep(max(0.0, arrival - time.perf_counter()))
+            (await client.get("/api/admin/me")).raise_for_status()
+            timings.append((time.perf_counter() - arrival) * 1000)
+        (await slow_request).raise_for_status()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--slow", type=float, default=0.5, help="Slow query duration (s)")
+    parser.add_argument("--requests", type=int, default=10, help="Admin requests during the slow query")
+    parser.add_argument("--email", default="admin@admin.com", help="Admin login")
+    parser.add_argument("--password", default="admin123", help="Admin password")
+    args = parser.parse_args()
+
+    # Keep SQL echo out of the results
+    engine.echo = async_engine.echo = False
+    # Before migrate() opens the first pooled connection
+    if engine.dialect.name == "sqlite":
+        _register_sqlite_sleep()
+    migrate()
+
+    print("=" * 60)
+    print("Event loop stall benchmark")
+    print("=" * 60)
+    print(f"Database: {engine.dialect.name}, slow query: {args.slow:.2f} s, {args.requests} requests")
+    print()
+
+    for mode in ("blocking", "async"):
+        timings = asyncio.run(_run(mode, args.slow, args.requests, args.email, args.password))
+        print(
+            f"{mode:>8}: GET /api/admin/me median {statistics.median(timings):7.2f} ms, "
+            f"max {max(timings):7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Captcha rendering microbenchmark.
+比較驗證碼圖片產生速度（原始版本 vs 快取字型資源）
+
+Usage:
+    uv run python benchmark_captcha.py
+    uv run python benchmark_captcha.py --iterations 500
+
+"baseline" is a verbatim copy of the renderer before font caching: it
+resolves the font and measures the text with ``textbbox`` on every call.
+"cached" is the current ``captcha._generate_image``, which reuses the
+font and per-glyph advance widths. Both draw the same lines and dots.
+"""
+
+import argparse
+import io
+import random
+import statistics
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+from app.core import captcha
+
+_WIDTH, _HEIGHT = captcha._WIDTH, captcha._HEIGHT
+
+
+def _baseline_generate_image(text: str) -> bytes:
+    """Generate captcha image and return PNG bytes."""
+    # Base image
+    image = Image.new("RGB", (_WIDTH, _HEIGHT), (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+
+    # Try to use a default PIL font
+    # Choose font and size
+    font = None
+    font_size = int(_HEIGHT * 0.65)  # scale with height
+    try:
+        font = ImageFont.truetype("arial.ttf", font_size)
+    except Exception:
+        try:
+            font = ImageFont.truetype("DejaVuSans.ttf", font_size)
+        except Exception:
+            try:
+                # Default bitmap font (smaller)
+                font = ImageFont.load_default()
+            except Exception:  # pragma: no cover
+                font = None
+
+    # Get text size (compatible with Pillow 10+)
+    try:
+        # Pillow 10+ uses textbbox
+        if hasattr(draw, 'textbbox'):
+            bbox = draw.textbbox((0, 0), text, font=font)
+            text_width = bbox[2] - bbox[0]
+            text_height = bbox[3] - bbox[1]
+        else:
+            # Fallback for older Pillow versions
+            text_width, text_height = draw.textsize(text, font=font)
+    except (AttributeError, TypeError) as e:
+        # If both fail, use estimated size
+        text_width = len(text) * 10
+        text_height = 20
+
+    # Slightly randomize text position
+    x = max(5, (_WIDTH - text_width) / 2 + random.randint(-5, 5))
+    y = max(5, (_HEIGHT - text_height) / 2 + random.randint(-3, 3))
+
+    # Draw text with random color (darker for better visibility)
+    text_color = (random.randint(0, 100), random.randint(0, 100), random.randint(0, 100))
+    draw.text((x, y), text, fill=text_color, font=font)
+
+    # Add noise lines
+    for _ in range(6):
+        start = (random.randint(0, _WIDTH), random.randint(0, _HEIGHT))
+        end = (random.randint(0, _WIDTH), random.randint(0, _HEIGHT))
+        draw.line([start, end], fill=(random.randint(100, 200), random.randint(100, 200), random.randint(100, 200)), width=1)
+
+    # Add some noise dots
+    for _ in range(20):
+        x_dot = random.randint(0, _WIDTH)
+        y_dot = random.randint(0, _HEIGHT)
+        draw.point((x_dot, y_dot), fill=(random.randint(150, 255), random.randint(150, 255), random.randint(150, 255)))
+
+    # Save as PNG
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    image_bytes = buffer.getvalue()
+
+    if not image_bytes:
+        raise ValueError("Failed to generate image bytes")
+
+    return image_bytes
+
+
+def _bench(render, iterations: int) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        text = captcha._random_text()
+        start = time.perf_counter()
+        render(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Captcha rendering benchmark")
+    print("=" * 60)
+
+    results = {}
+    for label, render in (("baseline", _baseline_generate_image), ("cached", captcha._generate_image)):
+        render("WARMUP")
+        timings = _bench(render, args.iterations)
+        results[label] = statistics.median(timings)
+        print(
+            f"{label:>8}: median {results[label]:.3f} ms, "
+            f"p95 {statistics.quantiles(timings, n=20)[-1]:.3f} ms "
+            f"({args.iterations} renders)"
+        )
+
+    print()
+    print(f"Speedup: {results['baseline'] / results['cached']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Image upload memory benchmark.
+比較圖片上傳的記憶體峰值（整檔讀入 vs 串流）
+
+Usage:
+    uv run python benchmark_upload.py
+    uv run python benchmark_upload.py --size-mb 8 --concurrency 4
+
+"buffered" is the previous handler: ``await file.read()`` followed by
+``Image.open(io.BytesIO(content))``. "streaming" is the current
+``/api/admin/upload/image``. Requests are fed to the ASGI app in 64KB
+chunks, like a server would, and tracemalloc records the peak Python
+memory while they run (Pillow's decoded pixels are allocated outside
+Python and bounded separately by MAX_UPLOAD_PIXELS). "oversized" sends a
+body four times the cap without a Content-Length to show how much is
+read before the upload is aborted.
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Iterator
+
+from fastapi import FastAPI, File, UploadFile
+from PIL import Image
+
+from app.dependencies import require_admin
+from app.routers.admin import upload
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _make_png(size_mb: float) -> bytes:
+    """Random-noise PNG (incompressible) of roughly ``size_mb``."""
+    side = int((size_mb * 1024 * 1024 / 3) ** 0.5)
+    image = Image.frombytes("RGB", (side, side), os.urandom(side * side * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+def _multipart(data: bytes) -> tuple[bytes, bytes, bytes]:
+    """Boundary, part prefix and closing suffix for a single ``file`` field."""
+    boundary = uuid.uuid4().hex
+    prefix = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="bench.png"\r\n'
+        "Content-Type: image/png\r\n\r\n"
+    ).encode()
+    suffix = f"\r\n--{boundary}--\r\n".encode()
+    return boundary.encode(), prefix, suffix
+
+
+def _chunks(prefix: bytes, data: bytes, suffix: bytes, repeat: int = 1) -> Iterator[bytes]:
+    """Multipart body in CHUNK_SIZE pieces, with ``data`` sent ``repeat`` times."""
+    yield prefix
+    for _ in range(repeat):
+        for start in range(0, len(data), CHUNK_SIZE):
+            yield data[start:start + CHUNK_SIZE]
+    yield suffix
+
+
+async def _request(app, path: str, boundary: bytes, body: Iterator[bytes],
+                   content_length: int | None) -> tuple[int, int]:
+    """
+    Send one streamed request straight to the ASGI app.
+
+    Returns:
+        Response status and number of body bytes the app consumed
+    """
+    headers = [(b"content-type", b"multipart/form-data; boundary=" + boundary)]
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "POST", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "root_path": "", "headers": headers,
+        "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+    }
+    sent = 0
+    status = 0
+
+    async def receive():
+        nonlocal sent
+        chunk = next(body, None)
+        if chunk is None:
+            return {"type": "http.request", "body": b"", "more_body": False}
+        sent += len(chunk)
+        return {"type": "http.request", "body": chunk, "more_body": True}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status, sent
+
+
+def _build_app() -> FastAPI:
+    """App with the real upload router and the previous buffered handler."""
+    app = FastAPI()
+    app.include_router(upload.router)
+    app.dependency_overrides[require_admin] = lambda: None
+
+    @app.post("/buffered")
+    async def buffered(file: UploadFile = File(...)):
+        content = await file.read()
+        if len(content) > upload.MAX_FILE_SIZE:
+            return {"success": False}
+        # Same conversion as the real handler; only the buffering differs
+        upload._save_as_webp(io.BytesIO(content), upload.UPLOAD_DIR / f"{uuid.uuid4()}.webp")
+        return {"success": True}
+
+    return app
+
+
+async def _measure(app, path: str, boundary: bytes, bodies: list[Iterator[bytes]],
+                   content_length: int | None) -> tuple[float, float, list[tuple[int, int]]]:
+    """Send the bodies concurrently; peak traced MB, seconds and results."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        _request(app, path, boundary, body, content_length) for body in bodies
+    ])
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024, elapsed, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=8.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Image upload memory benchmark")
+    print("=" * 60)
+
+    data = _make_png(args.size_mb)
+    boundary, prefix, suffix = _multipart(data)
+    length = len(prefix) + len(data) + len(suffix)
+    print(f"Upload: {len(data) / 1024 / 1024:.2f} MB PNG x {args.concurrency} concurrent requests")
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        upload.UPLOAD_DIR = Path(tmp)
+        app = _build_app()
+
+        for label, path in (("buffered", "/buffered"), ("streaming", "/api/admin/upload/image")):
+            bodies = [_chunks(prefix, data, suffix) for _ in range(args.concurrency)]
+            peak, elapsed, results = asyncio.run(_measure(app, path, boundary, bodies, length))
+            statuses = sorted({status for status, _ in results})
+            print(f"{label:>10}: peak {peak:7.2f} MB traced, {elapsed:.2f} s, status {statuses}")
+
+        # No Content-Length, so only the streaming count can stop it
+        chunk = os.urandom(CHUNK_SIZE)
+        repeat = upload.MAX_FILE_SIZE * 4 // CHUNK_SIZE
+        peak, _, results = asyncio.run(_measure(
+            app, "/api/admin/upload/image", boundary, [_chunks(prefix, chunk, suffix, repeat)], None
+        ))
+        status, consumed = results[0]
+        print(
+            f"{'oversized':>10}: {repeat * CHUNK_SIZE / 1024 / 1024:.0f} MB sent, aborted with {status} "
+            f"after {consumed / 1024 / 1024:.2f} MB, peak {peak:.2f} MB traced"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""
+Gunicorn server hooks.
+
+Gunicorn loads ``./gunicorn.conf.py`` automatically, so this applies to
+every ``gunicorn app.main:app ...`` started from the backend/ directory.
+Command-line options still take precedence for everything else.
+"""
+
+
+def on_starting(server):
+    """Apply pending database migrations once, before any worker is forked."""
+    from app.database import engine
+    from app.db_migrate import migrate
+
+    version = migrate()
+    # Workers must not inherit the master's pooled connections
+    engine.dispose()
+    server.log.info(f"Database schema is at version {version}")
@@ -0,0 +1,88 @@
+"""Shared fixtures: a temporary SQLite database and a local SMTP stand-in."""
+
+import os
+import socket
+import tempfile
+from pathlib import Path
+
+# Configure before the app (and its engines) is imported
+_DB_DIR = tempfile.mkdtemp(prefix="studio-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_DB_DIR) / 'test.db'}"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["FEEDBACK_TO_EMAIL"] = "owner@example.com"
+os.environ["SMTP_STARTTLS"] = "false"
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+from fastapi.testclient import TestClient
+
+import app.models  # noqa: F401  (registers every table)
+from app.core.email import email_service
+from app.database import Base, SessionLocal, engine
+from app.main import app as main_app
+
+
+def free_port() -> int:
+    """A TCP port nothing listens on (yet)."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class RecordingHandler:
+    """aiosmtpd handler keeping every received envelope."""
+
+    def __init__(self):
+        self.envelopes = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.envelopes.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    """Fresh tables for every test."""
+    Base.metadata.create_all(engine)
+    yield
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def db():
+    """Session on the test database."""
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client():
+    """Test client (the lifespan and its background threads are not started)."""
+    return TestClient(main_app)
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    """
+    Local SMTP stand-in accepting any login, with the email service
+    pointed at it.
+    """
+    handler = RecordingHandler()
+    controller = Controller(
+        handler,
+        hostname="127.0.0.1",
+        port=free_port(),
+        authenticator=lambda *args: AuthResult(success=True),
+        auth_require_tls=False,
+    )
+    controller.start()
+    monkeypatch.setattr(email_service, "host", controller.hostname)
+    monkeypatch.setattr(email_service, "port", controller.port)
+    monkeypatch.setattr(email_service, "user", "outbox@example.com")
+    monkeypatch.setattr(email_service, "password", "secret")
+    monkeypatch.setattr(email_service, "starttls", False)
+    yield handler
+    email_service.close()
+    controller.stop()
@@ -0,0 +1,150 @@
+"""Email outbox: transactional enqueue, delivery, retries and reclaiming."""
+
+import email
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.email import email_service
+from app.core.outbox import EmailOutbox
+from app.main import app as main_app
+from app.models import Feedback
+from app.models.outbox import OutboxMessage, OutboxStatus
+from app.repositories import FeedbackRepository
+from app.routers import feedback as feedback_router
+
+from .conftest import free_port
+
+FEEDBACK = {
+    "name": "Ada",
+    "email": "ada@example.com",
+    "subject": "Hello",
+    "message": "Nice work",
+    "captcha_id": "captcha",
+    "captcha_answer": "ANSWER",
+}
+
+
+@pytest.fixture
+def outbox():
+    """Outbox sending feedback notifications one by one."""
+    return EmailOutbox(backoff_seconds=30, lock_timeout=300, max_attempts=3, digest_enabled=False)
+
+
+@pytest.fixture(autouse=True)
+def accept_captcha(monkeypatch):
+    """Skip captcha validation on feedback submissions."""
+    monkeypatch.setattr(feedback_router, "validate_captcha", lambda **kwargs: None)
+
+
+def _enqueue(db, outbox, subject="Subject") -> OutboxMessage:
+    message = outbox.enqueue(
+        db, kind="email", to_email="someone@example.com",
+        payload={"subject": subject, "body": "Body"},
+    )
+    db.commit()
+    return message
+
+
+def test_feedback_and_outbox_row_commit_together(client, db):
+    response = client.post("/api/feedback", json=FEEDBACK)
+
+    assert response.status_code == 201
+    assert db.query(Feedback).count() == 1
+    message = db.query(OutboxMessage).one()
+    assert message.kind == "feedback"
+    assert message.to_email == "owner@example.com"
+    assert message.status == OutboxStatus.PENDING
+    assert message.payload["message"] == "Nice work"
+
+
+def test_outbox_row_rolls_back_with_feedback(db, monkeypatch):
+    def failing_create(self, data):
+        self.db.add(Feedback(**data))
+        self.db.flush()
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(FeedbackRepository, "create", failing_create)
+    client = TestClient(main_app, raise_server_exceptions=False)
+
+    response = client.post("/api/feedback", json=FEEDBACK)
+
+    assert response.status_code == 500
+    assert db.query(Feedback).count() == 0
+    assert db.query(OutboxMessage).count() == 0
+
+
+def test_due_messages_are_delivered(smtp_server, db, outbox):
+    _enqueue(db, outbox, subject="First")
+    _enqueue(db, outbox, subject="Second")
+
+    assert outbox.process_due() == 2
+
+    subjects = [email.message_from_bytes(envelope.content)["Subject"] for envelope in smtp_server.envelopes]
+    assert subjects == ["First", "Second"]
+    assert all(envelope.rcpt_tos == ["someone@example.com"] for envelope in smtp_server.envelopes)
+    db.expire_all()
+    for message in db.query(OutboxMessage):
+        assert message.status == OutboxStatus.SENT
+        assert message.sent_at is not None
+        assert message.claim_token is None
+
+
+def test_failed_delivery_retries_with_exponential_backoff(db, outbox, monkeypatch):
+    # Nothing listens on this port: every delivery is refused
+    monkeypatch.setattr(email_service, "host", "127.0.0.1")
+    monkeypatch.setattr(email_service, "port", free_port())
+    monkeypatch.setattr(email_service, "user", "outbox@example.com")
+    monkeypatch.setattr(email_service, "password", "secret")
+    message = _enqueue(db, outbox)
+
+    delays = []
+    for _ in range(2):
+        started = datetime.utcnow()
+        assert outbox.process_due() == 0
+        db.refresh(message)
+        assert message.status == OutboxStatus.PENDING
+        assert message.last_error
+        delays.append((message.next_attempt_at - started).total_seconds())
+
+        # Not due yet: a poll right away leaves it alone
+        attempts = message.attempts
+        outbox.process_due()
+        db.refresh(message)
+        assert message.attempts == attempts
+
+        message.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+        db.commit()
+
+    assert [message.attempts, round(delays[0]), round(delays[1])] == [2, 30, 60]
+
+    # The last allowed attempt gives up
+    outbox.process_due()
+    db.refresh(message)
+    assert message.attempts == 3
+    assert message.status == OutboxStatus.FAILED
+
+
+def test_expired_claim_is_reclaimed(smtp_server, db, outbox):
+    now = datetime.utcnow()
+    # Claimed by a worker that crashed: the lock has run out
+    stale = _enqueue(db, outbox, subject="Stale")
+    stale.status = OutboxStatus.SENDING
+    stale.claim_token = "crashed-worker"
+    stale.locked_until = now - timedelta(seconds=1)
+    # Claimed by a worker that is still sending it
+    held = _enqueue(db, outbox, subject="Held")
+    held.status = OutboxStatus.SENDING
+    held.claim_token = "live-worker"
+    held.locked_until = now + timedelta(seconds=300)
+    db.commit()
+
+    assert outbox.process_due() == 1
+
+    db.refresh(stale)
+    db.refresh(held)
+    assert stale.status == OutboxStatus.SENT
+    assert held.status == OutboxStatus.SENDING
+    assert held.claim_token == "live-worker"
+    assert [email.message_from_bytes(envelope.content)["Subject"] for envelope in smtp_server.envelopes] == ["Stale"]
@@ -10,7 +10,7 @@ import { MarkdownContent } from './components/MarkdownContent';
 import { HERO_IMAGES } from './constants';
 import { ArrowRight, Calendar, User, Star, Zap, Mail, Loader2, AlertCircle, Eye } from 'lucide-react';
 import { projectsApi, newsApi, aboutApi } from './api';
-import type { ProjectItem, NewsItem, AboutUs } from './types';
+import type { ProjectSummary, NewsSummary, AboutUs } from './types';
 import { getImageUrl } from './api/config';
 import { useSEO } from './hooks/useSEO';
 import { generatePageSEO, ORGANIZATION_DATA, generateArticleData } from './utils/seo';
@@ -156,7 +156,7 @@ const AboutPage: React.FC = () => {
 };
 
 const NewsPage: React.FC = () => {
-  const [news, setNews] = useState<NewsItem[]>([]);
+  const [news, setNews] = useState<NewsSummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -251,7 +251,7 @@ const NewsPage: React.FC = () => {
 };
 
 const HomePage: React.FC = () => {
-  const [featuredGames, setFeaturedGames] = useState<ProjectItem[]>([]);
+  const [featuredGames, setFeaturedGames] = useState<ProjectSummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -345,7 +345,7 @@ const HomePage: React.FC = () => {
 
 // Page components that fetch data for games and websites
 const GamesPage: React.FC = () => {
-  const [games, setGames] = useState<ProjectItem[]>([]);
+  const [games, setGames] = useState<ProjectSummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -393,7 +393,7 @@ const GamesPage: React.FC = () => {
 };
 
 const WebsitesPage: React.FC = () => {
-  const [websites, setWebsites] = useState<ProjectItem[]>([]);
+  const [websites, setWebsites] = useState<ProjectSummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
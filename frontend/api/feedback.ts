@@ -4,7 +4,7 @@
  */
 
 import { apiClient } from './client';
-import { API_ENDPOINTS } from './config';
+import { API_CONFIG, API_ENDPOINTS } from './config';
 
 export interface FeedbackCreate {
   name: string;
@@ -28,7 +28,8 @@ export interface FeedbackResponse {
 
 export interface CaptchaResponse {
   captcha_id: string;
-  image_base64: string;
+  image_url: string;
+  image_base64?: string;
 }
 
 export const feedbackApi = {
@@ -44,4 +45,10 @@ export const feedbackApi = {
   getCaptcha: async (): Promise<CaptchaResponse> => {
     return apiClient.get<CaptchaResponse>(API_ENDPOINTS.FEEDBACK_CAPTCHA);
   },
+  /**
+   * Build the captcha image URL (falls back to legacy base64 data URL)
+   */
+  getCaptchaImageSrc: (captcha: CaptchaResponse): string => {
+    return captcha.image_base64 || `${API_CONFIG.BASE_URL}${captcha.image_url}`;
+  },
 };
@@ -12,6 +12,6 @@ export * from './banner';
 export * from './feedback';
 
 // Re-export types that are commonly used with API
-export type { ProjectItem, NewsItem, AboutUs, Category } from '../types';
+export type { ProjectItem, ProjectSummary, NewsItem, NewsSummary, AboutUs, Category } from '../types';
 export { Category as CategoryEnum } from '../types';
 
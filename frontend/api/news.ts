@@ -14,6 +14,8 @@ export const newsApi = {
   getNews: async (params?: {
     skip?: number;
     limit?: number;
+    cursor?: string;
+    fields?: string[]; // Only return these fields, e.g. ['id', 'title', 'image']
   }): Promise<NewsListResponse> => {
     const searchParams = new URLSearchParams();
     
@@ -23,6 +25,12 @@ export const newsApi = {
     if (params?.limit !== undefined) {
       searchParams.append('limit', params.limit.toString());
     }
+    if (params?.cursor) {
+      searchParams.append('cursor', params.cursor);
+    }
+    if (params?.fields?.length) {
+      searchParams.append('fields', params.fields.join(','));
+    }
     
     const query = searchParams.toString();
     const endpoint = query ? `${API_ENDPOINTS.NEWS}?${query}` : API_ENDPOINTS.NEWS;
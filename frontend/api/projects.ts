@@ -16,6 +16,8 @@ export const projectsApi = {
     category?: Category;
     skip?: number;
     limit?: number;
+    cursor?: string;
+    fields?: string[]; // Only return these fields, e.g. ['id', 'title', 'image']
   }): Promise<ProjectListResponse> => {
     const searchParams = new URLSearchParams();
     
@@ -28,6 +30,12 @@ export const projectsApi = {
     if (params?.limit !== undefined) {
       searchParams.append('limit', params.limit.toString());
     }
+    if (params?.cursor) {
+      searchParams.append('cursor', params.cursor);
+    }
+    if (params?.fields?.length) {
+      searchParams.append('fields', params.fields.join(','));
+    }
     
     const query = searchParams.toString();
     const endpoint = query ? `${API_ENDPOINTS.PROJECTS}?${query}` : API_ENDPOINTS.PROJECTS;
@@ -224,9 +224,9 @@ export const Feedback: React.FC = () => {
                 />
               </div>
               <div className="flex items-center gap-2">
-                {captcha?.image_base64 ? (
+                {captcha ? (
                   <img
-                    src={captcha.image_base64}
+                    src={feedbackApi.getCaptchaImageSrc(captcha)}
                     alt="captcha"
                     className="h-12 w-28 rounded border border-slate-300 object-contain bg-white"
                   />
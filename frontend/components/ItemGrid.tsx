@@ -1,11 +1,11 @@
 import React, { useState } from 'react';
 import { Link } from 'react-router-dom';
-import { ProjectItem } from '../types';
+import { ProjectSummary } from '../types';
 import { ArrowRight, Calendar, Tag, Eye } from 'lucide-react';
 import { getImageUrl } from '../api/config';
 
 interface ItemGridProps {
-  items: ProjectItem[];
+  items: ProjectSummary[];
   title: string;
   itemsPerPage?: number;
 }
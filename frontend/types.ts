@@ -30,6 +30,10 @@ export interface NewsItem {
   updated_at: string;
 }
 
+// List endpoints leave out the long markdown bodies; fetch the item for them
+export type ProjectSummary = Omit<ProjectItem, 'description'>;
+export type NewsSummary = Omit<NewsItem, 'content'>;
+
 export interface AboutUs {
   id: number;
   title: string | null;
@@ -45,12 +49,14 @@ export interface AboutUs {
 // API Response types
 export interface ProjectListResponse {
   total: number;
-  items: ProjectItem[];
+  items: ProjectSummary[];
+  next_cursor?: string | null;
 }
 
 export interface NewsListResponse {
   total: number;
-  items: NewsItem[];
+  items: NewsSummary[];
+  next_cursor?: string | null;
 }
 
 // Loading and Error states